@@ -0,0 +1,96 @@
+"""
+커넥션 풀 포화 부하 테스트 (db_pool.py)
+
+- 동시 요청 수(--concurrency)를 늘려가면서, 요청마다 연결을 꺼내서 쿼리 1번 + --hold-ms 동안 연결을 잡고 있다가 반납한다.
+  (--hold-ms : 느린 쿼리 / DB 왕복 시간 흉내)
+- 풀(pool_size + max_overflow)보다 동시 요청이 많아지면 처리량은 더 늘지 않고,
+  연결을 기다리는 시간(wait p50 / p99)이 늘어나다가 DB_POOL_TIMEOUT을 넘으면 오류(timeouts)가 된다.
+- 결과의 peak_out / peak_overflow : 실행 중 가장 많이 사용한 연결 수 / overflow 연결 수
+
+실행 (프로젝트 루트에서) : python -m benchmark.bench_db_pool --pool-size 5 --max-overflow 5 --hold-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from db_pool import PoolMetrics, pool_options, pool_stats
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))] if values else 0.0
+
+
+async def run(
+    engine: AsyncEngine,
+    metrics: PoolMetrics,
+    concurrency: int,
+    requests: int,
+    hold: float,
+) -> None:
+    metrics.reset()
+    waits = []
+    errors = 0
+    peak = {"checked_out": 0, "overflow": 0}
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    waits.append((time.perf_counter() - started) * 1000)
+                    stats = pool_stats(engine.pool, metrics)
+                    for key in peak:
+                        peak[key] = max(peak[key], stats[key])
+                    await conn.execute(text("SELECT 1"))
+                    await asyncio.sleep(hold)
+            except exc.TimeoutError:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    print(
+        f"concurrency={concurrency:<4} {(requests - errors) / elapsed:8.1f} req/s  "
+        f"wait p50={percentile(waits, 50):7.1f}ms p99={percentile(waits, 99):7.1f}ms  "
+        f"timeouts={metrics.timeouts:<4} peak_out={peak['checked_out']:<3} "
+        f"peak_overflow={peak['overflow']}"
+    )
+
+
+async def main(args) -> None:
+    os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(args.max_overflow)
+    os.environ["DB_POOL_TIMEOUT"] = str(args.pool_timeout)
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{directory}/bench.db"
+        metrics = PoolMetrics()
+        engine = create_async_engine(url, **pool_options(url, metrics))
+        print(
+            f"pool_size={args.pool_size} max_overflow={args.max_overflow} "
+            f"pool_timeout={args.pool_timeout}s hold={args.hold_ms}ms"
+        )
+        for concurrency in args.concurrency:
+            await run(engine, metrics, concurrency, args.requests, args.hold_ms / 1000)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=5)
+    parser.add_argument("--pool-timeout", type=float, default=1.0)
+    parser.add_argument("--hold-ms", type=float, default=20)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 5, 10, 20, 50, 200]
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,127 @@
+"""
+이미지 파일 제공 : 기존 StaticFiles 마운트 vs ImageFiles 마운트 (domain/image/image_files.py) 비교
+
+- full : 캐시 없이 전체 파일 GET 처리량 (req/s)
+- views : 같은 페이지(이미지 --images개)를 --views번 보는 브라우저 흉내
+          (Cache-Control max-age 안에서는 요청하지 않고, 아니면 ETag로 조건부 요청)
+- range : 큰 파일의 마지막 64KB만 Range로 요청했을 때 전송량 / 처리량
+
+앱을 같은 프로세스에서 실행하므로 (httpx ASGITransport) 네트워크 / sendfile 효과는 포함되지 않고,
+서버가 요청마다 하는 작업량과 요청 수 / 전송량 차이만 비교한다.
+
+실행 (프로젝트 루트에서) : python -m benchmark.bench_image_serving --images 50 --views 20
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+
+from domain.image.image_files import ImageFiles
+
+RANGE_SIZE = 64 * 1024
+
+
+def create_files(directory: str, images: int, image_size: int) -> list[str]:
+    filenames = []
+    for i in range(images):
+        filename = f"{i:064x}.jpg"
+        with open(os.path.join(directory, filename), "wb") as fp:
+            fp.write(os.urandom(image_size))
+        filenames.append(filename)
+    with open(os.path.join(directory, "large.jpg"), "wb") as fp:
+        fp.write(os.urandom(8 * 1024 * 1024))
+    return filenames
+
+
+def create_client(files_class, directory: str) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.mount("/image_file", files_class(directory=directory), name="image_files")
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+
+
+async def bench_full(client: httpx.AsyncClient, filenames: list[str], rounds: int):
+    start = time.perf_counter()
+    transferred = 0
+    for _ in range(rounds):
+        for filename in filenames:
+            response = await client.get(f"/image_file/{filename}")
+            transferred += len(response.content)
+    elapsed = time.perf_counter() - start
+    return rounds * len(filenames), transferred, elapsed
+
+
+# 브라우저 캐시 흉내 (max-age 안이면 요청 안 함, 아니면 If-None-Match)
+async def bench_views(client: httpx.AsyncClient, filenames: list[str], views: int):
+    browser_cache = {}  # filename -> (만료 시각, etag)
+    requests = 0
+    transferred = 0
+    start = time.perf_counter()
+    for _ in range(views):
+        for filename in filenames:
+            cached = browser_cache.get(filename)
+            if cached and cached[0] > time.monotonic():
+                continue
+            headers = {"If-None-Match": cached[1]} if cached else {}
+            response = await client.get(f"/image_file/{filename}", headers=headers)
+            requests += 1
+            transferred += len(response.content)
+            max_age = 0
+            for directive in response.headers.get("cache-control", "").split(","):
+                name, _, value = directive.strip().partition("=")
+                if name == "max-age":
+                    max_age = int(value)
+            etag = response.headers.get("etag") or (cached and cached[1])
+            browser_cache[filename] = (time.monotonic() + max_age, etag)
+    elapsed = time.perf_counter() - start
+    return requests, transferred, elapsed
+
+
+async def bench_range(client: httpx.AsyncClient, rounds: int):
+    start = time.perf_counter()
+    transferred = 0
+    for _ in range(rounds):
+        response = await client.get(
+            "/image_file/large.jpg", headers={"Range": f"bytes=-{RANGE_SIZE}"}
+        )
+        transferred += len(response.content)
+    elapsed = time.perf_counter() - start
+    return rounds, transferred, elapsed
+
+
+def report(name: str, label: str, requests: int, transferred: int, elapsed: float):
+    print(
+        f"{name:<10} {label:<12} requests={requests:<6} "
+        f"transferred={transferred / 1024 / 1024:8.1f}MB "
+        f"elapsed={elapsed * 1000:8.1f}ms  {requests / elapsed:8.1f} req/s"
+    )
+
+
+async def main(images: int, image_size: int, views: int, rounds: int):
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = create_files(directory, images, image_size)
+        for label, files_class in (
+            ("StaticFiles", StaticFiles),
+            ("ImageFiles", ImageFiles),
+        ):
+            async with create_client(files_class, directory) as client:
+                report("full", label, *await bench_full(client, filenames, rounds))
+                report("views", label, *await bench_views(client, filenames, views))
+                report("range", label, *await bench_range(client, rounds * 10))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=50)
+    parser.add_argument("--image-size", type=int, default=200 * 1024)
+    parser.add_argument("--views", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.images, args.image_size, args.views, args.rounds))
@@ -0,0 +1,141 @@
+"""
+로그인 폭주 중 다른 GET 요청의 응답 시간 (p50 / p99) 측정
+
+- inline : 이벤트 루프에서 bcrypt를 바로 실행 (변경 전 방식)
+- pool : 비밀번호 해싱 스레드 풀에서 실행 (domain/user/user_password.py)
+
+앱을 같은 프로세스 / 같은 이벤트 루프에서 실행하므로 (httpx ASGITransport),
+bcrypt가 이벤트 루프를 막으면 그동안의 GET 요청도 그대로 지연된다.
+
+실행 (프로젝트 루트에서) : python -m benchmark.bench_login_storm --logins 32
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from database import Base, get_async_db
+from domain.user import user_password
+from domain.user.user_password import PasswordHasher, pwd_context
+from main import app
+from models import BucketList, User
+
+
+async def setup_database(url: str) -> async_sessionmaker:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user = User(
+            username="bench_user",
+            email="bench_user@gmail.com",
+            password=pwd_context.hash("bench_password"),
+            created_at=datetime.now(),
+        )
+        db.add(user)
+        db.add(BucketList(title="bench", created_at=datetime.now(), user=user))
+        await db.commit()
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return session_factory
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def login_storm(client: httpx.AsyncClient, logins: int) -> list[int]:
+    async def login():
+        response = await client.post(
+            "/api/user/login",
+            data={"username": "bench_user", "password": "bench_password"},
+        )
+        return response.status_code
+
+    return await asyncio.gather(*(login() for _ in range(logins)))
+
+
+# GET 요청을 일정 간격으로 예약하고, 예약 시각부터 응답까지의 시간을 측정 (open-loop)
+# (이벤트 루프가 멈춰서 요청을 보내지 못한 시간도 지연 시간에 포함)
+async def measure_gets(
+    client: httpx.AsyncClient, stop: asyncio.Event, interval: float = 0.01
+) -> list[float]:
+    latencies = []
+
+    async def get(scheduled_at: float):
+        await client.get("/api/bucketlist/detail/1")
+        latencies.append((time.perf_counter() - scheduled_at) * 1000)
+
+    tasks = []
+    scheduled_at = time.perf_counter()
+    while not stop.is_set():
+        tasks.append(asyncio.create_task(get(scheduled_at)))
+        scheduled_at += interval
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+async def run(mode: str, logins: int, workers: int, queue_size: int) -> None:
+    hasher = PasswordHasher(max_workers=workers, max_queue=queue_size)
+    if mode == "inline":
+
+        async def run_inline(func, *args):
+            return func(*args)
+
+        hasher.run = run_inline
+    user_password.password_hasher = hasher
+    # user_router는 import 시점의 객체를 사용하므로 함께 교체
+    from domain.user import user_router
+
+    user_router.password_hasher = hasher
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.get("/api/bucketlist/detail/1")  # 워밍업
+        stop = asyncio.Event()
+        gets = asyncio.create_task(measure_gets(client, stop))
+        started = time.perf_counter()
+        statuses = await login_storm(client, logins)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        latencies = await gets
+
+    print(
+        f"{mode:>6} | logins {logins} in {elapsed:.2f}s "
+        f"(200: {statuses.count(200)}, 503: {statuses.count(503)}) | "
+        f"GET n={len(latencies)} p50={statistics.median(latencies):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms max={max(latencies):.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        await setup_database(f"sqlite+aiosqlite:///{directory}/bench.db")
+        for mode in ("inline", "pool"):
+            await run(mode, args.logins, args.workers, args.queue_size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
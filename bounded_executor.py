@@ -0,0 +1,54 @@
+"""
+동시에 처리 / 대기할 수 있는 작업 수를 제한한 실행기 (비밀번호 해싱 스레드 풀, 이미지 리사이즈 프로세스 풀)
+
+- CPU를 오래 사용하는 작업을 이벤트 루프 밖(스레드 / 프로세스 풀)에서 실행한다.
+- 실행 중 + 대기 중인 작업이 max_workers + max_queue개이면 바로 503 (Retry-After: 1)
+  (작업이 몰려도 해당 API만 느려지거나 거절되고 다른 API는 영향 없음)
+- 풀은 처음 사용할 때 create_executor()로 만든다.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+
+from fastapi import HTTPException
+from starlette import status
+
+
+class BoundedExecutor:
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = None  # 처음 사용할 때 생성
+        self.in_flight = 0  # 실행 중 + 대기 중인 작업 수
+        self.rejected = 0
+
+    def create_executor(self) -> Executor:
+        raise NotImplementedError
+
+    def get_executor(self) -> Executor:
+        if self.executor is None:
+            self.executor = self.create_executor()
+        return self.executor
+
+    async def run(self, func, *args):
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "queue_size": self.max_queue,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
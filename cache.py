@@ -0,0 +1,236 @@
+"""
+조회 API 응답 캐시 (Read-through)
+
+- 상세 조회는 엔티티 id, 목록 조회는 요청 파라미터를 키로 사용한다.
+  ex) "bucketlist:detail:1", "bucketlist:list:v3:keyword=제주&page=0&size=10"
+- 목록 키에는 버전(v3)이 들어가고, 쓰기 작업이 생기면 버전을 올려서 이전 목록 캐시를 한 번에 무효화한다.
+  (이전 버전의 키는 TTL / LRU로 자연스럽게 정리됨)
+- 상세 키는 무효화할 때 세대(generation)를 올린 뒤 삭제한다.
+  조회는 DB를 읽기 전에 세대를 확인해두고, 저장한 뒤 세대가 바뀌었으면 방금 저장한 값을 삭제한다.
+  (오래 걸린 조회가 그 사이 무효화된 이전 값을 캐시에 남기지 않음)
+- 저장하는 값은 JSON으로 변환 가능한 값(response_model로 변환한 dict)
+
+- CACHE_BACKEND
+  memory : 프로세스 내부 LRU + TTL 캐시 (기본값)
+  redis : Redis 호환 서버 (여러 워커가 캐시를 공유)
+  none : 캐시 사용 안 함
+"""
+
+import json
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from settings import (
+    get_cache_backend,
+    get_cache_max_size,
+    get_cache_ttl,
+    get_redis_url,
+)
+
+
+class BaseCache:
+    backend = "none"
+
+    def __init__(self, default_ttl: int):
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str):
+        return None
+
+    async def set(self, key: str, value, ttl: int | None = None) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    # ttl : 만료 후에는 0 (세대처럼 잠시만 필요한 값)
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        return 0
+
+    async def get_version(self, key: str) -> int:
+        return 0
+
+    async def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, value):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+
+# 프로세스 내부 LRU + TTL 캐시
+class MemoryCache(BaseCache):
+    backend = "memory"
+
+    def __init__(self, max_size: int, default_ttl: int):
+        super().__init__(default_ttl)
+        self.max_size = max_size
+        self._items = OrderedDict()  # key -> (만료 시각, 값)
+        # 목록 캐시 버전 / 상세 키 세대 -> (만료 시각, 값) (LRU로 지워지면 안 되므로 따로 저장)
+        self._versions = {}
+        self._incr_count = 0
+
+    async def get(self, key: str):
+        item = self._items.get(key)
+        if item is not None and item[0] < time.monotonic():
+            del self._items[key]
+            item = None
+        if item is not None:
+            self._items.move_to_end(key)
+        return self._count(item and item[1])
+
+    async def set(self, key: str, value, ttl: int | None = None) -> None:
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._items.pop(key, None)
+
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        version = await self.get_version(key) + 1
+        self._versions[key] = (ttl and time.monotonic() + ttl, version)
+        self._incr_count += 1
+        if self._incr_count % self.max_size == 0:  # 만료된 세대 정리
+            now = time.monotonic()
+            self._versions = {
+                k: item
+                for k, item in self._versions.items()
+                if item[0] is None or item[0] >= now
+            }
+        return version
+
+    async def get_version(self, key: str) -> int:
+        item = self._versions.get(key)
+        if item is None:
+            return 0
+        if item[0] is not None and item[0] < time.monotonic():
+            del self._versions[key]
+            return 0
+        return item[1]
+
+    async def clear(self) -> None:
+        await super().clear()
+        self._items.clear()
+        self._versions.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._items)}
+
+
+# Redis 호환 캐시 (redis.asyncio.Redis 와 같은 인터페이스의 client)
+class RedisCache(BaseCache):
+    backend = "redis"
+
+    def __init__(self, client, default_ttl: int, prefix: str = "hojin:"):
+        super().__init__(default_ttl)
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str):
+        value = await self.client.get(self.prefix + key)
+        return self._count(None if value is None else json.loads(value))
+
+    async def set(self, key: str, value, ttl: int | None = None) -> None:
+        await self.client.set(
+            self.prefix + key, json.dumps(value), ex=ttl or self.default_ttl
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def incr(self, key: str, ttl: int | None = None) -> int:
+        version = await self.client.incr(self.prefix + key)
+        if ttl:
+            await self.client.expire(self.prefix + key, ttl)
+        return version
+
+    async def get_version(self, key: str) -> int:
+        return int(await self.client.get(self.prefix + key) or 0)
+
+    async def clear(self) -> None:
+        await super().clear()
+        keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache(
+    backend: str, max_size: int, default_ttl: int, prefix: str = "hojin:"
+) -> BaseCache:
+    if backend == "redis":
+        import redis.asyncio as redis
+
+        return RedisCache(
+            redis.from_url(get_redis_url()), default_ttl=default_ttl, prefix=prefix
+        )
+    if backend == "memory":
+        return MemoryCache(max_size=max_size, default_ttl=default_ttl)
+    return BaseCache(default_ttl=default_ttl)
+
+
+response_cache = create_cache(
+    get_cache_backend(), max_size=get_cache_max_size(), default_ttl=get_cache_ttl()
+)
+
+
+GENERATION_TTL = 60 * 60  # 상세 키 세대 유지 시간 (이보다 오래 걸린 조회는 없다고 가정)
+
+
+# 캐시 키
+def detail_key(entity: str, entity_id: int) -> str:
+    return f"{entity}:detail:{entity_id}"
+
+
+def generation_key(key: str) -> str:
+    return f"{key}:generation"
+
+
+# 상세 키의 현재 세대 (DB를 읽기 전에 확인)
+async def detail_generation(key: str) -> int:
+    return await response_cache.get_version(generation_key(key))
+
+
+# 상세 조회 결과 저장 (그 사이 무효화되었으면 저장한 값 삭제)
+async def set_detail(key: str, value, generation: int) -> None:
+    await response_cache.set(key, value)
+    if await detail_generation(key) != generation:
+        await response_cache.delete(key)
+
+
+async def list_key(entity: str, **params) -> str:
+    version = await response_cache.get_version(f"{entity}:list:version")
+    return f"{entity}:list:v{version}:{urlencode(sorted(params.items()))}"
+
+
+# 캐시 무효화 (생성 / 수정 / 삭제 시 호출)
+async def invalidate_detail(entity: str, *entity_ids: int) -> None:
+    keys = [detail_key(entity, i) for i in entity_ids]
+    # 세대를 먼저 올린 뒤 삭제 (set_detail과 순서가 엇갈려도 이전 값이 남지 않음)
+    for key in keys:
+        await response_cache.incr(generation_key(key), ttl=GENERATION_TTL)
+    await response_cache.delete(*keys)
+
+
+async def invalidate_list(entity: str) -> None:
+    await response_cache.incr(f"{entity}:list:version")
@@ -1,7 +1,11 @@
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from settings import get_sqlalchemy_database_url_async
+from db_pool import PoolMetrics, pool_options
+from settings import (
+    get_sqlalchemy_database_url_async,
+    get_sqlalchemy_database_url_async_read,
+)
 
 # # 동기
 # SQLALCHEMY_DATABASE_URL = get_sqlalchemy_database_url()
@@ -13,18 +17,40 @@ from settings import get_sqlalchemy_database_url_async
 #     engine = create_engine(SQLALCHEMY_DATABASE_URL)
 # SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# 비동기
+# 비동기 (커넥션 풀 설정 / 통계는 db_pool.py)
 SQLALCHEMY_DATABASE_URL_ASYNC = get_sqlalchemy_database_url_async()
-async_engine = create_async_engine(SQLALCHEMY_DATABASE_URL_ASYNC, echo=False)
+pool_metrics = PoolMetrics()
+async_engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL_ASYNC,
+    echo=False,
+    **pool_options(SQLALCHEMY_DATABASE_URL_ASYNC, pool_metrics),
+)
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine, autocommit=False, class_=AsyncSession, expire_on_commit=False
 )
 
+# 읽기 전용 복제본 (SQLALCHEMY_DATABASE_URL_ASYNC_READ가 있을 때만, 조회 라우팅은 db_replica.py)
+SQLALCHEMY_DATABASE_URL_ASYNC_READ = get_sqlalchemy_database_url_async_read()
+read_pool_metrics = PoolMetrics()
+read_async_engine = None
+AsyncReadSessionLocal = None
+if SQLALCHEMY_DATABASE_URL_ASYNC_READ:
+    read_async_engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL_ASYNC_READ,
+        echo=False,
+        **pool_options(SQLALCHEMY_DATABASE_URL_ASYNC_READ, read_pool_metrics),
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        bind=read_async_engine,
+        autocommit=False,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+# MetaData 클래스를 사용하여 데이터베이스의 프라이머리 키, 유니크 키, 인덱스 키 등의 이름 규칙을 새롭게 정의했다.
+# 데이터베이스에서 디폴트 값으로 명명되던 프라이머리 키, 유니크 키 등의 제약조건 이름을 수동으로 설정한 것이다.
+# (문자열을 dict 안에 두면 바로 뒤의 "ix" 키와 이어 붙여지므로 주석으로 작성)
 naming_convention = {
-    """
-    MetaData 클래스를 사용하여 데이터베이스의 프라이머리 키, 유니크 키, 인덱스 키 등의 이름 규칙을 새롭게 정의했다.
-    데이터베이스에서 디폴트 값으로 명명되던 프라이머리 키, 유니크 키 등의 제약조건 이름을 수동으로 설정한 것이다.
-    """
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
     "ck": "ck_%(table_name)s_%(column_0_name)s",
@@ -0,0 +1,109 @@
+"""
+DB 커넥션 풀 설정 / 통계
+
+- DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE / DB_POOL_PRE_PING 으로 풀 크기와 동작을 설정한다.
+  (SQLite 파일 DB도 aiosqlite 기본값(NullPool, 요청마다 연결) 대신 같은 풀을 사용, 메모리 DB는 풀 설정 없음)
+- 연결을 꺼낼 때(checkout) 걸린 시간을 히스토그램으로 기록한다.
+  풀이 모두 사용 중이면 반납될 때까지 기다린 시간, 새 연결이 필요하면 연결 시간까지 포함
+  (DB_POOL_TIMEOUT을 넘으면 sqlalchemy.exc.TimeoutError, timeouts로 집계)
+- 통계는 GET /api/metrics/db_pool 에서 확인
+"""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from settings import (
+    get_db_max_overflow,
+    get_db_pool_pre_ping,
+    get_db_pool_recycle,
+    get_db_pool_size,
+    get_db_pool_timeout,
+)
+
+# 대기 시간 히스토그램 구간 (ms, 마지막 구간은 그 이상 전체)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        index = next(
+            (i for i, bound in enumerate(WAIT_BUCKETS_MS) if wait_ms <= bound),
+            len(WAIT_BUCKETS_MS),
+        )
+        self.buckets[index] += 1
+
+    def histogram(self) -> list[dict]:
+        bounds = (*WAIT_BUCKETS_MS, None)
+        return [
+            {"le_ms": bound, "count": count}
+            for bound, count in zip(bounds, self.buckets)
+        ]
+
+
+# checkout 시간을 기록하는 풀 (engine.dispose() 후 다시 만들어져도 같은 metrics 사용)
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    metrics: PoolMetrics
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.observe((time.perf_counter() - started) * 1000)
+
+
+def pool_options(url: str, metrics: PoolMetrics) -> dict:
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}  # 메모리 DB는 연결 1개 (StaticPool)
+    return {
+        "poolclass": type("TimedQueuePool", (TimedQueuePool,), {"metrics": metrics}),
+        "pool_size": get_db_pool_size(),
+        "max_overflow": get_db_max_overflow(),
+        "pool_timeout": get_db_pool_timeout(),
+        "pool_recycle": get_db_pool_recycle(),
+        "pool_pre_ping": get_db_pool_pre_ping(),
+    }
+
+
+# 풀 상태 + checkout 통계
+def pool_stats(pool: Pool, metrics: PoolMetrics) -> dict:
+    stats = {
+        "pool_class": type(pool).__name__,
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "wait_ms_avg": (
+            metrics.wait_ms_total / metrics.checkouts if metrics.checkouts else 0.0
+        ),
+        "wait_ms_max": metrics.wait_ms_max,
+        "wait_histogram": metrics.histogram(),
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats |= {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+    return stats
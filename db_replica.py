@@ -0,0 +1,87 @@
+"""
+조회 API의 읽기 전용 복제본(read replica) 라우팅
+
+- SQLALCHEMY_DATABASE_URL_ASYNC_READ가 있으면, 조회 전용 API(get_async_read_db 사용)는 복제본 세션을 사용한다.
+  (없으면 get_async_db와 같은 기본 DB 세션)
+- 쓰기 후 바로 조회했을 때 복제 지연으로 이전 값이 보이지 않도록 (read-your-writes),
+  요청 중에 commit이 있으면 응답에 read_primary 쿠키(READ_AFTER_WRITE_SECONDS 동안 유지)를 붙이고,
+  이 쿠키가 있는 요청의 조회는 기본 DB에서 한다.
+- get_async_read_db는 get_async_db에 의존하므로, get_async_db를 override 하면 (테스트) 복제본이 없을 때 그대로 사용된다.
+- 응답 캐시(cache.py)는 복제본에서 읽은 값으로도 채운다.
+  read_primary 쿠키가 있는 요청은 방금 쓴 값을 봐야 하므로 캐시를 읽지도 저장하지도 않는다. (use_response_cache)
+"""
+
+from contextvars import ContextVar
+
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import database
+from database import get_async_db
+from settings import get_read_after_write_seconds
+
+READ_PRIMARY_COOKIE = "read_primary"
+
+# 현재 요청에서 commit 했는지 (ReadAfterWriteMiddleware에서 요청마다 설정)
+request_writes: ContextVar[dict | None] = ContextVar("request_writes", default=None)
+
+
+def mark_request_wrote(session: Session):
+    state = request_writes.get()
+    if state is not None:
+        state["wrote"] = True
+
+
+event.listen(Session, "after_commit", mark_request_wrote)
+
+
+# 요청 중에 commit이 있었으면 read_primary 쿠키 추가
+class ReadAfterWriteMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or database.AsyncReadSessionLocal is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"wrote": False}
+        token = request_writes.set(state)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state["wrote"]:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{READ_PRIMARY_COOKIE}=1; Max-Age={get_read_after_write_seconds()}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            request_writes.reset(token)
+
+
+# 조회 전용 API의 세션 (복제본, 복제본이 없거나 최근에 쓰기를 한 요청이면 기본 DB)
+async def get_async_read_db(request: Request, db: AsyncSession = Depends(get_async_db)):
+    if database.AsyncReadSessionLocal is None or request.cookies.get(
+        READ_PRIMARY_COOKIE
+    ):
+        yield db
+        return
+    read_db = database.AsyncReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        await read_db.close()
+
+
+# 응답 캐시를 사용할 수 있는 요청인지 (read_primary 쿠키가 있으면 방금 쓴 값을 기본 DB에서 조회)
+def use_response_cache(request: Request) -> bool:
+    return not request.cookies.get(READ_PRIMARY_COOKIE)
@@ -0,0 +1,54 @@
+"""
+목록 조회의 전체 건수(total) 계산 방식
+
+- exact : 정확한 건수 (가능하면 목록 조회 쿼리에 count(*) OVER () 를 붙여서 한 번에 조회)
+- cached : 검색어(keyword) / 필터별로 건수를 응답 캐시(cache.py)에 저장해두고, 버킷리스트 / 리뷰가 변경되면 무효화
+- estimated : PostgreSQL 통계(실행계획의 예상 행 수)를 사용한 추정값 (그 외의 DB는 exact와 동일)
+- none : 건수를 계산하지 않음 (total = None)
+"""
+
+import json
+
+from sqlalchemy.orm import Session
+
+import cache
+from domain.bucketlist.bucketlist_schema import BucketListFilter
+
+
+# 검색어(keyword) / 필터별 전체 건수 캐시 (목록 캐시와 같은 버전을 사용하므로 버킷리스트 / 리뷰 변경 시 함께 무효화)
+async def total_count_key(keyword: str, filters: BucketListFilter) -> str:
+    return await cache.list_key(
+        "bucketlist",
+        kind="total",
+        keyword=keyword,
+        **filters.model_dump(mode="json", exclude_none=True),
+    )
+
+
+async def get_cached_total_count(keyword: str, filters: BucketListFilter) -> int | None:
+    return await cache.response_cache.get(await total_count_key(keyword, filters))
+
+
+async def set_cached_total_count(
+    keyword: str, filters: BucketListFilter, total: int
+) -> None:
+    await cache.response_cache.set(await total_count_key(keyword, filters), total)
+
+
+# PostgreSQL 실행계획으로 건수 추정
+async def estimate_total_count(db: Session, query) -> int | None:
+    """
+    - 실제로 쿼리를 실행하지 않고 EXPLAIN 결과의 "Plan Rows" 값을 사용
+    - PostgreSQL이 아니면 None (호출한 쪽에서 exact로 계산)
+    """
+    if db.bind.dialect.name != "postgresql":
+        return None
+    compiled = query.compile(
+        dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
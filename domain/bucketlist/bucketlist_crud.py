@@ -1,15 +1,85 @@
+import cache
+import pagination
 from datetime import datetime
 from fastapi import HTTPException
-from domain.bucketlist.bucketlist_schema import BucketListCreate, BucketListUpdate
+from domain.bucketlist.bucketlist_schema import (
+    BucketListCreate,
+    BucketListFilter,
+    BucketListSortEnum,
+    BucketListUpdate,
+    CountModeEnum,
+    SortOrderEnum,
+)
+from domain.bulk.bulk_schema import BulkItemResult, validation_detail
+from pydantic import ValidationError
 from starlette import status
-from sqlalchemy import and_, select, func
-from models import BucketList, User, Review
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import insert, select, func, tuple_, update
+from models import BucketList, Image, User, Review
+from sqlalchemy.orm import Session, aliased, selectinload
+from domain.bucketlist import bucketlist_count, bucketlist_search
+
+# 정렬 기준 컬럼
+SORT_COLUMNS = {
+    BucketListSortEnum.created_at: BucketList.created_at,
+    BucketListSortEnum.updated_at: BucketList.updated_at,
+    BucketListSortEnum.calender: BucketList.calender,
+    BucketListSortEnum.review_count: BucketList.review_count,
+}
+# cursor를 사용할 수 있는 정렬 기준 (NULL이 없는 컬럼)
+CURSOR_SORTS = (BucketListSortEnum.created_at, BucketListSortEnum.review_count)
+
+
+# 커서 페이지네이션 : (정렬 기준, 정렬 값, id) -> 불투명(opaque) 문자열
+def encode_cursor(bucketlist: BucketList, sort: BucketListSortEnum) -> str:
+    value = getattr(bucketlist, sort.value)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return pagination.encode_cursor(sort.value, value, bucketlist.id)
+
+
+def decode_cursor(cursor: str, sort: BucketListSortEnum) -> tuple:
+    def parse(sort_name, value, bucketlist_id) -> tuple:
+        if sort_name != sort.value:
+            raise ValueError
+        if sort == BucketListSortEnum.created_at:
+            value = datetime.fromisoformat(value)
+        else:
+            value = int(value)
+        return value, int(bucketlist_id)
+
+    return pagination.decode_cursor(cursor, parse)
+
+
+# 필터 조건
+def apply_filters(query, filters: BucketListFilter):
+    """
+    - 각 필터는 (필터 컬럼, created_at) 복합 인덱스로 범위 검색 (models.BucketList.__table_args__ 참고)
+    """
+    if filters.category is not None:
+        query = query.filter(BucketList.category == filters.category)
+    if filters.is_done is not None:
+        query = query.filter(BucketList.is_done == filters.is_done)
+    if filters.user_id is not None:
+        query = query.filter(BucketList.user_id == filters.user_id)
+    if filters.calender_from is not None:
+        query = query.filter(BucketList.calender >= filters.calender_from)
+    if filters.calender_to is not None:
+        query = query.filter(BucketList.calender <= filters.calender_to)
+    return query
 
 
 # 버킷리스트 전체 가져오기
 async def get_bucketlist_list(
-    db: Session, skip: int = 0, limit: int = 10, keyword: str = ""
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    keyword: str = "",
+    cursor: str | None = None,
+    count: CountModeEnum = CountModeEnum.exact,
+    expand_reviews: bool = False,
+    filters: BucketListFilter | None = None,
+    sort: BucketListSortEnum | None = None,
+    order: SortOrderEnum = SortOrderEnum.desc,
 ):
     """
     - skip은 조회한 데이터의 시작위치
@@ -18,61 +88,153 @@ async def get_bucketlist_list(
 
     - 검색어(keyword)에 값이 있으면 그 값을 OR 조건으로 검색
     - 비동기로 데이터를 조회하기 위해서는 db.query(Query) 대신 db.execute(select(Query))와 같은 방식을 사용해야함
+    - 전문 검색 인덱스를 사용할 수 있으면(bucketlist_search) 인덱스로 검색하고 관련도(rank) 순으로 정렬
+
+    - filters : 카테고리 / 완료 여부 / 예정일 범위 / 작성자 필터
+    - sort, order : 정렬 기준과 방향 (sort가 없으면 검색 시 관련도 순, 그 외에는 작성일 순)
+
+    - cursor가 있으면 offset 대신 (정렬 값, id) 기준으로 다음 페이지를 찾음 (keyset pagination)
+      (빈 문자열이면 첫 페이지, created_at / review_count 정렬에서만 사용 가능)
+    - next_cursor : 다음 페이지 요청에 사용할 cursor (다음 페이지가 없거나 관련도 순 정렬이면 None)
+
+    - count : 전체 건수 계산 방식 (bucketlist_count 참고)
+
+    - 기본은 카드 목록용 요약 조회 : 리뷰 대신 리뷰 수(review_count)만 포함하고, 작성자는 필요한 컬럼만 조회
+    - expand_reviews가 True이면 리뷰 / 리뷰 작성자까지 함께 조회
     """
-    query = select(BucketList)
-    if keyword:
+    filters = filters or BucketListFilter()
+    sort_by = sort or BucketListSortEnum.created_at
+    if cursor is not None and sort_by not in CURSOR_SORTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor는 created_at / review_count 정렬에서만 사용할 수 있습니다.",
+        )
+    sort_column = SORT_COLUMNS[sort_by]
+    if order == SortOrderEnum.asc:
+        order_by = [sort_column.asc(), BucketList.id.asc()]
+    else:
+        order_by = [sort_column.desc(), BucketList.id.desc()]
+
+    query = apply_filters(select(BucketList), filters)
+    ranked = False
+    dialect_name = db.bind.dialect.name
+    if keyword.strip() and bucketlist_search.is_enabled(dialect_name):
+        search_query = bucketlist_search.search_subquery(dialect_name, keyword)
+        query = query.join(search_query, search_query.c.bucketlist_id == BucketList.id)
+        if sort is None and cursor is None:
+            order_by.insert(0, search_query.c.rank)  # 관련도 순 정렬
+            ranked = True
+    elif keyword:
         search = f"%%{keyword}%%"
         """
-        Review / User 모델을 outerjoin한 서브쿼리
-        Review.bucketlist_id : 서브쿼리와 BucketList 모델을 연결할수 있는 질문 id
-        Review.content, User.username : 리뷰내용, 리뷰 작성자
+        리뷰 / 작성자 검색은 조인 대신 상관 서브쿼리(EXISTS)로 처리
+        - 조인을 하면 리뷰 수만큼 행이 늘어나서 DISTINCT로 다시 합쳐야 하지만,
+          EXISTS는 버킷리스트 1개당 1행만 남기 때문에 정렬 / 페이지네이션을 바로 적용할 수 있음
+        - review_user : 리뷰 작성자 (버킷리스트 작성자 User와 구분하기 위한 별칭)
         """
-        sub_query = (
-            select(Review.bucketlist_id, Review.title, Review.content, User.username)
-            .outerjoin(User, and_(Review.user_id == User.id))
-            .subquery()
+        review_user = aliased(User)
+        author_match = (
+            select(User.id)
+            .where(User.id == BucketList.user_id)
+            .where(User.username.ilike(search))  # 버킷리스트 작성자
+            .exists()
         )
-        """
-        서브쿼리 / BuckList 모델을 outerjoin
-        .c 는 서브쿼리의 조회 항목을 의미함.
-        ex) sub_query.c.bucketlist_id : 서브쿼리의 조회 항목 중 bucketlist_id 의미
-        """
-        query = (
-            query.outerjoin(User)
-            .outerjoin(sub_query, and_(sub_query.c.bucketlist_id == BucketList.id))
-            .filter(
-                BucketList.title.ilike(search)  # 버킷리스트 제목
-                | BucketList.content.ilike(search)  # 버킷리스트 내용
-                | User.username.ilike(search)  # 버킷리스트 작성자
-                | sub_query.c.title.ilike(search)  # 리뷰 제목
-                | sub_query.c.content.ilike(search)  # 리뷰 내용
-                | sub_query.c.username.ilike(search)  # 리뷰 작성자
+        review_match = (
+            select(Review.id)
+            .outerjoin(review_user, Review.user_id == review_user.id)
+            .where(Review.bucketlist_id == BucketList.id)
+            .where(
+                Review.title.ilike(search)  # 리뷰 제목
+                | Review.content.ilike(search)  # 리뷰 내용
+                | review_user.username.ilike(search)  # 리뷰 작성자
             )
+            .exists()
+        )
+        query = query.filter(
+            BucketList.title.ilike(search)  # 버킷리스트 제목
+            | BucketList.content.ilike(search)  # 버킷리스트 내용
+            | author_match
+            | review_match
+        )
+
+    count_query = select(func.count()).select_from(query.subquery())
+    total = None
+    window_count = count == CountModeEnum.exact and cursor is None
+    if count == CountModeEnum.cached:
+        total = await bucketlist_count.get_cached_total_count(keyword, filters)
+        if total is None:
+            total = (await db.execute(count_query)).scalar_one()
+            await bucketlist_count.set_cached_total_count(keyword, filters, total)
+    elif count == CountModeEnum.estimated:
+        total = await bucketlist_count.estimate_total_count(db, query)
+        if total is None:
+            total = (await db.execute(count_query)).scalar_one()
+    elif count == CountModeEnum.exact and not window_count:
+        total = (await db.execute(count_query)).scalar_one()
+    if window_count:
+        # 목록과 전체 건수를 한 번의 쿼리로 조회
+        query = query.add_columns(func.count().over().label("total"))
+
+    if cursor:
+        value, bucketlist_id = decode_cursor(cursor, sort_by)
+        keyset = tuple_(sort_column, BucketList.id)
+        if order == SortOrderEnum.asc:
+            query = query.filter(keyset > tuple_(value, bucketlist_id))
+        else:
+            query = query.filter(keyset < tuple_(value, bucketlist_id))
+    elif cursor is None:
+        query = query.offset(skip)
+    if expand_reviews:
+        query = query.options(
+            selectinload(BucketList.reviews).selectinload(Review.user),
+            selectinload(BucketList.user),
+        )
+    else:
+        query = query.options(
+            selectinload(BucketList.user).load_only(User.id, User.username, User.email)
         )
-    total = await db.execute(select(func.count()).select_from(query.subquery()))
     bucketlist_list = await db.execute(
-        query.order_by(BucketList.created_at.desc())
-        .offset(skip)
+        query.order_by(*order_by)
         .limit(limit)
-        .distinct()
-        .options(selectinload(BucketList.reviews).selectinload(Review.user))
-        .options(selectinload(BucketList.user))
+        .execution_options(populate_existing=True)  # 세션에 남아있는 review_count 갱신
     )
+    if window_count:
+        rows = bucketlist_list.all()
+        bucketlist_list = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif skip:  # 마지막 페이지를 넘어가면 건수를 따로 조회
+            total = (await db.execute(count_query)).scalar_one()
+        else:
+            total = 0
+    else:
+        bucketlist_list = bucketlist_list.scalars().fetchall()
+
+    next_cursor = None
+    if len(bucketlist_list) == limit and not ranked and sort_by in CURSOR_SORTS:
+        next_cursor = encode_cursor(bucketlist_list[-1], sort_by)
 
     return (
-        total.scalar_one(),
-        bucketlist_list.scalars().fetchall(),
-    )  # 전체 건수, 페이징 적용된 질문 목록
+        total,
+        bucketlist_list,
+        next_cursor,
+    )  # 전체 건수, 페이징 적용된 질문 목록, 다음 페이지 cursor
 
 
 # 특정 버킷리스트 가져오기
-async def get_bucketlist(db: Session, bucketlist_id: int):
-    bucketlist = await db.execute(
+async def get_bucketlist(db: Session, bucketlist_id: int, expand_images: bool = False):
+    query = (
         select(BucketList)
         .filter(BucketList.id == bucketlist_id)
         .options(selectinload(BucketList.reviews).selectinload(Review.user))
         .options(selectinload(BucketList.user))
     )
+    if expand_images:
+        # 이미지는 쿼리 1번으로 함께 조회 (목록용 요약만 사용하므로 변형 이미지는 불러오지 않음)
+        query = query.options(
+            selectinload(BucketList.images).lazyload(Image.variants)
+        ).execution_options(populate_existing=True)
+    bucketlist = await db.execute(query)
     return bucketlist.scalar_one_or_none()
 
 
@@ -101,6 +263,8 @@ async def create_bucketlist(
     )
     db.add(db_bucketlist)
     await db.commit()
+    await cache.invalidate_detail("bucketlist", db_bucketlist.id)  # id 재사용 대비
+    await cache.invalidate_list("bucketlist")
 
 
 # 버킷리스트 수정하기
@@ -114,9 +278,233 @@ async def update_bucketlist(
     db_bucketlist.calender = bucketlist_update.calender
     db.add(db_bucketlist)
     await db.commit()
+    await cache.invalidate_detail("bucketlist", db_bucketlist.id)
+    await cache.invalidate_list("bucketlist")
 
 
 # 버킷리스트 삭제하기
 async def delete_bucketlist(db: Session, db_bucketlist: BucketList):
+    """
+    - 함께 삭제(cascade)되는 리뷰 / 이미지의 캐시도 무효화
+      (db_bucketlist는 get_bucketlist로 reviews를 미리 불러온 상태)
+    """
+    review_ids = [review.id for review in db_bucketlist.reviews]
+    image_ids = await db.execute(
+        select(Image.id).filter(
+            (Image.bucketlist_id == db_bucketlist.id) | Image.review_id.in_(review_ids)
+        )
+    )
+    image_ids = image_ids.scalars().all()
     await db.delete(db_bucketlist)
     await db.commit()
+    await cache.invalidate_detail("bucketlist", db_bucketlist.id)
+    await cache.invalidate_detail("review", *review_ids)
+    await cache.invalidate_detail("image", *image_ids)
+    await cache.invalidate_list("bucketlist")
+
+
+# 버킷리스트 일괄 생성하기
+async def bulk_create_bucketlists(
+    db: Session, items: list[dict], user: User
+) -> list[BulkItemResult]:
+    """
+    - 항목마다 BucketListCreate로 검증하고, 제목 중복은 배치 전체를 쿼리 1번으로 확인
+    - 통과한 항목은 INSERT ... RETURNING(입력 순서대로 id 반환)으로 저장하고 한 번만 commit
+    - ORM 일괄 INSERT는 flush 이벤트가 없으므로 검색 문서는 직접 갱신
+    """
+    results = {}
+    bucketlist_creates = {}
+    for index, item in enumerate(items):
+        try:
+            bucketlist_creates[index] = BucketListCreate.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=validation_detail(e),
+            )
+
+    existing_titles = await db.execute(
+        select(BucketList.title).filter(
+            BucketList.title.in_({c.title for c in bucketlist_creates.values()})
+        )
+    )
+    existing_titles = set(existing_titles.scalars())
+
+    now = datetime.now()
+    rows = {}
+    for index, bucketlist_create in bucketlist_creates.items():
+        if bucketlist_create.title in existing_titles:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_406_NOT_ACCEPTABLE,
+                detail="입력한 제목이 이미 존재합니다.",
+            )
+            continue
+        existing_titles.add(bucketlist_create.title)  # 같은 배치 안의 중복
+        rows[index] = {
+            "title": bucketlist_create.title,
+            "content": bucketlist_create.content,
+            "created_at": now,
+            "category": bucketlist_create.category,
+            "calender": bucketlist_create.calender,
+            "user_id": user.id,
+        }
+
+    if rows:
+        # 여러 행 INSERT ... RETURNING의 반환 순서는 보장되지 않으므로 입력 순서대로 받음
+        # (PostgreSQL : 묶어서 INSERT, SQLite : 같은 트랜잭션 안에서 1행씩 INSERT)
+        bucketlist_ids = await db.scalars(
+            insert(BucketList).returning(BucketList.id, sort_by_parameter_order=True),
+            list(rows.values()),
+        )
+        bucketlist_ids = bucketlist_ids.all()
+        connection = await db.connection()
+        await connection.run_sync(bucketlist_search.refresh_documents, bucketlist_ids)
+        await db.commit()
+        for index, bucketlist_id in zip(rows, bucketlist_ids):
+            results[index] = BulkItemResult(
+                index=index, id=bucketlist_id, status=status.HTTP_201_CREATED
+            )
+        await cache.invalidate_detail("bucketlist", *bucketlist_ids)
+        await cache.invalidate_list("bucketlist")
+    return [results[index] for index in range(len(items))]
+
+
+# 버킷리스트 일괄 수정하기
+async def bulk_update_bucketlists(
+    db: Session, items: list[dict], user: User
+) -> list[BulkItemResult]:
+    """
+    - 대상 버킷리스트(작성자)와 제목 중복을 각각 쿼리 1번으로 확인
+    - 통과한 항목은 기본키 기준 일괄 UPDATE(executemany)로 저장하고 한 번만 commit
+    - 다른 버킷리스트가 사용 중인 제목으로는 (같은 배치에서 그 제목을 바꾸더라도) 수정할 수 없음
+    """
+    results = {}
+    bucketlist_updates = {}
+    for index, item in enumerate(items):
+        try:
+            bucketlist_updates[index] = BucketListUpdate.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=validation_detail(e),
+            )
+
+    owners = await db.execute(
+        select(BucketList.id, BucketList.user_id).filter(
+            BucketList.id.in_({u.bucketlist_id for u in bucketlist_updates.values()})
+        )
+    )
+    owners = dict(owners.all())
+    title_owners = await db.execute(
+        select(BucketList.title, BucketList.id).filter(
+            BucketList.title.in_({u.title for u in bucketlist_updates.values()})
+        )
+    )
+    title_owners = dict(title_owners.all())
+
+    now = datetime.now()
+    rows = {}
+    updated_ids = set()
+    for index, bucketlist_update in bucketlist_updates.items():
+        bucketlist_id = bucketlist_update.bucketlist_id
+        title_owner = title_owners.get(bucketlist_update.title, bucketlist_id)
+        if bucketlist_id not in owners:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "해당 게시글을 찾을 수 없습니다.",
+            )
+        elif owners[bucketlist_id] != user.id:
+            status_code, detail = status.HTTP_400_BAD_REQUEST, "수정 권한이 없습니다."
+        elif bucketlist_id in updated_ids:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "같은 게시글이 여러 번 입력되었습니다.",
+            )
+        elif title_owner != bucketlist_id:
+            status_code, detail = (
+                status.HTTP_406_NOT_ACCEPTABLE,
+                "입력한 제목이 이미 존재합니다.",
+            )
+        else:
+            updated_ids.add(bucketlist_id)
+            title_owners[bucketlist_update.title] = bucketlist_id  # 같은 배치 안의 중복
+            rows[index] = {
+                "id": bucketlist_id,
+                "title": bucketlist_update.title,
+                "content": bucketlist_update.content,
+                "category": bucketlist_update.category,
+                "updated_at": now,
+                "calender": bucketlist_update.calender,
+            }
+            results[index] = BulkItemResult(
+                index=index, id=bucketlist_id, status=status.HTTP_200_OK
+            )
+            continue
+        results[index] = BulkItemResult(
+            index=index, id=bucketlist_id, status=status_code, detail=detail
+        )
+
+    if rows:
+        bucketlist_ids = [row["id"] for row in rows.values()]
+        await db.execute(update(BucketList), list(rows.values()))
+        connection = await db.connection()
+        await connection.run_sync(bucketlist_search.refresh_documents, bucketlist_ids)
+        await db.commit()
+        await cache.invalidate_detail("bucketlist", *bucketlist_ids)
+        await cache.invalidate_list("bucketlist")
+    return [results[index] for index in range(len(items))]
+
+
+# 버킷리스트 일괄 삭제하기
+async def bulk_delete_bucketlists(
+    db: Session, bucketlist_ids: list[int], user: User
+) -> list[BulkItemResult]:
+    """
+    - 대상 버킷리스트와 함께 삭제(cascade)될 리뷰 / 이미지를 쿼리 1번씩(selectinload)으로 불러옴
+    - 삭제는 ORM으로 처리해서 cascade / 이미지 파일 삭제 / 검색 문서 이벤트를 그대로 사용하고,
+      같은 테이블의 DELETE는 flush에서 executemany로 묶여서 한 번만 commit
+    """
+    bucketlists = await db.execute(
+        select(BucketList)
+        .filter(BucketList.id.in_(bucketlist_ids))
+        .options(selectinload(BucketList.images))
+        .options(selectinload(BucketList.reviews).selectinload(Review.images))
+    )
+    bucketlists = {bucketlist.id: bucketlist for bucketlist in bucketlists.scalars()}
+
+    results = []
+    deleted = {}
+    for index, bucketlist_id in enumerate(bucketlist_ids):
+        bucketlist = bucketlists.get(bucketlist_id)
+        if bucketlist is None or bucketlist_id in deleted:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "해당 게시글을 찾을 수 없습니다.",
+            )
+        elif bucketlist.user_id != user.id:
+            status_code, detail = status.HTTP_400_BAD_REQUEST, "삭제 권한이 없습니다."
+        else:
+            deleted[bucketlist_id] = bucketlist
+            status_code, detail = status.HTTP_204_NO_CONTENT, None
+        results.append(
+            BulkItemResult(
+                index=index, id=bucketlist_id, status=status_code, detail=detail
+            )
+        )
+
+    if deleted:
+        reviews = [review for b in deleted.values() for review in b.reviews]
+        images = [image for b in deleted.values() for image in b.images] + [
+            image for review in reviews for image in review.images
+        ]
+        for bucketlist in deleted.values():
+            await db.delete(bucketlist)
+        await db.commit()
+        await cache.invalidate_detail("bucketlist", *deleted)
+        await cache.invalidate_detail("review", *(review.id for review in reviews))
+        await cache.invalidate_detail("image", *(image.id for image in images))
+        await cache.invalidate_list("bucketlist")
+    return results
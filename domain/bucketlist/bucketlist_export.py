@@ -0,0 +1,143 @@
+"""
+버킷리스트 + 리뷰 전체 내보내기 (NDJSON / CSV 스트리밍)
+
+- 서버 측 커서(stream_scalars + yield_per)로 EXPORT_BATCH_SIZE개씩 읽고,
+  배치마다 리뷰 / 작성자를 selectinload로 함께 불러와서 바로 응답으로 내보낸다.
+  (테이블 크기와 관계없이 메모리에는 한 배치만 올라감)
+- since : 이후에 생성 / 수정된 버킷리스트, 또는 이후에 리뷰가 생성 / 수정된 버킷리스트만 내보냄 (증분 추출용)
+  (삭제된 데이터는 포함되지 않음)
+"""
+
+import csv
+import datetime
+import io
+from typing import AsyncIterator
+
+from sqlalchemy import exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from domain.bucketlist.bucketlist_schema import BucketList as BucketListSchema
+from models import BucketList, Review
+
+EXPORT_BATCH_SIZE = 500
+
+CSV_COLUMNS = [
+    "bucketlist_id",
+    "title",
+    "content",
+    "category",
+    "is_done",
+    "calender",
+    "created_at",
+    "updated_at",
+    "user_id",
+    "username",
+    "review_id",
+    "review_title",
+    "review_content",
+    "review_completed_at",
+    "review_created_at",
+    "review_updated_at",
+    "review_user_id",
+    "review_username",
+]
+
+
+def export_query(since: datetime.datetime | None = None):
+    query = (
+        select(BucketList)
+        .options(selectinload(BucketList.user))
+        .options(selectinload(BucketList.reviews).selectinload(Review.user))
+        .order_by(BucketList.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if since is not None:
+        changed_review = exists().where(
+            Review.bucketlist_id == BucketList.id,
+            or_(Review.created_at >= since, Review.updated_at >= since),
+        )
+        query = query.filter(
+            or_(
+                BucketList.created_at >= since,
+                BucketList.updated_at >= since,
+                changed_review,
+            )
+        )
+    return query
+
+
+# 배치 단위로 버킷리스트 가져오기
+async def stream_bucketlist_batches(
+    db: AsyncSession, since: datetime.datetime | None = None
+) -> AsyncIterator[list[BucketList]]:
+    """
+    - identity map은 약한 참조이므로 내보낸 배치는 따로 정리하지 않아도 메모리에서 해제됨
+      (expunge_all을 호출하면 진행 중인 yield_per 결과를 더 읽을 수 없음)
+    """
+    result = await db.stream_scalars(export_query(since))
+    async for batch in result.partitions():
+        yield batch
+
+
+def to_ndjson(batch: list[BucketList]) -> str:
+    return "".join(
+        BucketListSchema.model_validate(
+            bucketlist, from_attributes=True
+        ).model_dump_json()
+        + "\n"
+        for bucketlist in batch
+    )
+
+
+# 리뷰 1개당 1행 (리뷰가 없는 버킷리스트는 리뷰 컬럼을 비운 1행)
+def to_csv(batch: list[BucketList], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for bucketlist in batch:
+        bucketlist_row = [
+            bucketlist.id,
+            bucketlist.title,
+            bucketlist.content,
+            bucketlist.category and bucketlist.category.value,
+            bucketlist.is_done,
+            bucketlist.calender,
+            bucketlist.created_at,
+            bucketlist.updated_at,
+            bucketlist.user_id,
+            bucketlist.user.username,
+        ]
+        for review in bucketlist.reviews or [None]:
+            review_row = (
+                [
+                    review.id,
+                    review.title,
+                    review.content,
+                    review.completed_at,
+                    review.created_at,
+                    review.updated_at,
+                    review.user_id,
+                    review.user.username,
+                ]
+                if review
+                else [None] * 8
+            )
+            writer.writerow(bucketlist_row + review_row)
+    return buffer.getvalue()
+
+
+# 응답 본문 (StreamingResponse용)
+async def export_bucketlists(
+    db: AsyncSession, export_format: str, since: datetime.datetime | None = None
+) -> AsyncIterator[str]:
+    header = True
+    async for batch in stream_bucketlist_batches(db, since):
+        if export_format == "csv":
+            yield to_csv(batch, header=header)
+            header = False
+        else:
+            yield to_ndjson(batch)
+    if export_format == "csv" and header:  # 내보낼 데이터가 없을 때도 헤더는 포함
+        yield to_csv([], header=True)
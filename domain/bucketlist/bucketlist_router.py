@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+import datetime
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+import cache
 from database import get_async_db
-from domain.bucketlist import bucketlist_schema, bucketlist_crud
+from db_replica import get_async_read_db, use_response_cache
+from domain.bucketlist import bucketlist_schema, bucketlist_crud, bucketlist_export
+from domain.bulk import bulk_schema
 from domain.user.user_router import get_current_user
 from models import User
 
@@ -20,19 +27,65 @@ router = APIRouter(
     tags=(["BucketList"]),
     summary=("모든 버킷리스트 가져오기 (페이지네이션 적용)"),
     description=(
-        "page : 몇 번째 페이지를 가져올 것인지 입력 \n\n size : 한 페이지당 몇 개의 글을 가져올 것인지 입력 \n\n keyword : 검색할 키워드 입력 (버킷리스트 제목/내용, 리뷰 제목/내용)"
+        "page : 몇 번째 페이지를 가져올 것인지 입력 \n\n size : 한 페이지당 몇 개의 글을 가져올 것인지 입력 \n\n keyword : 검색할 키워드 입력 (버킷리스트 제목/내용, 리뷰 제목/내용) \n\n cursor : 이전 응답의 next_cursor 값을 입력 (입력 시 page 대신 사용, 빈 값이면 첫 페이지) \n\n count : 전체 건수(total) 계산 방식 [exact : 정확한 값, cached : 캐시된 값, estimated : 추정값, none : 계산 안 함] \n\n expand : reviews 입력 시 리뷰 목록까지 포함 (기본값은 리뷰 수(review_count)만 포함) \n\n category / is_done / user_id : 카테고리 / 완료 여부 / 작성자 id 필터 \n\n calender_from, calender_to : 버킷리스트 예정일 범위 필터 ('0000-00-00' 형태로 입력) \n\n sort : 정렬 기준 [created_at, updated_at, calender, review_count] (cursor는 created_at, review_count만 가능) \n\n order : 정렬 방향 [asc, desc]"
     ),
 )
 async def bucketlist_list(
-    db: Session = Depends(get_async_db),
+    request: Request,
+    db: Session = Depends(get_async_read_db),
     page: int = 0,
     size: int = 10,
     keyword: str = "",
+    cursor: str | None = None,
+    count: bucketlist_schema.CountModeEnum = bucketlist_schema.CountModeEnum.exact,
+    expand: str = "",
+    filters: bucketlist_schema.BucketListFilter = Depends(),
+    sort: bucketlist_schema.BucketListSortEnum | None = None,
+    order: bucketlist_schema.SortOrderEnum = bucketlist_schema.SortOrderEnum.desc,
 ):  # Depends를 사용하여 with문 대체
-    total, _bucketlist_list = await bucketlist_crud.get_bucketlist_list(
-        db, skip=page * size, limit=size, keyword=keyword
+    expand_reviews = "reviews" in expand.split(",")
+    cache_key = await cache.list_key(
+        "bucketlist",
+        page=page,
+        size=size,
+        keyword=keyword,
+        cursor=cursor,
+        count=count.value,
+        expand_reviews=expand_reviews,
+        sort=sort and sort.value,
+        order=order.value,
+        **filters.model_dump(mode="json", exclude_none=True),
+    )
+    if use_response_cache(request):
+        cached = await cache.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    elif count == bucketlist_schema.CountModeEnum.cached:
+        count = bucketlist_schema.CountModeEnum.exact  # 캐시된 건수도 사용하지 않음
+
+    total, _bucketlist_list, next_cursor = await bucketlist_crud.get_bucketlist_list(
+        db,
+        skip=page * size,
+        limit=size,
+        keyword=keyword,
+        cursor=cursor,
+        count=count,
+        expand_reviews=expand_reviews,
+        filters=filters,
+        sort=sort,
+        order=order,
     )
-    return {"total": total, "bucketlist_list": _bucketlist_list}
+    response = bucketlist_schema.BucketListList.model_validate(
+        {
+            "total": total,
+            "bucketlist_list": _bucketlist_list,
+            "next_cursor": next_cursor,
+        },
+        from_attributes=True,
+    ).model_dump(mode="json")
+    if use_response_cache(request):
+        await cache.response_cache.set(cache_key, response)
+    return response
 
 
 # 특정 버킷리스트 가져오기
@@ -41,17 +94,71 @@ async def bucketlist_list(
     response_model=bucketlist_schema.BucketList,
     tags=(["BucketList"]),
     summary=("특정 버킷리스트 가져오기"),
-    description=("bucketlist_id : 가져오고싶은 BucketList의 id (PK) 값을 입력"),
+    description=(
+        "bucketlist_id : 가져오고싶은 BucketList의 id (PK) 값을 입력 \n\n expand : images 입력 시 이미지 목록(images)까지 포함 (업로드 순서, 이미지가 많으면 GET /api/image/bucketlist/{bucketlist_id} 사용)"
+    ),
 )
-async def bucketlist_detail(bucketlist_id: int, db: Session = Depends(get_async_db)):
+async def bucketlist_detail(
+    request: Request,
+    bucketlist_id: int,
+    expand: str = "",
+    db: Session = Depends(get_async_read_db),
+):
+    expand_images = "images" in expand.split(",")
+    # 이미지 추가 / 삭제는 버킷리스트 상세 캐시를 무효화하지 않으므로 expand=images는 캐시하지 않음
+    cache_key = cache.detail_key("bucketlist", bucketlist_id)
+    if not expand_images and use_response_cache(request):
+        cached = await cache.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    generation = await cache.detail_generation(cache_key)
 
-    bucketlist = await bucketlist_crud.get_bucketlist(db, bucketlist_id=bucketlist_id)
+    bucketlist = await bucketlist_crud.get_bucketlist(
+        db, bucketlist_id=bucketlist_id, expand_images=expand_images
+    )
     if not bucketlist:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 게시글을 찾을 수 없습니다.",
         )
-    return bucketlist
+    response = bucketlist_schema.BucketList.model_validate(
+        bucketlist, from_attributes=True
+    ).model_dump(mode="json")
+    if not expand_images and use_response_cache(request):
+        await cache.set_detail(cache_key, response, generation)
+    return response
+
+
+# 버킷리스트 + 리뷰 전체 내보내기
+@router.get(
+    "/export",
+    tags=(["BucketList"]),
+    summary=("버킷리스트 + 리뷰 전체 내보내기 (스트리밍)"),
+    description=(
+        "format : 내보내기 형식 [ndjson : 버킷리스트 1개당 1줄 (리뷰 포함), csv : 리뷰 1개당 1행] \n\n since : 입력한 시각 이후에 생성 / 수정된 버킷리스트 (또는 리뷰) 만 내보내기 ('0000-00-00T00:00:00' 형태로 입력)"
+    ),
+)
+async def bucketlist_export_all(
+    db: Session = Depends(get_async_read_db),
+    format: bucketlist_schema.ExportFormatEnum = bucketlist_schema.ExportFormatEnum.ndjson,
+    since: datetime.datetime | None = None,
+):
+    async def content():
+        # 응답을 보내는 동안 사용할 세션 (요청 세션은 응답 전에 닫힘)
+        async with AsyncSession(db.bind, expire_on_commit=False) as export_db:
+            async for chunk in bucketlist_export.export_bucketlists(
+                export_db, format.value, since
+            ):
+                yield chunk
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        content(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="bucketlist.{format.value}"'
+        },
+    )
 
 
 # 버킷리스트 생성
@@ -134,3 +241,66 @@ async def bucketlist_delete(
             status_code=status.HTTP_400_BAD_REQUEST, detail="삭제 권한이 없습니다."
         )
     await bucketlist_crud.delete_bucketlist(db=db, db_bucketlist=db_bucketlist)
+
+
+# 버킷리스트 일괄 생성
+@router.post(
+    "/bulk/create",
+    response_model=bulk_schema.BulkResult,
+    tags=(["BucketList"]),
+    summary=("버킷리스트 일괄 생성"),
+    description=(
+        f"버킷리스트 생성 항목(title, content, category, calender)의 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [201 : 생성, 406 : 제목 중복, 422 : 입력값 오류] \n\n 성공한 항목은 하나의 트랜잭션으로 저장"
+    ),
+)
+async def bucketlist_bulk_create(
+    items: list[dict] = Body(max_length=bulk_schema.BULK_MAX_SIZE),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await bucketlist_crud.bulk_create_bucketlists(
+        db=db, items=items, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
+
+
+# 버킷리스트 일괄 수정
+@router.put(
+    "/bulk/update",
+    response_model=bulk_schema.BulkResult,
+    tags=(["BucketList"]),
+    summary=("버킷리스트 일괄 수정"),
+    description=(
+        f"버킷리스트 수정 항목(bucketlist_id, title, content, category, calender)의 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [200 : 수정, 400 : 게시글 없음 / 권한 없음 / 중복 입력, 406 : 제목 중복, 422 : 입력값 오류]"
+    ),
+)
+async def bucketlist_bulk_update(
+    items: list[dict] = Body(max_length=bulk_schema.BULK_MAX_SIZE),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await bucketlist_crud.bulk_update_bucketlists(
+        db=db, items=items, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
+
+
+# 버킷리스트 일괄 삭제
+@router.post(
+    "/bulk/delete",
+    response_model=bulk_schema.BulkResult,
+    tags=(["BucketList"]),
+    summary=("버킷리스트 일괄 삭제"),
+    description=(
+        f"ids : 삭제하고싶은 BucketList의 id (PK) 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [204 : 삭제, 400 : 게시글 없음 / 권한 없음]"
+    ),
+)
+async def bucketlist_bulk_delete(
+    _bulk_delete: bulk_schema.BulkDelete,
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await bucketlist_crud.bulk_delete_bucketlists(
+        db=db, bucketlist_ids=_bulk_delete.ids, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
@@ -7,11 +7,15 @@ Pydantic은 API의 입출력 항목을 다음과 같이 정의하고 검증할
 """
 
 import datetime
+from enum import Enum
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, model_serializer, model_validator
+from sqlalchemy import inspect
 
+from domain.image.image_schema import ImageSummary
 from domain.review.review_schema import Review
 from domain.user.user_schema import User
+import models
 from models import BucketListCategoryEnum
 
 
@@ -27,12 +31,104 @@ class BucketList(BaseModel):
     calender: datetime.date | None = None
     user: User
     reviews: list[Review] = []
+    images: list[ImageSummary] | None = None  # expand=images 일 때만 포함
+
+    @model_validator(mode="before")
+    @classmethod
+    def exclude_unloaded_images(cls, data):
+        # 상세 조회에서 images를 불러오지 않았으면 지연 로딩(lazy load)하지 않고 제외
+        if isinstance(data, models.BucketList) and "images" in inspect(data).unloaded:
+            return {
+                field: getattr(data, field)
+                for field in cls.model_fields
+                if field != "images"
+            }
+        return data
+
+    @model_serializer(mode="wrap")
+    def exclude_unexpanded(self, handler):
+        data = handler(self)
+        if self.images is None:
+            data.pop("images", None)
+        return data
+
+
+# 전체 건수 계산 방식
+class CountModeEnum(str, Enum):
+    exact = "exact"
+    cached = "cached"
+    estimated = "estimated"
+    none = "none"
+
+
+# 버킷리스트 목록 모델 (카드 목록용 요약)
+class BucketListSummary(BaseModel):
+    id: int
+    title: str
+    content: str | None = None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None = None
+    category: BucketListCategoryEnum | None = None
+    is_done: bool
+    calender: datetime.date | None = None
+    user: User
+    review_count: int = 0
+    reviews: list[Review] | None = None  # expand=reviews 일 때만 포함
+
+    @model_validator(mode="before")
+    @classmethod
+    def exclude_unloaded_reviews(cls, data):
+        # 요약 조회에서는 reviews를 불러오지 않으므로 지연 로딩(lazy load)하지 않고 제외
+        if isinstance(data, models.BucketList) and "reviews" in inspect(data).unloaded:
+            return {
+                field: getattr(data, field)
+                for field in cls.model_fields
+                if field != "reviews"
+            }
+        return data
+
+    @model_serializer(mode="wrap")
+    def exclude_unexpanded(self, handler):
+        data = handler(self)
+        if self.reviews is None:
+            data.pop("reviews", None)
+        return data
+
+
+# 목록 필터
+class BucketListFilter(BaseModel):
+    category: BucketListCategoryEnum | None = None
+    is_done: bool | None = None
+    calender_from: datetime.date | None = None
+    calender_to: datetime.date | None = None
+    user_id: int | None = None
+
+
+# 목록 정렬 기준
+class BucketListSortEnum(str, Enum):
+    created_at = "created_at"
+    updated_at = "updated_at"
+    calender = "calender"
+    review_count = "review_count"
+
+
+# 정렬 방향
+class SortOrderEnum(str, Enum):
+    asc = "asc"
+    desc = "desc"
+
+
+# 내보내기 형식
+class ExportFormatEnum(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
 
 
 # 페이지 네이션 적용을 위한 class
 class BucketListList(BaseModel):
-    total: int = 0
-    bucketlist_list: list[BucketList] = []
+    total: int | None = 0
+    bucketlist_list: list[BucketListSummary] = []
+    next_cursor: str | None = None
 
 
 # 버킷리스트 생성
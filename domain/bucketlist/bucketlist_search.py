@@ -0,0 +1,256 @@
+"""
+버킷리스트 전문 검색(Full-Text Search) 인덱스
+
+- bucketlist_search : 버킷리스트 1개당 1행을 가지는 검색 전용 테이블 (Shadow Table)
+  (버킷리스트 제목/내용, 작성자, 리뷰 제목/내용/작성자를 모아둔 문서)
+- PostgreSQL : tsvector 컬럼 + GIN 인덱스
+- SQLite : FTS5 가상 테이블 (rowid = bucketlist.id)
+
+- 버킷리스트 / 리뷰가 생성, 수정, 삭제되면 flush 시점에 같은 트랜잭션 안에서 문서를 다시 만든다.
+  (유저의 username이 바뀌면 그 유저가 작성한 버킷리스트 / 리뷰가 포함된 문서도 다시 만듦)
+- 그 외의 DB(또는 SEARCH_BACKEND=like)는 기존 ilike 검색을 그대로 사용한다.
+"""
+
+from sqlalchemy import (
+    DDL,
+    bindparam,
+    column,
+    event,
+    func,
+    inspect,
+    select,
+    table,
+    text,
+    union,
+)
+from sqlalchemy.orm import Session
+
+from models import BucketList, Review, User
+from settings import get_search_backend
+
+SEARCH_TABLE = "bucketlist_search"
+SEARCH_DIALECTS = ("sqlite", "postgresql")
+
+
+# 검색 인덱스 테이블 생성 / 삭제 DDL (Base.metadata.create_all / drop_all 시 함께 실행)
+event.listen(
+    BucketList.__table__,
+    "after_create",
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+        "USING fts5(title, content, username, reviews, tokenize='unicode61')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    BucketList.__table__,
+    "after_create",
+    DDL(
+        f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+        "bucketlist_id INTEGER PRIMARY KEY REFERENCES bucketlist (id) ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    BucketList.__table__,
+    "after_create",
+    DDL(
+        f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document "
+        f"ON {SEARCH_TABLE} USING GIN (document)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    BucketList.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}").execute_if(
+        callable_=lambda ddl, target, bind, **kw: bind.dialect.name in SEARCH_DIALECTS
+    ),
+)
+
+
+def is_enabled(dialect_name: str) -> bool:
+    return get_search_backend() == "fts" and dialect_name in SEARCH_DIALECTS
+
+
+# 검색어 -> FTS 질의문 변환
+def build_match_query(dialect_name: str, keyword: str) -> str | None:
+    """
+    - 공백으로 나눈 단어들을 AND 조건으로 묶고, 각 단어는 접두어(prefix) 검색
+      ex) "제주 카페" -> SQLite : "제주"* "카페"* / PostgreSQL : '제주':* & '카페':*
+    - 사용자가 입력한 특수문자는 따옴표로 감싸서 질의 문법으로 해석되지 않도록 한다.
+    """
+    terms = keyword.split()
+    if not terms:
+        return None
+    if dialect_name == "postgresql":
+        return " & ".join(
+            "'{}':*".format(term.replace("\\", "\\\\").replace("'", "''"))
+            for term in terms
+        )
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+# 검색 결과 서브쿼리 (bucketlist_id, rank)
+def search_subquery(dialect_name: str, keyword: str):
+    """
+    - rank는 값이 작을수록 검색어와 관련도가 높다.
+    - SQLite : bm25() (제목 > 내용 > 작성자 > 리뷰 순으로 가중치)
+    - PostgreSQL : ts_rank()에 -1을 곱해서 정렬 방향을 SQLite와 맞춘다.
+    """
+    match_query = build_match_query(dialect_name, keyword)
+    if dialect_name == "postgresql":
+        search_table = table(SEARCH_TABLE, column("bucketlist_id"), column("document"))
+        tsquery = func.to_tsquery("simple", bindparam("search_query", match_query))
+        return (
+            select(
+                search_table.c.bucketlist_id.label("bucketlist_id"),
+                (-func.ts_rank(search_table.c.document, tsquery)).label("rank"),
+            )
+            .where(search_table.c.document.op("@@")(tsquery))
+            .subquery()
+        )
+
+    search_table = table(SEARCH_TABLE, column("rowid"))
+    return (
+        select(
+            search_table.c.rowid.label("bucketlist_id"),
+            func.bm25(text(SEARCH_TABLE), 10.0, 5.0, 3.0, 1.0).label("rank"),
+        )
+        .select_from(search_table)
+        .where(
+            text(f"{SEARCH_TABLE} MATCH :search_query").bindparams(
+                search_query=match_query
+            )
+        )
+        .subquery()
+    )
+
+
+# 검색 문서 다시 만들기
+def refresh_documents(connection, bucketlist_ids) -> None:
+    """
+    - 동기 Connection을 받는다. (flush 이벤트 / 일괄 처리에서 공통으로 사용)
+    - 버킷리스트와 리뷰 내용을 조회해서 검색 테이블의 행을 교체(upsert)한다.
+    """
+    dialect_name = connection.dialect.name
+    bucketlist_ids = sorted(set(bucketlist_ids))
+    if not bucketlist_ids or not is_enabled(dialect_name):
+        return
+
+    bucketlists = connection.execute(
+        select(BucketList.id, BucketList.title, BucketList.content, User.username)
+        .join(User, BucketList.user_id == User.id)
+        .where(BucketList.id.in_(bucketlist_ids))
+    ).all()
+    reviews = connection.execute(
+        select(Review.bucketlist_id, Review.title, Review.content, User.username)
+        .join(User, Review.user_id == User.id)
+        .where(Review.bucketlist_id.in_(bucketlist_ids))
+        .order_by(Review.id)
+    ).all()
+
+    review_texts = {}
+    for review in reviews:
+        review_texts.setdefault(review.bucketlist_id, []).append(
+            " ".join(filter(None, (review.title, review.content, review.username)))
+        )
+    documents = [
+        {
+            "bucketlist_id": bucketlist.id,
+            "title": bucketlist.title or "",
+            "content": bucketlist.content or "",
+            "username": bucketlist.username or "",
+            "reviews": " ".join(review_texts.get(bucketlist.id, [])),
+        }
+        for bucketlist in bucketlists
+    ]
+
+    remove_documents(connection, bucketlist_ids)
+    if not documents:
+        return
+    if dialect_name == "postgresql":
+        connection.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (bucketlist_id, document) VALUES ("
+                ":bucketlist_id, "
+                "setweight(to_tsvector('simple', :title), 'A') || "
+                "setweight(to_tsvector('simple', :content), 'B') || "
+                "setweight(to_tsvector('simple', :username), 'C') || "
+                "setweight(to_tsvector('simple', :reviews), 'D'))"
+            ),
+            documents,
+        )
+    else:
+        connection.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, title, content, username, reviews) "
+                "VALUES (:bucketlist_id, :title, :content, :username, :reviews)"
+            ),
+            documents,
+        )
+
+
+# 검색 문서 삭제
+def remove_documents(connection, bucketlist_ids) -> None:
+    dialect_name = connection.dialect.name
+    bucketlist_ids = list(bucketlist_ids)
+    if not bucketlist_ids or not is_enabled(dialect_name):
+        return
+    key = "bucketlist_id" if dialect_name == "postgresql" else "rowid"
+    connection.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE {key} IN :bucketlist_ids").bindparams(
+            bindparam("bucketlist_ids", expanding=True)
+        ),
+        {"bucketlist_ids": bucketlist_ids},
+    )
+
+
+# username이 바뀐 유저가 작성한 버킷리스트 / 리뷰가 포함된 버킷리스트 id
+def authored_bucketlist_ids(connection, user_ids) -> set[int]:
+    return set(
+        connection.scalars(
+            union(
+                select(BucketList.id).where(BucketList.user_id.in_(user_ids)),
+                select(Review.bucketlist_id).where(Review.user_id.in_(user_ids)),
+            )
+        )
+    )
+
+
+# flush 후 변경된 버킷리스트 / 리뷰 / 작성자를 모아서 검색 문서 동기화
+def sync_search_documents_on_flush(session: Session, flush_context):
+    refresh_ids, remove_ids, renamed_user_ids = set(), set(), set()
+    for target in session.new:
+        if isinstance(target, BucketList):
+            refresh_ids.add(target.id)
+        elif isinstance(target, Review):
+            refresh_ids.add(target.bucketlist_id)
+    for target in session.dirty:
+        if not session.is_modified(target, include_collections=False):
+            continue
+        if isinstance(target, BucketList):
+            refresh_ids.add(target.id)
+        elif isinstance(target, Review):
+            refresh_ids.add(target.bucketlist_id)
+        elif isinstance(target, User):
+            if inspect(target).attrs.username.history.has_changes():
+                renamed_user_ids.add(target.id)
+    for target in session.deleted:
+        if isinstance(target, BucketList):
+            remove_ids.add(target.id)
+        elif isinstance(target, Review):
+            refresh_ids.add(target.bucketlist_id)
+
+    refresh_ids.discard(None)
+    refresh_ids -= remove_ids
+    if not refresh_ids and not remove_ids and not renamed_user_ids:
+        return
+    connection = session.connection()
+    if renamed_user_ids and is_enabled(connection.dialect.name):
+        refresh_ids |= (
+            authored_bucketlist_ids(connection, renamed_user_ids) - remove_ids
+        )
+    remove_documents(connection, remove_ids)
+    refresh_documents(connection, refresh_ids)
+
+
+event.listen(Session, "after_flush", sync_search_documents_on_flush)
@@ -0,0 +1,47 @@
+"""
+일괄(bulk) 생성 / 수정 / 삭제 API의 공통 입출력 항목
+
+- 요청은 항목 배열로 받고, 항목마다 검증해서 실패한 항목만 결과에 오류로 표시한다.
+  (나머지 항목은 하나의 트랜잭션으로 처리)
+- 결과(results)는 요청 배열과 같은 순서 / 같은 개수
+"""
+
+from pydantic import BaseModel, Field, ValidationError
+
+# 요청 1번에 처리할 수 있는 최대 항목 수
+BULK_MAX_SIZE = 5000
+
+
+# 항목별 처리 결과 (status : 단건 API와 같은 HTTP 상태 코드)
+class BulkItemResult(BaseModel):
+    index: int
+    id: int | None = None
+    status: int
+    detail: str | None = None
+
+
+class BulkResult(BaseModel):
+    success_count: int
+    failure_count: int
+    results: list[BulkItemResult]
+
+
+# 일괄 삭제
+class BulkDelete(BaseModel):
+    ids: list[int] = Field(max_length=BULK_MAX_SIZE)
+
+
+# 항목별 검증 실패 메시지
+def validation_detail(error: ValidationError) -> str:
+    return ", ".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])} : {e['msg']}" for e in error.errors()
+    )
+
+
+def bulk_result(results: list[BulkItemResult]) -> BulkResult:
+    success_count = sum(result.status < 300 for result in results)
+    return BulkResult(
+        success_count=success_count,
+        failure_count=len(results) - success_count,
+        results=results,
+    )
@@ -1,6 +1,17 @@
 from sqlalchemy.orm import Session, selectinload
 from models import Image
 from sqlalchemy import select
+import cache
+import pagination
+
+IMAGE_LIST_COLUMNS = (
+    Image.id,
+    Image.data,
+    Image.file_size,
+    Image.width,
+    Image.height,
+    Image.mime_type,
+)
 
 
 # 특정 이미지 가져오기
@@ -9,18 +20,66 @@ async def get_image(db: Session, image_id: int):
     return review.scalar_one_or_none()
 
 
+# 커서 페이지네이션 : 마지막 이미지 id -> 불투명(opaque) 문자열
+def encode_cursor(image_id: int) -> str:
+    return pagination.encode_cursor(image_id)
+
+
+def decode_cursor(cursor: str) -> int:
+    return pagination.decode_cursor(cursor, int)
+
+
+# 버킷리스트 / 리뷰의 이미지 목록 가져오기 (keyset 페이지네이션)
+async def get_image_list(
+    db: Session, owner_column, owner_id: int, size: int, cursor: str | None = None
+):
+    """
+    - owner_column : Image.bucketlist_id / Image.review_id (외래키 인덱스로 대상 이미지 조회)
+    - id 순서로 cursor 다음 이미지부터 가져오고, 목록에 필요한 컬럼만 조회 (변형 이미지는 불러오지 않음)
+    - size + 1개를 가져와서 다음 페이지가 있을 때만 next_cursor 반환
+    """
+    query = select(*IMAGE_LIST_COLUMNS).filter(owner_column == owner_id)
+    if cursor:
+        query = query.filter(Image.id > decode_cursor(cursor))
+    result = await db.execute(query.order_by(Image.id).limit(size + 1))
+    images = result.all()
+
+    next_cursor = None
+    if len(images) > size:
+        images = images[:size]
+        next_cursor = encode_cursor(images[-1].id)
+    return images, next_cursor
+
+
 # 이미지 생성하기
-async def create_image(db: Session, data, bucketlist_id, review_id):
+async def create_image(db: Session, data, bucketlist_id, review_id, **file_info):
     db_image = Image(
         data=data,
         bucketlist_id=bucketlist_id,
         review_id=review_id,
+        **file_info,  # file_size / width / height / mime_type / content_hash
     )
     db.add(db_image)
     await db.commit()
+    await cache.invalidate_detail(
+        "image", db_image.id
+    )  # 삭제된 id가 재사용된 경우 대비
+    return db_image
+
+
+# 이미지 여러 개 생성하기 (한 번만 commit)
+async def create_images(db: Session, images: list[dict]) -> list[Image]:
+    db_images = [Image(**image) for image in images]
+    if not db_images:
+        return db_images
+    db.add_all(db_images)
+    await db.commit()
+    await cache.invalidate_detail("image", *(db_image.id for db_image in db_images))
+    return db_images
 
 
 # 이미지 삭제하기
 async def delete_image(db: Session, db_image: Image):
     await db.delete(db_image)
     await db.commit()
+    await cache.invalidate_detail("image", db_image.id)
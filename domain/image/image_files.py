@@ -0,0 +1,161 @@
+"""
+이미지 파일 제공 (StaticFiles 대신 UPLOAD_DIR에 마운트)
+
+- 파일명이 내용 해시(또는 uuid)라서 같은 URL의 내용은 바뀌지 않으므로,
+  Cache-Control: immutable + 1년 max-age로 브라우저 / CDN이 다시 확인(revalidate)하지 않고 캐시를 사용한다.
+- ETag는 파일명(확장자 제외)을 그대로 사용하는 strong ETag, If-None-Match가 일치하면 304
+- Range 요청(bytes=시작-끝, 1개 구간)은 206으로 해당 구간만 전송한다. (If-Range가 ETag와 다르면 전체 전송)
+- 업로드 중인 임시 파일(.{uuid}.part)도 UPLOAD_DIR에 쓰므로 (같은 파일시스템에서 rename), 숨김 파일(.으로 시작)은 404
+- 전체 전송은 Starlette FileResponse를 사용하므로, 서버가 http.response.pathsend 확장을 지원하면
+  파일 내용을 파이썬에서 읽지 않고 서버가 직접 전송한다. (zero-copy sendfile)
+"""
+
+import os
+import typing
+from mimetypes import guess_type
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+# 파일명이 내용 해시이므로 같은 URL의 내용은 바뀌지 않음
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def etag_for(path: str) -> str:
+    return f'"{os.path.splitext(os.path.basename(path))[0]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+# Range 헤더 해석 -> (시작, 끝) / 전체 전송이면 None / 범위를 벗어나면 ValueError
+def parse_range(range_header: str, size: int) -> tuple[int, int] | None:
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None  # 다른 단위 / 여러 구간은 전체 전송
+    if size == 0:
+        raise ValueError(range_header)
+    start, _, end = ranges.strip().partition("-")
+    try:
+        if start == "":  # bytes=-500 : 마지막 500 byte
+            length = int(end)
+            if length <= 0:
+                raise ValueError
+            return max(size - length, 0), size - 1
+        start = int(start)
+        end = int(end) if end else size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise ValueError(range_header)
+    return start, min(end, size - 1)
+
+
+# 파일의 일부 구간 전송 (206)
+class RangeFileResponse(Response):
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        size: int,
+        headers: typing.Mapping[str, str],
+        media_type: str | None = None,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.end = end
+        self.status_code = 206
+        self.media_type = media_type or guess_type(path)[0]
+        self.background = None
+        self.init_headers(
+            {
+                **headers,
+                "content-range": f"bytes {start}-{end}/{size}",
+                "content-length": str(end - start + 1),
+            }
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        remaining = self.end - self.start + 1
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0 and bool(chunk),
+                    }
+                )
+                if not chunk:
+                    break
+
+
+# 이미지 파일 응답 (ETag / 304 / Range)
+def image_file_response(
+    path: str,
+    stat_result: os.stat_result,
+    request_headers: Headers,
+    media_type: str | None = None,
+    cache_control: str = CACHE_CONTROL,
+) -> Response:
+    etag = etag_for(path)
+    headers = {"etag": etag, "cache-control": cache_control, "accept-ranges": "bytes"}
+    if etag_matches(request_headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request_headers.get("range")
+    if_range = request_headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        size = stat_result.st_size
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={**headers, "content-range": f"bytes */{size}"}
+            )
+        if byte_range is not None:
+            return RangeFileResponse(
+                path, *byte_range, size=size, headers=headers, media_type=media_type
+            )
+    return FileResponse(
+        path, headers=headers, media_type=media_type, stat_result=stat_result
+    )
+
+
+# UPLOAD_DIR 마운트용 StaticFiles (응답만 image_file_response로 변경)
+class ImageFiles(StaticFiles):
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if os.path.basename(path).startswith("."):  # 업로드 중인 임시 파일
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        return image_file_response(str(full_path), stat_result, Headers(scope=scope))
@@ -0,0 +1,45 @@
+"""
+업로드 이미지 메타데이터 (MIME 타입 / 가로 세로 크기)
+
+- 클라이언트가 보낸 파일명 / Content-Type 대신 파일 앞부분(magic bytes)으로 실제 형식을 판별한다.
+- 가로 세로 크기는 Pillow로 헤더만 읽어서 확인한다. (픽셀은 디코딩하지 않음)
+- 판별할 수 없는 파일은 application/octet-stream (.bin), 크기는 None
+"""
+
+from PIL import Image
+
+HEADER_SIZE = 32  # 형식 판별에 필요한 앞부분 크기 (byte)
+UNKNOWN_TYPE = ("application/octet-stream", ".bin")
+ORIENTATION_TAG = 0x0112
+
+
+# 파일 앞부분으로 형식 판별 -> (MIME 타입, 확장자)
+def sniff_image_type(header: bytes) -> tuple[str, str]:
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg", ".jpg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png", ".png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif", ".gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp", ".webp"
+    if header[4:8] == b"ftyp":  # ISO BMFF (major brand)
+        brand = header[8:12]
+        if brand in (b"avif", b"avis"):
+            return "image/avif", ".avif"
+        if brand in (b"heic", b"heix", b"mif1", b"msf1"):
+            return "image/heic", ".heic"
+    return UNKNOWN_TYPE
+
+
+# 화면에 보이는 가로 세로 크기 (헤더만 읽음, 읽을 수 없으면 None)
+def read_dimensions(path: str) -> tuple[int, int] | None:
+    try:
+        with Image.open(path) as image:
+            width, height = image.size
+            # EXIF 회전(90도 / 270도)이 있으면 변형 이미지처럼 가로 세로를 바꿈
+            if image.getexif().get(ORIENTATION_TAG) in (5, 6, 7, 8):
+                width, height = height, width
+            return width, height
+    except (OSError, Image.DecompressionBombError):
+        return None
@@ -0,0 +1,244 @@
+"""
+이미지 파일 삭제 (commit 후 비동기 처리)
+
+- Image / ImageVariant 행이 삭제되면 after_delete에서 URL(data)만 세션에 모아둔다. (flush 중에는 파일을 건드리지 않음)
+- flush가 끝나면 모아둔 URL 중 아직 참조하는 행이 남아있는지 한 번의 쿼리로 확인한다. (내용 해시 파일명이므로 여러 행이 같은 파일을 참조)
+- commit이 성공하면 참조가 없는 파일을 삭제 작업자(ImageFileReaper)에 넘기고, rollback 되면 버린다.
+  (rollback 되었는데 파일만 삭제되는 일이 없음)
+- 삭제 작업자는 전용 스레드의 이벤트 루프에서 실행되며, IMAGE_REAPER_BATCH_SIZE개씩 묶어서 삭제하고
+  실패한 파일은 간격을 늘려가며 IMAGE_REAPER_MAX_RETRIES번까지 다시 시도한다.
+  (끝까지 실패했거나 프로세스 종료로 처리하지 못한 파일은 저장소에 남음, image_reconcile로 정리)
+- flush 이후 삭제 전까지 같은 내용의 파일이 다시 업로드될 수 있으므로, 삭제 직전에
+  - 새 트랜잭션에서 참조하는 행을 다시 확인하고, 다시 참조된 파일은 삭제하지 않는다.
+  - IMAGE_REAPER_GRACE_SECONDS 안에 수정된 파일은 그 시간이 지난 뒤에 다시 확인한다.
+    (업로드가 같은 파일을 재사용할 때 수정 시각을 갱신하므로, 아직 commit 되지 않은 업로드의 파일을 지우지 않음)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Iterable
+
+from sqlalchemy import event, inspect, select, union
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from domain.image import image_storage
+from models import Image, ImageVariant
+from settings import (
+    get_image_reaper_batch_size,
+    get_image_reaper_grace_seconds,
+    get_image_reaper_max_retries,
+)
+
+RETRY_DELAY = 0.5  # 첫 재시도 대기 시간 (초, 재시도마다 2배)
+
+
+class ImageFileReaper:
+    def __init__(self, batch_size: int, max_retries: int, grace_seconds: float):
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.grace_seconds = grace_seconds
+        self.loop = None  # 처음 사용할 때 전용 스레드에서 생성
+        self.queue = None
+        self.engines = {}  # DB URL -> 참조 확인용 엔진 (전용 루프에서만 사용, NullPool)
+        self.lock = threading.Lock()
+        self.waiting = 0  # 재시도 / 유예 대기 중인 파일 수
+        self.deleted = 0
+        self.retried = 0
+        self.failed = 0
+        self.postponed = 0  # 최근에 수정되어 나중에 다시 확인한 횟수
+        self.skipped = 0  # 다시 참조되어 삭제하지 않은 파일 수
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            if self.loop is None:
+                loop = asyncio.new_event_loop()
+                self.queue = asyncio.Queue()
+                threading.Thread(
+                    target=loop.run_forever, name="image-reaper", daemon=True
+                ).start()
+                loop.call_soon_threadsafe(loop.create_task, self.work())
+                self.loop = loop
+        return self.loop
+
+    # 삭제할 파일 URL(data) 추가 (commit 후 호출, 어느 스레드에서든 호출 가능)
+    # db_url : 삭제 직전에 참조를 다시 확인할 DB
+    def enqueue(self, storage: image_storage.BaseStorage, datas, db_url: URL) -> None:
+        items = [(storage, db_url, data, 0) for data in datas]
+        self.start().call_soon_threadsafe(
+            self.put_all, items
+        )  # 한 번에 추가해서 같은 배치로 묶이도록
+
+    def put_all(self, items: list) -> None:
+        for item in items:
+            self.queue.put_nowait(item)
+
+    async def work(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self.delete_batch(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def delete_batch(self, batch: list) -> None:
+        by_target = {}
+        for storage, db_url, data, attempt in batch:
+            by_target.setdefault((storage, db_url), {})[data] = attempt
+        for (storage, db_url), attempts in by_target.items():
+            try:
+                keys = await self.deletable_keys(storage, db_url, attempts)
+                failed = await storage.delete_many(list(keys))
+            except Exception:
+                keys = {storage.key_from_url(data): data for data in attempts}
+                failed = list(keys)
+            self.deleted += len(keys) - len(failed)
+            for key in failed:
+                data = keys[key]
+                self.retry((storage, db_url, data, attempts[data] + 1))
+
+    # 삭제 직전 확인 -> 삭제할 {key: data}
+    # 다시 참조된 파일은 제외, grace_seconds 안에 수정된 파일은 남은 시간 뒤에 다시 확인
+    async def deletable_keys(
+        self, storage: image_storage.BaseStorage, db_url: URL, attempts: dict
+    ) -> dict[str, str]:
+        async with self.engine(db_url).connect() as conn:
+            referenced = set(
+                await conn.scalars(
+                    union(
+                        select(Image.data).filter(Image.data.in_(attempts)),
+                        select(ImageVariant.data).filter(
+                            ImageVariant.data.in_(attempts)
+                        ),
+                    )
+                )
+            )
+        self.skipped += len(referenced)
+        keys = {
+            storage.key_from_url(data): data
+            for data in attempts
+            if data not in referenced
+        }
+        modified = await asyncio.gather(*(storage.modified_at(key) for key in keys))
+        deletable = {}
+        now = time.time()
+        for (key, data), modified_at in zip(keys.items(), modified):
+            wait = (modified_at or 0) + self.grace_seconds - now
+            if wait > 0:
+                self.postponed += 1
+                self.schedule((storage, db_url, data, attempts[data]), wait)
+            else:
+                deletable[key] = data
+        return deletable
+
+    def engine(self, db_url: URL) -> AsyncEngine:
+        if db_url not in self.engines:
+            self.engines[db_url] = create_async_engine(db_url, poolclass=NullPool)
+        return self.engines[db_url]
+
+    def retry(self, item: tuple) -> None:
+        attempt = item[-1]
+        if attempt > self.max_retries:
+            self.failed += 1
+            return
+        self.retried += 1
+        self.schedule(item, RETRY_DELAY * 2 ** (attempt - 1))
+
+    def schedule(self, item: tuple, delay: float) -> None:
+        self.waiting += 1
+        self.loop.call_later(delay, self.requeue, item)
+
+    def requeue(self, item) -> None:
+        self.waiting -= 1
+        self.queue.put_nowait(item)
+
+    async def wait_idle(self) -> None:
+        while True:
+            await self.queue.join()
+            if not self.waiting:
+                return
+            await asyncio.sleep(RETRY_DELAY / 10)
+
+    # 대기 중인 삭제(재시도 포함)가 모두 끝날 때까지 기다리기 (테스트 / 종료 처리용)
+    def join(self, timeout: float | None = None) -> None:
+        if self.loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.wait_idle(), self.loop).result(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "batch_size": self.batch_size,
+            "queued": (self.queue.qsize() if self.queue else 0) + self.waiting,
+            "deleted": self.deleted,
+            "retried": self.retried,
+            "failed": self.failed,
+            "postponed": self.postponed,
+            "skipped": self.skipped,
+        }
+
+
+image_reaper = ImageFileReaper(
+    batch_size=get_image_reaper_batch_size(),
+    max_retries=get_image_reaper_max_retries(),
+    grace_seconds=get_image_reaper_grace_seconds(),
+)
+
+
+# DB 저장에 실패한 업로드의 새 파일 삭제
+# (그 사이 다른 요청이 같은 파일을 재사용했을 수 있으므로 바로 지우지 않고 삭제 작업자에서 다시 확인)
+def discard_stored_files(
+    db: AsyncSession, stored_files: Iterable[image_storage.StoredFile]
+) -> None:
+    storage = image_storage.storage
+    datas = {storage.url(stored.filename) for stored in stored_files if stored.created}
+    if datas:
+        image_reaper.enqueue(storage, datas, db.bind.url)
+
+
+# 이미지가 DB에서 삭제될 때 URL만 모아두기 (파일 삭제는 commit 후)
+def delete_image_file_on_delete(mapper, connection, target):
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault("deleted_image_data", set()).add(target.data)
+
+
+# flush 후 참조하는 행이 남지 않은 파일 확인 (IN 쿼리 1번)
+def collect_unreferenced_files(session: Session, flush_context):
+    datas = session.info.pop("deleted_image_data", None)
+    if not datas:
+        return
+    referenced = set(
+        session.connection().scalars(
+            union(
+                select(Image.data).filter(Image.data.in_(datas)),
+                select(ImageVariant.data).filter(ImageVariant.data.in_(datas)),
+            )
+        )
+    )
+    session.info.setdefault("unreferenced_image_files", set()).update(
+        datas - referenced
+    )
+
+
+def reap_files_after_commit(session: Session):
+    datas = session.info.pop("unreferenced_image_files", None)
+    if datas:
+        image_reaper.enqueue(image_storage.storage, datas, session.get_bind().url)
+
+
+def discard_files_after_rollback(session: Session):
+    session.info.pop("deleted_image_data", None)
+    session.info.pop("unreferenced_image_files", None)
+
+
+event.listen(Image, "after_delete", delete_image_file_on_delete)
+event.listen(ImageVariant, "after_delete", delete_image_file_on_delete)
+event.listen(Session, "after_flush", collect_unreferenced_files)
+event.listen(Session, "after_commit", reap_files_after_commit)
+event.listen(Session, "after_rollback", discard_files_after_rollback)
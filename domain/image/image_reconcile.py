@@ -0,0 +1,255 @@
+"""
+저장소 파일 <-> image / image_variant 테이블 정합성 확인 (고아 파일 / 파일 없는 행 정리)
+
+- 저장소 파일 목록(key 순서)과 테이블의 data(URL 순서)를 batch_size개씩 읽으면서 merge join 한다.
+  (어느 쪽도 전체를 메모리에 올리지 않음, URL은 storage.url(key) 이므로 key 순서 = URL 순서)
+  orphan_file : 저장소에는 있지만 참조하는 행이 없는 파일 (업로드 후 DB 저장 실패, 삭제 실패 등)
+  missing_file : 행은 있지만 저장소에 파일이 없는 URL
+- 찾은 결과는 임시 파일에 적어두고, --delete 인 경우 목록을 다 읽은 뒤에 batch_size개씩 삭제한다.
+  - 업로드 중인 파일(DB 저장 전)을 지우지 않도록 grace_seconds보다 최근에 수정된 파일은 제외
+  - 삭제 직전에 참조 / 파일 존재 여부를 다시 확인
+  - 파일이 없는 Image 행은 ORM으로 삭제 (변형 이미지 행 / 파일도 함께 정리), ImageVariant 행은 요청 시 다시 생성됨
+  - 저장소 URL 형식과 다른 data(BE_URL 변경 등)가 있으면 파일을 잘못 지울 수 있으므로 고아 파일은 삭제하지 않음
+- 저장소 파일 목록은 이 앱의 저장 위치(UPLOAD_DIR / S3_PREFIX 아래)만 읽는다.
+  S3_PREFIX 없이 버킷 전체를 읽는 경우에는 다른 데이터까지 고아 파일로 보이므로 --delete를 거부한다. (ValueError)
+- 저장소 디렉토리가 없거나 읽을 수 없으면 오류로 중단한다.
+  디렉토리가 비어있는 경우(마운트 되지 않음 등)도 있으므로 파일 없는 URL이 참조 URL의 max_missing_ratio를 넘으면
+  아무것도 삭제하지 않는다. (aborted, 정말 삭제하려면 --force)
+
+실행 (프로젝트 루트에서) : python -m domain.image.image_reconcile [--delete] [--force] [--max-missing-ratio 0.1] [--grace-seconds 3600] [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from typing import AsyncIterator, Callable
+
+from sqlalchemy import func, not_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import cache
+from domain.image import image_storage
+from models import Image, ImageVariant
+
+RECONCILE_BATCH_SIZE = 1000
+GRACE_SECONDS = 60 * 60
+MAX_MISSING_RATIO = 0.1  # 파일 없는 URL 비율이 이보다 크면 삭제하지 않음
+
+
+# 참조 중인 URL (image / image_variant 를 각각 data 순서로 읽어서 합침, 중복 제거)
+async def stream_referenced_urls(
+    db: AsyncSession, batch_size: int
+) -> AsyncIterator[str]:
+    # PostgreSQL은 locale 정렬이므로 파이썬 문자열 비교와 같은 byte 순서(C)로 정렬
+    collation = "C" if db.bind.dialect.name == "postgresql" else None
+    streams = []
+    for column in (Image.data, ImageVariant.data):
+        order = column.collate(collation) if collation else column
+        result = await db.stream_scalars(
+            select(column).order_by(order).execution_options(yield_per=batch_size)
+        )
+        streams.append(aiter(result))
+    heads = [await anext(stream, None) for stream in streams]
+    previous = None
+    while any(head is not None for head in heads):
+        i = min(
+            (i for i, head in enumerate(heads) if head is not None),
+            key=lambda i: heads[i],
+        )
+        if heads[i] != previous:
+            previous = heads[i]
+            yield previous
+        heads[i] = await anext(streams[i], None)
+
+
+# 저장소 파일 목록과 참조 URL 비교 -> ("orphan_file", key) / ("missing_file", url)
+async def find_orphans(
+    db: AsyncSession,
+    storage: image_storage.BaseStorage,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    grace_seconds: float = GRACE_SECONDS,
+) -> AsyncIterator[tuple[str, str]]:
+    files = aiter(storage.list_files(batch_size))
+    urls = aiter(stream_referenced_urls(db, batch_size))
+    stored, url = await anext(files, None), await anext(urls, None)
+    recent = time.time() - grace_seconds
+    while stored is not None or url is not None:
+        stored_url = storage.url(stored.key) if stored is not None else None
+        if url is None or (stored_url is not None and stored_url < url):
+            if stored.modified_at < recent:
+                yield "orphan_file", stored.key
+            stored = await anext(files, None)
+        elif stored_url is None or url < stored_url:
+            yield "missing_file", url
+            url = await anext(urls, None)
+        else:
+            stored, url = await anext(files, None), await anext(urls, None)
+
+
+# 저장소 URL 형식이 아닌 data 수 (BE_URL / 저장소 변경 전에 저장된 행)
+async def count_foreign_urls(
+    db: AsyncSession, storage: image_storage.BaseStorage
+) -> int:
+    prefix = storage.url("")
+    count = 0
+    for column in (Image.data, ImageVariant.data):
+        count += await db.scalar(
+            select(func.count()).filter(
+                not_(column.startswith(prefix, autoescape=True))
+            )
+        )
+    return count
+
+
+# 참조 중인 URL 수 (image / image_variant 중복 제거)
+async def count_referenced_urls(db: AsyncSession) -> int:
+    urls = union(select(Image.data), select(ImageVariant.data)).subquery()
+    return await db.scalar(select(func.count()).select_from(urls))
+
+
+async def delete_orphan_files(
+    db: AsyncSession, storage: image_storage.BaseStorage, keys: list[str]
+) -> int:
+    urls = {storage.url(key): key for key in keys}
+    referenced = set()
+    for column in (Image.data, ImageVariant.data):
+        referenced.update(await db.scalars(select(column).filter(column.in_(urls))))
+    targets = [key for url, key in urls.items() if url not in referenced]
+    failed = await storage.delete_many(targets)
+    return len(targets) - len(failed)
+
+
+async def delete_missing_rows(
+    db: AsyncSession, storage: image_storage.BaseStorage, urls: list[str]
+) -> int:
+    deleted = 0
+    for model in (ImageVariant, Image):
+        rows = (await db.scalars(select(model).filter(model.data.in_(urls)))).all()
+        for row in rows:
+            if not await storage.exists(storage.key_from_url(row.data)):
+                await db.delete(row)
+                deleted += 1
+        await db.commit()
+        await cache.invalidate_detail(
+            "image", *{row.id if model is Image else row.image_id for row in rows}
+        )
+    return deleted
+
+
+async def reconcile(
+    db: AsyncSession,
+    storage: image_storage.BaseStorage,
+    delete: bool = False,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    grace_seconds: float = GRACE_SECONDS,
+    max_missing_ratio: float = MAX_MISSING_RATIO,
+    force: bool = False,
+    report: Callable[[str, str], None] = lambda kind, value: None,
+) -> dict:
+    if delete and not storage.is_app_owned():
+        raise ValueError(
+            "이 앱 전용 저장 위치(S3_PREFIX)가 설정되지 않아서 고아 파일을 삭제할 수 없습니다."
+        )
+    summary = {
+        "orphan_file": 0,
+        "missing_file": 0,
+        "referenced_url": await count_referenced_urls(db),
+        "foreign_url": await count_foreign_urls(db, storage),
+        "deleted_files": 0,
+        "deleted_rows": 0,
+        "aborted": False,
+    }
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as found:
+        async for kind, value in find_orphans(db, storage, batch_size, grace_seconds):
+            summary[kind] += 1
+            report(kind, value)
+            found.write(f"{kind}\t{value}\n")
+        await db.rollback()  # 읽기 트랜잭션 종료 후 삭제
+        if not delete:
+            return summary
+        # 저장소 목록이 비어있는 경우 등 : 행을 한꺼번에 지우지 않도록 중단
+        missing_limit = summary["referenced_url"] * max_missing_ratio
+        if summary["missing_file"] > missing_limit and not force:
+            summary["aborted"] = True
+            return summary
+
+        found.seek(0)
+        batches = {"orphan_file": [], "missing_file": []}
+
+        async def flush(kind: str) -> None:
+            batch, batches[kind] = batches[kind], []
+            if not batch:
+                return
+            if kind == "missing_file":
+                summary["deleted_rows"] += await delete_missing_rows(db, storage, batch)
+            elif not summary["foreign_url"]:
+                summary["deleted_files"] += await delete_orphan_files(
+                    db, storage, batch
+                )
+
+        for line in found:
+            kind, _, value = line.rstrip("\n").partition("\t")
+            batches[kind].append(value)
+            if len(batches[kind]) >= batch_size:
+                await flush(kind)
+        await flush("orphan_file")
+        await flush("missing_file")
+    return summary
+
+
+async def main(
+    delete: bool,
+    batch_size: int,
+    grace_seconds: float,
+    max_missing_ratio: float,
+    force: bool,
+) -> None:
+    from database import AsyncSessionLocal
+    from domain.image.image_reaper import image_reaper
+
+    async with AsyncSessionLocal() as db:
+        try:
+            summary = await reconcile(
+                db,
+                image_storage.storage,
+                delete=delete,
+                batch_size=batch_size,
+                grace_seconds=grace_seconds,
+                max_missing_ratio=max_missing_ratio,
+                force=force,
+                report=lambda kind, value: print(f"{kind}\t{value}"),
+            )
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+    image_reaper.join()  # 삭제한 Image 행의 변형 이미지 파일 삭제 대기
+    print(" ".join(f"{key}={value}" for key, value in summary.items()))
+    if summary["aborted"]:
+        print(
+            "파일 없는 URL이 너무 많아서 아무것도 삭제하지 않았습니다. "
+            "저장소 설정(UPLOAD_DIR / S3_BUCKET)을 확인하고, 정말 삭제하려면 --force를 사용하세요."
+        )
+        sys.exit(1)
+    if summary["foreign_url"] and delete:
+        print("저장소 URL 형식이 아닌 data가 있어서 고아 파일은 삭제하지 않았습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delete", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE)
+    parser.add_argument("--grace-seconds", type=float, default=GRACE_SECONDS)
+    parser.add_argument("--max-missing-ratio", type=float, default=MAX_MISSING_RATIO)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.delete,
+            args.batch_size,
+            args.grace_seconds,
+            args.max_missing_ratio,
+            args.force,
+        )
+    )
@@ -0,0 +1,61 @@
+"""
+이미지 리사이즈 (프로세스 풀에서 실행)
+
+- 별도 프로세스에서 import 되므로 Pillow 외의 모듈(DB, FastAPI 등)은 import 하지 않는다.
+"""
+
+import io
+
+from PIL import Image, ImageOps
+
+EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+
+def variant_filename(stem: str, size: int, image_format: str) -> str:
+    return f"{stem}_{size}.{EXTENSIONS[image_format]}"
+
+
+# 원본 이미지(bytes)를 targets [(size, format), ...] 크기 / 포맷으로 변환
+def resize_image(
+    source: bytes, stem: str, targets: list[tuple[int, str]]
+) -> list[dict]:
+    """
+    - size : 긴 변의 최대 길이 (원본보다 크게 늘리지는 않음)
+    - 큰 크기부터 차례로 줄여서, 작은 크기는 원본 대신 바로 앞 결과에서 리사이즈
+    - 파일로 저장하지 않고 결과 bytes(content)를 반환 (저장은 저장소에서)
+    """
+    try:
+        with Image.open(io.BytesIO(source)) as original:
+            image = ImageOps.exif_transpose(original)
+            image.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        # 이미지가 아니거나 (UnidentifiedImageError) 손상된 파일
+        raise ValueError(str(e)) from None
+
+    results = []
+    for size in sorted({size for size, _ in targets}, reverse=True):
+        image = image.copy()
+        image.thumbnail((size, size), Image.LANCZOS)
+        for image_format in [f for s, f in targets if s == size]:
+            output = image
+            if image_format == "jpeg" and output.mode != "RGB":
+                output = output.convert("RGB")
+            elif output.mode not in ("RGB", "RGBA"):
+                output = output.convert("RGBA")
+            buffer = io.BytesIO()
+            output.save(buffer, **SAVE_OPTIONS[image_format])
+            results.append(
+                {
+                    "size": size,
+                    "format": image_format,
+                    "width": output.width,
+                    "height": output.height,
+                    "filename": variant_filename(stem, size, image_format),
+                    "content": buffer.getvalue(),
+                }
+            )
+    return results
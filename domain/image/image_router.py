@@ -1,15 +1,25 @@
-from fastapi import APIRouter, File, UploadFile, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    UploadFile,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+)
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import event
+import cache
 from database import get_async_db
-from domain.image import image_crud
+from db_replica import get_async_read_db, use_response_cache
+from domain.bulk import bulk_schema
+from domain.image import image_crud, image_reaper, image_storage, image_variant
 from models import BucketList, Image, Review, User
 from domain.user.user_router import get_current_user
 from starlette import status
 from domain.image import image_schema
-import os
-import uuid
-from settings import get_be_url, get_upload_dir
+from settings import get_image_upload_concurrency
 
 router = APIRouter(
     prefix="/api/image",
@@ -25,47 +35,192 @@ router = APIRouter(
     description=("image_id : 가져오고싶은 Image의 id (PK) 값을 입력"),
 )
 async def image_detail(
+    request: Request,
     image_id: int,
-    db: Session = Depends(get_async_db),
+    db: Session = Depends(get_async_read_db),
 ):
+    cache_key = cache.detail_key("image", image_id)
+    if use_response_cache(request):
+        cached = await cache.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    generation = await cache.detail_generation(cache_key)
     image = await image_crud.get_image(db, image_id=image_id)
     if not image:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 이미지를 찾을 수 없습니다.",
         )
-    return image
+    response = image_schema.Image.model_validate(
+        image, from_attributes=True
+    ).model_dump(mode="json")
+    if use_response_cache(request):
+        await cache.set_detail(cache_key, response, generation)
+    return response
 
 
-# 이미지 생성하기
+# 버킷리스트 이미지 목록 가져오기
+@router.get(
+    "/bucketlist/{bucketlist_id}",
+    response_model=image_schema.ImageList,
+    tags=(["Image"]),
+    summary=("버킷리스트 이미지 목록 가져오기 (페이지네이션 적용)"),
+    description=(
+        "bucketlist_id : 이미지를 가져올 BucketList의 id (PK) 값을 입력 \n\n size : 한 페이지당 가져올 이미지 수 (최대 100) \n\n cursor : 이전 응답의 next_cursor 값을 입력 (빈 값이면 첫 페이지) \n\n 업로드 순서대로 반환"
+    ),
+)
+async def bucketlist_image_list(
+    bucketlist_id: int,
+    size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: Session = Depends(get_async_read_db),
+):
+    images, next_cursor = await image_crud.get_image_list(
+        db, Image.bucketlist_id, bucketlist_id, size=size, cursor=cursor
+    )
+    # 이미지가 없을 때만 버킷리스트가 있는지 확인
+    if not images and not cursor and not await db.get(BucketList, bucketlist_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 버킷리스트를 찾을 수 없습니다.",
+        )
+    return {"image_list": images, "next_cursor": next_cursor}
+
+
+# 리뷰 이미지 목록 가져오기
+@router.get(
+    "/review/{review_id}",
+    response_model=image_schema.ImageList,
+    tags=(["Image"]),
+    summary=("리뷰 이미지 목록 가져오기 (페이지네이션 적용)"),
+    description=(
+        "review_id : 이미지를 가져올 Review의 id (PK) 값을 입력 \n\n size : 한 페이지당 가져올 이미지 수 (최대 100) \n\n cursor : 이전 응답의 next_cursor 값을 입력 (빈 값이면 첫 페이지) \n\n 업로드 순서대로 반환"
+    ),
+)
+async def review_image_list(
+    review_id: int,
+    size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: Session = Depends(get_async_read_db),
+):
+    images, next_cursor = await image_crud.get_image_list(
+        db, Image.review_id, review_id, size=size, cursor=cursor
+    )
+    # 이미지가 없을 때만 리뷰가 있는지 확인
+    if not images and not cursor and not await db.get(Review, review_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 리뷰를 찾을 수 없습니다.",
+        )
+    return {"image_list": images, "next_cursor": next_cursor}
+
+
+# 썸네일 / 반응형 변형 이미지 가져오기
+@router.get(
+    "/variant/{image_id}",
+    response_class=FileResponse,
+    tags=(["Image"]),
+    summary=("변형 이미지 가져오기"),
+    description=(
+        "image_id : 가져오고싶은 Image의 id (PK) 값을 입력 \n\n size : 긴 변의 최대 길이 (128 / 512 / 1024) \n\n format : webp / jpeg \n\n 변형 이미지는 업로드 직후 생성 (빠진 변형은 처음 요청될 때 생성, 처리할 수 있는 작업 수를 넘으면 503 + Retry-After) \n\n ETag / If-None-Match(304) / Range(206) 지원 \n\n (STORAGE_BACKEND=s3 인 경우 오브젝트 URL로 redirect)"
+    ),
+)
+async def image_variant_detail(
+    request: Request,
+    image_id: int,
+    size: int = 512,
+    image_format: image_schema.VariantFormatEnum = Query(
+        image_schema.VariantFormatEnum.webp, alias="format"
+    ),
+    db: Session = Depends(get_async_read_db),
+    primary_db: Session = Depends(get_async_db),
+):
+    if size not in image_variant.VARIANT_SIZES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 이미지 크기입니다.",
+        )
+    image = await image_crud.get_image(db, image_id=image_id)
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 이미지를 찾을 수 없습니다.",
+        )
+    storage = image_storage.storage
+    variant = image_variant.find_variant(image, size, image_format.value)
+    if variant is not None:
+        try:
+            return await storage.response(
+                storage.key_from_url(variant.data),
+                media_type=image_variant.MEDIA_TYPES[variant.format],
+                request_headers=request.headers,
+            )
+        except FileNotFoundError:
+            pass  # 파일이 지워진 경우 -> 다시 생성
+
+    # 빠진 변형은 요청된 크기 / 형식 1개만 생성 (기본 DB에 기록, 풀이 가득 차면 503)
+    db_image = await image_crud.get_image(primary_db, image_id=image_id)
+    if not db_image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 이미지를 찾을 수 없습니다.",
+        )
+    await image_variant.generate_variants(
+        primary_db, db_image, [(size, image_format.value)]
+    )
+    variant = image_variant.find_variant(db_image, size, image_format.value)
+    return await storage.response(
+        storage.key_from_url(variant.data),
+        media_type=image_variant.MEDIA_TYPES[variant.format],
+        request_headers=request.headers,
+    )
+
+
+# 변형 이미지 생성하기 (업로드 직후 생성이 빠졌거나 파일이 지워진 경우)
 @router.post(
-    "/create",
-    status_code=status.HTTP_201_CREATED,
-    response_model=image_schema.ImageCreate,
+    "/variant/{image_id}/generate",
+    response_model=image_schema.Image,
     tags=(["Image"]),
-    summary=("이미지 생성"),
+    summary=("변형 이미지 생성"),
     description=(
-        "※ bucketlist_id / review_id 둘 중 하나만 입력 ※ \n\n bucketlist_id : 이미지를 생성할 BucketList의 id (PK) 값을 입력 \n\n review_id : 이미지를 생성할 Review의 id (PK) 값을 입력 \n\n file : 원하는 이미지를 업로드"
+        "image_id : 변형 이미지를 생성할 Image의 id (PK) 값을 입력 \n\n 없는 변형 이미지(128 / 512 / 1024 x webp / jpeg)만 생성 \n\n 이미지 작성자만 가능 \n\n 처리할 수 있는 작업 수를 넘으면 503"
     ),
 )
-async def create_image(
-    bucketlist_id: int = None,
-    review_id: int = None,
-    file: UploadFile = File(...),
+async def image_variant_generate(
+    image_id: int,
     db: Session = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    BE_URL = get_be_url()
-    UPLOAD_DIR = get_upload_dir()
+    db_image = await image_crud.get_image(db, image_id=image_id)
+    if not db_image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 이미지를 찾을 수 없습니다.",
+        )
+    await check_image_owner(db, current_user, db_image, "생성 권한이 없습니다.")
+    await image_variant.generate_variants(db, db_image)
+    return db_image
+
 
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
+# 이미지 작성자(버킷리스트 / 리뷰 작성자) 확인
+async def check_image_owner(
+    db: Session, current_user: User, db_image: Image, detail: str
+):
+    if db_image.bucketlist_id is not None:
+        bucketlist = await db.get(BucketList, db_image.bucketlist_id)
+        if current_user.id != bucketlist.user_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    if db_image.review_id is not None:
+        review = await db.get(Review, db_image.review_id)
+        if current_user.id != review.user_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
 
-    content = await file.read()
-    filename = f"{str(uuid.uuid4())}.jpg"  # uuid로 유니크한 파일명으로 변경
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    file_url = f"{BE_URL}/{UPLOAD_DIR[2:]}\\{filename}"
 
+# 이미지를 추가할 버킷리스트 / 리뷰 확인 (둘 중 하나, 작성자만 가능)
+async def check_image_target(
+    db: Session, current_user: User, bucketlist_id: int | None, review_id: int | None
+):
     if bucketlist_id is not None:
         # bucketlist_id가 유효한지 확인
         bucketlist = await db.get(BucketList, bucketlist_id)
@@ -102,23 +257,129 @@ async def create_image(
             status_code=status.HTTP_406_NOT_ACCEPTABLE,
             detail="bucketlist_id와 review_id를 모두 입력할 수 없습니다.",
         )
-    else:
-        with open(file_path, "wb") as fp:
-            fp.write(content)  # 서버 로컬 스토리지에 이미지 저장 (쓰기)
 
-    await image_crud.create_image(
-        db=db,
-        data=file_url,
-        bucketlist_id=bucketlist_id,
-        review_id=review_id,
+
+# 이미지 생성하기
+@router.post(
+    "/create",
+    status_code=status.HTTP_201_CREATED,
+    response_model=image_schema.ImageCreate,
+    tags=(["Image"]),
+    summary=("이미지 생성"),
+    description=(
+        "※ bucketlist_id / review_id 둘 중 하나만 입력 ※ \n\n bucketlist_id : 이미지를 생성할 BucketList의 id (PK) 값을 입력 \n\n review_id : 이미지를 생성할 Review의 id (PK) 값을 입력 \n\n file : 원하는 이미지를 업로드 \n\n 파일 형식(MIME) / 크기 / 가로 세로 / 내용 해시는 파일 내용으로 확인해서 저장 (GET /api/image/detail 에서 확인)"
+    ),
+)
+async def create_image(
+    background_tasks: BackgroundTasks,
+    bucketlist_id: int = None,
+    review_id: int = None,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await check_image_target(db, current_user, bucketlist_id, review_id)
+
+    # 권한 확인이 끝난 뒤에 이미지 저장 (청크 단위로 쓰기, 내용 해시 파일명, 형식 / 크기 확인)
+    stored = await image_storage.save_upload_file(file)
+    try:
+        db_image = await image_crud.create_image(
+            db=db,
+            bucketlist_id=bucketlist_id,
+            review_id=review_id,
+            **image_storage.image_columns(stored),
+        )
+    except BaseException:
+        # DB 저장 실패 시 새로 저장한 파일도 삭제 (다시 참조되지 않았는지 확인한 뒤에)
+        image_reaper.discard_stored_files(db, [stored])
+        raise
+    # 응답 후 썸네일 / 반응형 변형 이미지 생성 (프로세스 풀)
+    background_tasks.add_task(
+        image_variant.generate_variants_in_background, db.bind, db_image.id
     )
     return {
-        "data": file_url,
+        "data": db_image.data,
         "bucketlist_id": bucketlist_id,
         "review_id": review_id,
     }
 
 
+# 이미지 일괄 생성하기 (여러 파일)
+@router.post(
+    "/bulk/create",
+    response_model=image_schema.ImageBulkResult,
+    tags=(["Image"]),
+    summary=("이미지 일괄 생성"),
+    description=(
+        f"※ bucketlist_id / review_id 둘 중 하나만 입력 ※ \n\n bucketlist_id : 이미지를 생성할 BucketList의 id (PK) 값을 입력 \n\n review_id : 이미지를 생성할 Review의 id (PK) 값을 입력 \n\n files : 업로드할 이미지들 (최대 {image_schema.BULK_MAX_FILES}개) \n\n 권한은 한 번만 확인하고, 파일은 IMAGE_UPLOAD_CONCURRENCY개씩 동시에 저장 \n\n 파일별 결과(results)는 입력 순서대로 반환 [201 : 생성, 413 : 파일 크기 초과] \n\n 성공한 파일은 하나의 트랜잭션으로 저장"
+    ),
+)
+async def image_bulk_create(
+    background_tasks: BackgroundTasks,
+    bucketlist_id: int = None,
+    review_id: int = None,
+    files: list[UploadFile] = File(...),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    if len(files) > image_schema.BULK_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"이미지는 한 번에 {image_schema.BULK_MAX_FILES}개까지 업로드할 수 있습니다.",
+        )
+    await check_image_target(db, current_user, bucketlist_id, review_id)
+
+    saved = await image_storage.save_upload_files(
+        files, concurrency=get_image_upload_concurrency()
+    )
+    stored_files = {
+        index: stored
+        for index, stored in enumerate(saved)
+        if isinstance(stored, image_storage.StoredFile)
+    }
+    try:
+        for error in saved:  # 저장소 오류 등 (파일별 결과로 반환하는 HTTPException 외)
+            if isinstance(error, BaseException) and not isinstance(
+                error, HTTPException
+            ):
+                raise error
+        db_images = await image_crud.create_images(
+            db=db,
+            images=[
+                image_storage.image_columns(stored)
+                | {"bucketlist_id": bucketlist_id, "review_id": review_id}
+                for stored in stored_files.values()
+            ],
+        )
+    except BaseException:
+        # 실패 시 새로 저장한 파일도 삭제 (같은 내용의 파일은 1번만, 다시 참조되지 않았는지 확인한 뒤에)
+        image_reaper.discard_stored_files(db, stored_files.values())
+        raise
+
+    results = {
+        index: image_schema.ImageBulkItemResult(
+            index=index,
+            filename=files[index].filename,
+            status=error.status_code,
+            detail=error.detail,
+        )
+        for index, error in enumerate(saved)
+        if index not in stored_files
+    }
+    for index, db_image in zip(stored_files, db_images):
+        results[index] = image_schema.ImageBulkItemResult(
+            index=index,
+            id=db_image.id,
+            filename=files[index].filename,
+            data=db_image.data,
+            status=status.HTTP_201_CREATED,
+        )
+        background_tasks.add_task(
+            image_variant.generate_variants_in_background, db.bind, db_image.id
+        )
+    return bulk_schema.bulk_result([results[index] for index in range(len(files))])
+
+
 # 이미지 삭제하기
 @router.delete(
     "/delete/{image_id}",
@@ -138,36 +399,6 @@ async def delete_image(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="해당 이미지를 찾을 수 없습니다.",
         )
-    if db_image.bucketlist_id is not None:
-        bucketlist = await db.get(BucketList, db_image.bucketlist_id)
-        if current_user.id != bucketlist.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="삭제 권한이 없습니다.",
-            )
-    if db_image.review_id is not None:
-        review = await db.get(Review, db_image.review_id)
-        if current_user.id != review.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="삭제 권한이 없습니다.",
-            )
+    await check_image_owner(db, current_user, db_image, "삭제 권한이 없습니다.")
 
     await image_crud.delete_image(db=db, db_image=db_image)
-
-
-# 이미지가 DB에서 삭제될 때, 해당 이미지 파일을 sqlalchemy의 event.listen으로 삭제하는 함수
-# 이벤트 리스너는 동기적인 방식으로 동작하므로, 하나의 트랜젝션이라고 생각하여 동기방식으로 구현
-def delete_image_file(target):
-    UPLOAD_DIR = get_upload_dir()
-    target_data = target.data.split("/")[3][11:]
-    file_path = os.path.join(UPLOAD_DIR, target_data)
-    if os.path.exists(file_path):
-        os.remove(file_path)
-
-
-def delete_image_file_on_delete(mapper, connection, target):
-    delete_image_file(target)
-
-
-event.listen(Image, "before_delete", delete_image_file_on_delete)
@@ -1,12 +1,56 @@
+from enum import Enum
+
 from pydantic import BaseModel
 
+from domain.bulk.bulk_schema import BulkItemResult, BulkResult
+
+# 일괄 업로드 1번에 올릴 수 있는 최대 파일 수
+BULK_MAX_FILES = 20
+
+
+# 변형 이미지 포맷
+class VariantFormatEnum(str, Enum):
+    webp = "webp"
+    jpeg = "jpeg"
+
+
+# 변형 이미지 (썸네일 / 반응형)
+class ImageVariant(BaseModel):
+    size: int
+    format: VariantFormatEnum
+    width: int
+    height: int
+    data: str
+
 
 # 이미지 가져오기
 class Image(BaseModel):
     id: int
     data: str
+    file_size: int | None = None
+    width: int | None = None
+    height: int | None = None
+    mime_type: str | None = None
+    content_hash: str | None = None
     bucketlist_id: int | None = None
     review_id: int | None = None
+    variants: list[ImageVariant] = []
+
+
+# 이미지 목록용 요약 (변형 이미지 제외)
+class ImageSummary(BaseModel):
+    id: int
+    data: str
+    file_size: int | None = None
+    width: int | None = None
+    height: int | None = None
+    mime_type: str | None = None
+
+
+# 버킷리스트 / 리뷰의 이미지 목록
+class ImageList(BaseModel):
+    image_list: list[ImageSummary]
+    next_cursor: str | None = None
 
 
 # 이미지 생성
@@ -14,3 +58,13 @@ class ImageCreate(BaseModel):
     data: str
     bucketlist_id: int | None = None
     review_id: int | None = None
+
+
+# 일괄 업로드 파일별 결과
+class ImageBulkItemResult(BulkItemResult):
+    filename: str | None = None  # 업로드한 파일명
+    data: str | None = None
+
+
+class ImageBulkResult(BulkResult):
+    results: list[ImageBulkItemResult]
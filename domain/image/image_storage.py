@@ -0,0 +1,481 @@
+"""
+업로드 이미지 저장소 (로컬 디스크 / S3 호환 오브젝트 스토리지)
+
+- UploadFile을 UPLOAD_CHUNK_SIZE 단위로 읽어서 aiofiles로 임시 파일에 쓴다. (파일 전체를 메모리에 올리지 않음)
+- 쓰는 도중 UPLOAD_MAX_SIZE를 넘으면 바로 중단하고 임시 파일을 삭제한다. (413)
+- 다 쓴 뒤에 임시 파일을 저장소로 옮기므로 (로컬 : 같은 디렉토리 안에서 rename, S3 : 업로드),
+  저장이 끝나지 않은 파일이 최종 경로에 보이지 않는다.
+- 파일명(key)은 내용의 sha256 해시 + 실제 형식의 확장자 (content-addressed, 형식은 magic bytes로 판별)
+  같은 파일이 이미 저장되어 있으면 옮기지 않고 수정 시각만 갱신한 뒤 임시 파일을 삭제하며, 여러 Image 행이 같은 파일을 참조한다.
+  (파일 삭제는 image_reaper에서 마지막 참조가 삭제되고 commit 된 뒤에만,
+   삭제 직전에 참조와 수정 시각을 다시 확인하므로 재사용 중인(아직 commit 되지 않은) 파일은 지우지 않음)
+
+- STORAGE_BACKEND
+  local : UPLOAD_DIR (main.py의 StaticFiles로 제공, 기본값)
+  s3 : S3 호환 오브젝트 스토리지 (S3_BUCKET / S3_ENDPOINT_URL / S3_PUBLIC_URL, 이미지는 S3 / CDN에서 바로 제공)
+       S3_PREFIX : 이 앱의 오브젝트 key 앞부분 (버킷의 다른 데이터와 구분, 목록 / 정리(image_reconcile)도 이 안에서만)
+       (값을 바꾸면 기존 오브젝트를 새 prefix 아래로 옮겨야 함)
+       boto3 client 사용 (requirements.txt, 인증 정보는 boto3 기본 방식 : AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY 등)
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import mimetypes
+import os
+import tempfile
+import uuid
+from typing import AsyncIterator, Iterator, NamedTuple
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import RedirectResponse
+from starlette import status
+from starlette.datastructures import Headers
+
+from domain.image.image_files import CACHE_CONTROL, image_file_response
+from domain.image.image_metadata import (
+    HEADER_SIZE,
+    UNKNOWN_TYPE,
+    read_dimensions,
+    sniff_image_type,
+)
+
+from settings import (
+    get_be_url,
+    get_s3_bucket,
+    get_s3_endpoint_url,
+    get_s3_prefix,
+    get_s3_public_url,
+    get_s3_region,
+    get_storage_backend,
+    get_upload_chunk_size,
+    get_upload_dir,
+    get_upload_max_size,
+)
+
+
+class StoredFile(NamedTuple):
+    filename: str
+    size: int
+    created: bool  # 새로 저장했는지 (False : 같은 내용의 파일이 이미 있음)
+    content_hash: str  # sha256 (hex)
+    mime_type: str  # magic bytes로 판별한 형식
+    width: int | None
+    height: int | None
+
+
+class StoredObject(NamedTuple):
+    key: str
+    modified_at: float  # 마지막 수정 시각 (timestamp)
+
+
+def content_type(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+class BaseStorage:
+    backend = "none"
+
+    # 저장한 파일의 URL (Image.data)
+    def url(self, key: str) -> str:
+        raise NotImplementedError
+
+    # URL(Image.data)에서 key 찾기
+    def key_from_url(self, data: str) -> str:
+        raise NotImplementedError
+
+    # 업로드 중인 임시 파일을 만들 디렉토리
+    def temp_dir(self) -> str:
+        return tempfile.gettempdir()
+
+    # 목록(list_files)의 파일이 모두 이 앱의 파일인지 (image_reconcile에서 고아 파일을 삭제해도 되는지)
+    def is_app_owned(self) -> bool:
+        return False
+
+    async def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    # 마지막 수정 시각 (timestamp, 파일이 없으면 None)
+    async def modified_at(self, key: str) -> float | None:
+        raise NotImplementedError
+
+    async def read(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    async def write(self, key: str, content: bytes) -> None:
+        raise NotImplementedError
+
+    # 임시 파일을 key로 옮기기 (이미 있으면 수정 시각만 갱신하고 False)
+    async def store_file(self, temp_path: str, key: str) -> bool:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    # 여러 파일 삭제 (삭제하지 못한 key 목록 반환)
+    async def delete_many(self, keys: list[str]) -> list[str]:
+        results = await asyncio.gather(
+            *(self.delete(key) for key in keys), return_exceptions=True
+        )
+        return [key for key, result in zip(keys, results) if result is not None]
+
+    # 파일 응답 (로컬 : 파일 전송, S3 : 오브젝트 URL로 redirect)
+    async def response(self, key: str, media_type: str, request_headers: Headers):
+        raise NotImplementedError
+
+    # 저장된 파일 목록 (key 순서로 정렬, batch_size개씩 읽음)
+    def list_files(self, batch_size: int) -> AsyncIterator[StoredObject]:
+        raise NotImplementedError
+
+
+# 로컬 디스크 (UPLOAD_DIR, 요청마다 설정값을 읽음)
+class LocalStorage(BaseStorage):
+    backend = "local"
+
+    def path(self, key: str) -> str:
+        return os.path.join(get_upload_dir(), key)
+
+    # 예 : http://127.0.0.1:8000/image_file\uuid.jpg
+    def url(self, key: str) -> str:
+        return f"{get_be_url()}/{get_upload_dir()[2:]}\\{key}"
+
+    def key_from_url(self, data: str) -> str:
+        return data.rsplit("\\", 1)[-1]
+
+    def temp_dir(self) -> str:
+        return get_upload_dir()  # rename 하려면 같은 파일시스템이어야 함
+
+    def is_app_owned(self) -> bool:
+        return True  # UPLOAD_DIR은 이 앱 전용
+
+    async def exists(self, key: str) -> bool:
+        return await aiofiles.os.path.exists(self.path(key))
+
+    async def modified_at(self, key: str) -> float | None:
+        try:
+            return (await aiofiles.os.stat(self.path(key))).st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def read(self, key: str) -> bytes:
+        async with aiofiles.open(self.path(key), "rb") as fp:
+            return await fp.read()
+
+    async def write(self, key: str, content: bytes) -> None:
+        await aiofiles.os.makedirs(get_upload_dir(), exist_ok=True)
+        temp_path = self.path(f".{uuid.uuid4()}.part")
+        async with aiofiles.open(temp_path, "wb") as fp:
+            await fp.write(content)
+        await aiofiles.os.replace(temp_path, self.path(key))
+
+    async def store_file(self, temp_path: str, key: str) -> bool:
+        try:
+            await asyncio.to_thread(os.utime, self.path(key))
+            return False
+        except FileNotFoundError:  # 없거나 그 사이에 삭제됨
+            await aiofiles.os.replace(temp_path, self.path(key))
+            return True
+
+    async def delete(self, key: str) -> None:
+        if await self.exists(key):
+            await aiofiles.os.remove(self.path(key))
+
+    # API 경로(image_id)는 삭제 후 재사용될 수 있으므로 immutable 대신 매번 ETag로 확인 (no-cache)
+    async def response(self, key: str, media_type: str, request_headers: Headers):
+        stat_result = await aiofiles.os.stat(self.path(key))
+        return image_file_response(
+            self.path(key),
+            stat_result,
+            request_headers,
+            media_type=media_type,
+            cache_control="no-cache",
+        )
+
+    async def list_files(self, batch_size: int) -> AsyncIterator[StoredObject]:
+        files = iter_sorted_files(get_upload_dir(), batch_size)
+        try:
+            while batch := await asyncio.to_thread(
+                list, itertools.islice(files, batch_size)
+            ):
+                for stored_object in batch:
+                    yield stored_object
+        finally:
+            files.close()
+
+
+# S3 호환 오브젝트 스토리지 (boto3 S3 client와 같은 인터페이스의 client)
+# boto3는 동기 방식이므로 스레드에서 실행
+class S3Storage(BaseStorage):
+    backend = "s3"
+
+    def __init__(self, client, bucket: str, public_url: str, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.public_url = public_url.rstrip("/")
+        # 이 앱이 사용하는 key 앞부분 (예 : hojin/images/, 버킷을 다른 데이터와 함께 쓰는 경우)
+        self.prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+
+    # 저장소 key(파일명) -> 버킷의 오브젝트 key
+    def object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/{self.object_key(key)}"
+
+    def is_app_owned(self) -> bool:
+        return bool(
+            self.prefix
+        )  # prefix가 없으면 버킷 전체 (다른 데이터가 있을 수 있음)
+
+    def key_from_url(self, data: str) -> str:
+        base = f"{self.public_url}/{self.prefix}"
+        if data.startswith(base):
+            return data[len(base) :]
+        return data.rsplit("/", 1)[-1]
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=self.object_key(key)
+            )
+        except Exception as e:
+            if is_not_found(e):
+                return False
+            raise
+        return True
+
+    async def modified_at(self, key: str) -> float | None:
+        try:
+            response = await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=self.object_key(key)
+            )
+        except Exception as e:
+            if is_not_found(e):
+                return None
+            raise
+        return response["LastModified"].timestamp()
+
+    async def read(self, key: str) -> bytes:
+        try:
+            response = await asyncio.to_thread(
+                self.client.get_object, Bucket=self.bucket, Key=self.object_key(key)
+            )
+        except Exception as e:
+            if is_not_found(e):
+                raise FileNotFoundError(key) from None
+            raise
+        return await asyncio.to_thread(response["Body"].read)
+
+    async def write(self, key: str, content: bytes) -> None:
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=self.object_key(key),
+            Body=content,
+            ContentType=content_type(key),
+            CacheControl=CACHE_CONTROL,
+        )
+
+    async def store_file(self, temp_path: str, key: str) -> bool:
+        try:
+            # 같은 key로 복사해서 LastModified 갱신 (메타데이터를 바꿔야 자기 자신으로 복사 가능)
+            await asyncio.to_thread(
+                self.client.copy_object,
+                Bucket=self.bucket,
+                Key=self.object_key(key),
+                CopySource={"Bucket": self.bucket, "Key": self.object_key(key)},
+                MetadataDirective="REPLACE",
+                ContentType=content_type(key),
+                CacheControl=CACHE_CONTROL,
+            )
+            return False
+        except Exception as e:
+            if not is_not_found(e):
+                raise
+        # upload_file은 큰 파일을 멀티파트로 나눠서 업로드
+        await asyncio.to_thread(
+            self.client.upload_file,
+            temp_path,
+            self.bucket,
+            self.object_key(key),
+            ExtraArgs={"ContentType": content_type(key), "CacheControl": CACHE_CONTROL},
+        )
+        return True
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self.client.delete_object, Bucket=self.bucket, Key=self.object_key(key)
+        )
+
+    # DeleteObjects로 한 번에 최대 1000개씩 삭제
+    async def delete_many(self, keys: list[str]) -> list[str]:
+        failed = []
+        for i in range(0, len(keys), 1000):
+            response = await asyncio.to_thread(
+                self.client.delete_objects,
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [
+                        {"Key": self.object_key(key)} for key in keys[i : i + 1000]
+                    ],
+                    "Quiet": True,
+                },
+            )
+            failed += [
+                error["Key"][len(self.prefix) :] for error in response.get("Errors", [])
+            ]
+        return failed
+
+    async def response(self, key: str, media_type: str, request_headers: Headers):
+        return RedirectResponse(self.url(key))
+
+    # ListObjectsV2는 key 순서로 반환 (prefix 아래의 오브젝트만)
+    async def list_files(self, batch_size: int) -> AsyncIterator[StoredObject]:
+        params = {"Bucket": self.bucket, "Prefix": self.prefix, "MaxKeys": batch_size}
+        while True:
+            response = await asyncio.to_thread(self.client.list_objects_v2, **params)
+            for item in response.get("Contents", []):
+                yield StoredObject(
+                    item["Key"][len(self.prefix) :], item["LastModified"].timestamp()
+                )
+            if not response.get("IsTruncated"):
+                return
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+
+# 디렉토리의 파일을 이름 순서로 (os.scandir는 정렬되지 않으므로 외부 정렬)
+def iter_sorted_files(directory: str, batch_size: int) -> Iterator[StoredObject]:
+    """
+    - batch_size개씩 정렬해서 임시 파일(run)에 쓰고 heapq.merge로 합친다.
+      (파일이 많아도 메모리에는 batch_size개 + run마다 1줄만 올라감)
+    """
+    # 디렉토리가 없거나 읽을 수 없으면 오류 (빈 목록으로 처리하면 모든 행이 파일 없는 행이 됨)
+    with tempfile.TemporaryDirectory() as run_dir, os.scandir(directory) as entries:
+        runs, chunk = [], []
+        for entry in entries:
+            if entry.is_file():
+                chunk.append(StoredObject(entry.name, entry.stat().st_mtime))
+            if len(chunk) >= batch_size:
+                runs.append(write_run(run_dir, len(runs), sorted(chunk)))
+                chunk = []
+        if not runs:  # 파일 수가 batch_size 이하
+            yield from sorted(chunk)
+            return
+        runs.append(write_run(run_dir, len(runs), sorted(chunk)))
+        run_files = [open(path, encoding="utf-8") for path in runs]
+        try:
+            yield from heapq.merge(*(map(read_run_line, fp) for fp in run_files))
+        finally:
+            for fp in run_files:
+                fp.close()
+
+
+def write_run(run_dir: str, index: int, chunk: list[StoredObject]) -> str:
+    path = os.path.join(run_dir, f"{index}.run")
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.writelines(f"{key}\t{modified_at!r}\n" for key, modified_at in chunk)
+    return path
+
+
+def read_run_line(line: str) -> StoredObject:
+    key, _, modified_at = line.rstrip("\n").rpartition("\t")
+    return StoredObject(key, float(modified_at))
+
+
+# botocore ClientError의 404 (botocore를 import 하지 않고 확인)
+def is_not_found(e: Exception) -> bool:
+    code = getattr(e, "response", {}).get("Error", {}).get("Code")
+    return code in ("404", "NoSuchKey", "NotFound")
+
+
+def create_storage(backend: str) -> BaseStorage:
+    if backend == "s3":
+        import boto3
+
+        endpoint_url = get_s3_endpoint_url()
+        bucket = get_s3_bucket()
+        client = boto3.client(
+            "s3", endpoint_url=endpoint_url, region_name=get_s3_region()
+        )
+        public_url = get_s3_public_url() or f"{endpoint_url}/{bucket}"
+        return S3Storage(
+            client, bucket=bucket, public_url=public_url, prefix=get_s3_prefix()
+        )
+    return LocalStorage()
+
+
+storage = create_storage(get_storage_backend())
+
+
+# 업로드 파일을 내용 해시 파일명으로 저장
+async def save_upload_file(file: UploadFile) -> StoredFile:
+    max_size = get_upload_max_size()
+    if file.size is not None and file.size > max_size:
+        raise_too_large(max_size)
+
+    temp_dir = storage.temp_dir()
+    await aiofiles.os.makedirs(temp_dir, exist_ok=True)
+    temp_path = os.path.join(temp_dir, f".{uuid.uuid4()}.part")
+    digest = hashlib.sha256()
+    header = b""
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as fp:
+            while chunk := await file.read(get_upload_chunk_size()):
+                size += len(chunk)
+                if size > max_size:
+                    raise_too_large(max_size)
+                if len(header) < HEADER_SIZE:
+                    header += chunk[: HEADER_SIZE - len(header)]
+                digest.update(chunk)
+                await fp.write(chunk)
+        # 확장자는 클라이언트가 보낸 파일명이 아니라 실제 형식으로
+        mime_type, extension = sniff_image_type(header)
+        dimensions = None
+        if mime_type != UNKNOWN_TYPE[0]:
+            dimensions = await asyncio.to_thread(read_dimensions, temp_path)
+        content_hash = digest.hexdigest()
+        filename = f"{content_hash}{extension}"
+        created = await storage.store_file(temp_path, filename)
+    finally:
+        if await aiofiles.os.path.exists(temp_path):
+            await aiofiles.os.remove(temp_path)
+    return StoredFile(
+        filename, size, created, content_hash, mime_type, *(dimensions or (None, None))
+    )
+
+
+# 여러 파일을 concurrency개씩 동시에 저장 (입력 순서대로 StoredFile / 실패한 파일은 예외)
+# 저장소 오류 등으로 일부가 실패해도 저장한 파일은 그대로 반환 (삭제는 호출한 쪽에서 image_reaper로)
+async def save_upload_files(
+    files: list[UploadFile], concurrency: int
+) -> list[StoredFile | BaseException]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def save(file: UploadFile) -> StoredFile:
+        async with semaphore:
+            return await save_upload_file(file)
+
+    return await asyncio.gather(*(save(file) for file in files), return_exceptions=True)
+
+
+# Image 행에 저장할 값
+def image_columns(stored: StoredFile) -> dict:
+    return {
+        "data": storage.url(stored.filename),
+        "file_size": stored.size,
+        "width": stored.width,
+        "height": stored.height,
+        "mime_type": stored.mime_type,
+        "content_hash": stored.content_hash,
+    }
+
+
+def raise_too_large(max_size: int):
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"파일 크기는 {max_size // (1024 * 1024)}MB를 넘을 수 없습니다.",
+    )
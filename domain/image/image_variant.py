@@ -0,0 +1,156 @@
+"""
+썸네일 / 반응형 변형 이미지 생성
+
+- 업로드된 원본을 VARIANT_SIZES x VARIANT_FORMATS 로 리사이즈해서 ImageVariant로 기록한다.
+  (목록 썸네일 등에서 원본 대신 작은 이미지를 내려받도록)
+- 리사이즈는 CPU를 오래 사용하므로 프로세스 풀에서 실행하고, 동시에 처리 / 대기할 수 있는 작업 수를 제한한다.
+- 업로드 직후 백그라운드로 생성하고, 풀이 가득 찼거나 실패해서 빠진 변형은 처음 요청될 때 생성한다.
+  (변형 이미지 GET은 설정된 크기 / 형식 1개만 생성하고, 풀이 가득 차면 503 + Retry-After -> 클라이언트가 다시 요청)
+  (작성자는 POST /api/image/variant/{image_id}/generate 로 빠진 변형을 한 번에 생성할 수 있다)
+- 원본 파일명이 내용 해시이므로 변형 파일명도 같은 내용이면 같다. 같은 원본의 변형이 이미 있으면 리사이즈하지 않고 재사용한다.
+
+- IMAGE_VARIANT_WORKERS : 프로세스 수
+- IMAGE_VARIANT_QUEUE_SIZE : 프로세스가 모두 사용 중일 때 기다릴 수 있는 작업 수
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette import status
+
+import cache
+from bounded_executor import BoundedExecutor
+from domain.image import image_resize, image_storage
+from models import Image, ImageVariant
+from settings import get_image_variant_queue_size, get_image_variant_workers
+
+VARIANT_SIZES = (128, 512, 1024)
+VARIANT_FORMATS = ("webp", "jpeg")
+VARIANTS = [(size, f) for size in VARIANT_SIZES for f in VARIANT_FORMATS]
+MEDIA_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+class ImageProcessor(BoundedExecutor):
+    def create_executor(self) -> ProcessPoolExecutor:
+        # fork는 부모 프로세스의 스레드(DB 드라이버, bcrypt 풀 등) 상태를 복사하므로 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+image_processor = ImageProcessor(
+    max_workers=get_image_variant_workers(), max_queue=get_image_variant_queue_size()
+)
+
+
+def find_variant(db_image: Image, size: int, image_format: str) -> ImageVariant | None:
+    for variant in db_image.variants:
+        if variant.size == size and variant.format == image_format:
+            return variant
+    return None
+
+
+# 같은 원본 파일을 참조하는 다른 Image에서 이미 만든 변형 (리사이즈 없이 재사용)
+async def find_shared_variants(
+    db: AsyncSession, stem: str, targets: list[tuple[int, str]]
+) -> list[dict]:
+    storage = image_storage.storage
+    urls = {
+        storage.url(image_resize.variant_filename(stem, *target)): target
+        for target in targets
+    }
+    variants = await db.scalars(
+        select(ImageVariant).filter(ImageVariant.data.in_(urls))
+    )
+    results = {}
+    for variant in variants:
+        key = storage.key_from_url(variant.data)
+        if await storage.exists(key):
+            results[urls[variant.data]] = {
+                "size": variant.size,
+                "format": variant.format,
+                "width": variant.width,
+                "height": variant.height,
+                "filename": key,
+            }
+    return list(results.values())
+
+
+# 없는 변형(파일이 지워진 경우 포함) 생성 후 기록
+async def generate_variants(
+    db: AsyncSession, db_image: Image, targets: list[tuple[int, str]] = VARIANTS
+) -> list[ImageVariant]:
+    """
+    - 원본 파일이 없으면 404, 이미지로 읽을 수 없으면 400, 풀이 가득 차면 503
+    - 같은 변형을 동시에 생성한 경우 (unique 제약 위반) 먼저 기록된 값을 사용
+    """
+    storage = image_storage.storage
+    missing = []
+    for size, image_format in targets:
+        variant = find_variant(db_image, size, image_format)
+        if variant is None or not await storage.exists(
+            storage.key_from_url(variant.data)
+        ):
+            missing.append((size, image_format))
+    if not missing:
+        return db_image.variants
+
+    source_key = storage.key_from_url(db_image.data)
+    stem = os.path.splitext(source_key)[0]
+    results = await find_shared_variants(db, stem, missing)
+    shared = {(result["size"], result["format"]) for result in results}
+    missing = [target for target in missing if target not in shared]
+    if missing:
+        try:
+            source = await storage.read(source_key)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="이미지 파일을 찾을 수 없습니다.",
+            )
+        try:
+            resized = await image_processor.run(
+                image_resize.resize_image, source, stem, missing
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미지 파일을 읽을 수 없습니다.",
+            )
+        for result in resized:
+            await storage.write(result["filename"], result.pop("content"))
+        results += resized
+
+    for result in results:
+        variant = find_variant(db_image, result["size"], result["format"])
+        if variant is None:
+            variant = ImageVariant(size=result["size"], format=result["format"])
+            db_image.variants.append(variant)
+        variant.width = result["width"]
+        variant.height = result["height"]
+        variant.data = storage.url(result["filename"])
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+    await db.refresh(db_image, ["variants"])
+    await cache.invalidate_detail("image", db_image.id)
+    return db_image.variants
+
+
+# 업로드 직후 백그라운드에서 전체 변형 생성 (요청 세션은 응답 후 닫히므로 새 세션 사용)
+async def generate_variants_in_background(bind: AsyncEngine, image_id: int) -> None:
+    async with AsyncSession(bind, expire_on_commit=False) as db:
+        db_image = await db.get(Image, image_id)
+        if db_image is None:
+            return
+        try:
+            await generate_variants(db, db_image)
+        except HTTPException:
+            pass  # 풀이 가득 찼거나 이미지가 아닌 경우 -> 처음 요청될 때 다시 시도
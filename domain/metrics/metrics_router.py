@@ -0,0 +1,50 @@
+from fastapi import APIRouter
+
+import cache
+import database
+from db_pool import pool_stats
+from domain.metrics import metrics_schema
+from domain.user import user_cache
+
+router = APIRouter(
+    prefix="/api/metrics",
+)
+
+
+# 응답 캐시 적중률
+@router.get(
+    "/cache",
+    response_model=metrics_schema.CacheMetrics,
+    tags=(["Metrics"]),
+    summary=("캐시 적중률 가져오기"),
+    description=(
+        "response_cache : 조회 API 응답 캐시 \n\n user_cache : 로그인 유저 캐시 (get_current_user) \n\n hits : 캐시 적중 횟수 \n\n misses : 캐시 미적중 횟수 (DB 조회)"
+    ),
+)
+async def cache_metrics():
+    return {
+        "response_cache": cache.response_cache.stats(),
+        "user_cache": user_cache.user_cache.stats(),
+    }
+
+
+# DB 커넥션 풀 상태
+@router.get(
+    "/db_pool",
+    response_model=metrics_schema.DBPoolMetrics,
+    tags=(["Metrics"]),
+    summary=("DB 커넥션 풀 상태 가져오기"),
+    description=(
+        "primary : 기본 DB (async_engine) \n\n replica : 읽기 전용 복제본 (read_async_engine, 없으면 null) \n\n size / max_overflow / timeout : 풀 설정 (DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT) \n\n checked_out : 사용 중인 연결 수 \n\n checked_in : 풀에서 대기 중인 연결 수 \n\n overflow : pool_size를 넘어서 추가로 연 연결 수 \n\n checkouts / timeouts : 연결을 꺼낸 횟수 / 대기 시간 초과 횟수 \n\n wait_histogram : 연결을 꺼내는 데 걸린 시간(ms) 구간별 횟수"
+    ),
+)
+async def db_pool_metrics():
+    replica = None
+    if database.read_async_engine is not None:
+        replica = pool_stats(
+            database.read_async_engine.pool, database.read_pool_metrics
+        )
+    return {
+        "primary": pool_stats(database.async_engine.pool, database.pool_metrics),
+        "replica": replica,
+    }
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+
+
+# 캐시 적중률
+class CacheStats(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int | None = None
+
+
+class CacheMetrics(BaseModel):
+    response_cache: CacheStats
+    user_cache: CacheStats
+
+
+# DB 커넥션 풀
+class WaitBucket(BaseModel):
+    le_ms: float | None  # 구간 상한 (ms, None : 그 이상 전체)
+    count: int
+
+
+class PoolStats(BaseModel):
+    pool_class: str
+    size: int | None = None
+    max_overflow: int | None = None
+    timeout: float | None = None
+    checked_out: int | None = None
+    checked_in: int | None = None
+    overflow: int | None = None
+    checkouts: int
+    timeouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    wait_histogram: list[WaitBucket]
+
+
+class DBPoolMetrics(BaseModel):
+    primary: PoolStats
+    replica: PoolStats | None = None  # 읽기 전용 복제본이 없으면 None
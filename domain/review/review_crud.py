@@ -1,10 +1,15 @@
 from datetime import datetime
 
-from domain.review.review_schema import ReviewCreate, ReviewUpdate
+import cache
+from domain.bucketlist import bucketlist_search
+from domain.bulk.bulk_schema import BulkItemResult, validation_detail
+from domain.review.review_schema import ReviewBulkCreate, ReviewCreate, ReviewUpdate
 
-from models import Review, BucketList, User
+from models import Image, Review, BucketList, User
+from pydantic import ValidationError
 from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select
+from sqlalchemy import event, func, insert, select, update
+from starlette import status
 
 
 # 특정 리뷰 가져오기
@@ -29,6 +34,9 @@ async def create_review(
     )
     db.add(db_review)
     await db.commit()
+    await cache.invalidate_detail("review", db_review.id)
+    await cache.invalidate_detail("bucketlist", bucketlist.id)
+    await cache.invalidate_list("bucketlist")
 
 
 # 리뷰 수정하기
@@ -39,9 +47,246 @@ async def update_review(db: Session, db_review: Review, review_update: ReviewUpd
     db_review.completed_at = review_update.completed_at
     db.add(db_review)
     await db.commit()
+    await cache.invalidate_detail("review", db_review.id)
+    await cache.invalidate_detail("bucketlist", db_review.bucketlist_id)
+    await cache.invalidate_list("bucketlist")
 
 
 # 리뷰 삭제하기
 async def delete_review(db: Session, db_review: Review):
+    image_ids = await db.execute(
+        select(Image.id).filter(Image.review_id == db_review.id)
+    )
+    image_ids = image_ids.scalars().all()
     await db.delete(db_review)
     await db.commit()
+    await cache.invalidate_detail("review", db_review.id)
+    await cache.invalidate_detail("bucketlist", db_review.bucketlist_id)
+    await cache.invalidate_detail("image", *image_ids)
+    await cache.invalidate_list("bucketlist")
+
+
+# 버킷리스트의 리뷰 수(review_count)를 다시 계산 (ORM 일괄 INSERT는 mapper 이벤트가 없으므로 직접 호출)
+async def refresh_review_count(db: Session, bucketlist_ids) -> None:
+    await db.execute(
+        update(BucketList)
+        .where(BucketList.id.in_(set(bucketlist_ids)))
+        .values(
+            review_count=select(func.count(Review.id))
+            .where(Review.bucketlist_id == BucketList.id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# 리뷰 일괄 생성하기
+async def bulk_create_reviews(
+    db: Session, items: list[dict], user: User
+) -> list[BulkItemResult]:
+    """
+    - 항목마다 ReviewBulkCreate로 검증하고, 대상 버킷리스트는 쿼리 1번으로 확인
+    - INSERT ... RETURNING(입력 순서대로 id 반환)으로 저장하고, 리뷰 수 / 검색 문서를 갱신한 뒤 한 번만 commit
+    """
+    results = {}
+    review_creates = {}
+    for index, item in enumerate(items):
+        try:
+            review_creates[index] = ReviewBulkCreate.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=validation_detail(e),
+            )
+
+    bucketlist_ids = await db.execute(
+        select(BucketList.id).filter(
+            BucketList.id.in_({c.bucketlist_id for c in review_creates.values()})
+        )
+    )
+    bucketlist_ids = set(bucketlist_ids.scalars())
+
+    now = datetime.now()
+    rows = {}
+    for index, review_create in review_creates.items():
+        if review_create.bucketlist_id not in bucketlist_ids:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_404_NOT_FOUND,
+                detail="버킷리스트를 찾을 수 없습니다.",
+            )
+            continue
+        rows[index] = {
+            "title": review_create.title,
+            "content": review_create.content,
+            "created_at": now,
+            "completed_at": review_create.completed_at,
+            "user_id": user.id,
+            "bucketlist_id": review_create.bucketlist_id,
+        }
+
+    if rows:
+        # 여러 행 INSERT ... RETURNING의 반환 순서는 보장되지 않으므로 입력 순서대로 받음
+        # (PostgreSQL : 묶어서 INSERT, SQLite : 같은 트랜잭션 안에서 1행씩 INSERT)
+        review_ids = await db.scalars(
+            insert(Review).returning(Review.id, sort_by_parameter_order=True),
+            list(rows.values()),
+        )
+        review_ids = review_ids.all()
+        changed_bucketlist_ids = {row["bucketlist_id"] for row in rows.values()}
+        await refresh_review_count(db, changed_bucketlist_ids)
+        connection = await db.connection()
+        await connection.run_sync(
+            bucketlist_search.refresh_documents, changed_bucketlist_ids
+        )
+        await db.commit()
+        for index, review_id in zip(rows, review_ids):
+            results[index] = BulkItemResult(
+                index=index, id=review_id, status=status.HTTP_201_CREATED
+            )
+        await cache.invalidate_detail("review", *review_ids)
+        await cache.invalidate_detail("bucketlist", *changed_bucketlist_ids)
+        await cache.invalidate_list("bucketlist")
+    return [results[index] for index in range(len(items))]
+
+
+# 리뷰 일괄 수정하기
+async def bulk_update_reviews(
+    db: Session, items: list[dict], user: User
+) -> list[BulkItemResult]:
+    """
+    - 대상 리뷰(작성자 / 버킷리스트)를 쿼리 1번으로 확인
+    - 기본키 기준 일괄 UPDATE(executemany)로 저장하고 검색 문서를 갱신한 뒤 한 번만 commit
+    """
+    results = {}
+    review_updates = {}
+    for index, item in enumerate(items):
+        try:
+            review_updates[index] = ReviewUpdate.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=validation_detail(e),
+            )
+
+    reviews = await db.execute(
+        select(Review.id, Review.user_id, Review.bucketlist_id).filter(
+            Review.id.in_({u.review_id for u in review_updates.values()})
+        )
+    )
+    reviews = {review.id: review for review in reviews}
+
+    now = datetime.now()
+    rows = {}
+    updated_ids = set()
+    for index, review_update in review_updates.items():
+        review = reviews.get(review_update.review_id)
+        if review is None:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "해당 리뷰를 찾을 수 없습니다.",
+            )
+        elif review.user_id != user.id:
+            status_code, detail = status.HTTP_400_BAD_REQUEST, "수정 권한이 없습니다."
+        elif review.id in updated_ids:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "같은 리뷰가 여러 번 입력되었습니다.",
+            )
+        else:
+            updated_ids.add(review.id)
+            rows[index] = {
+                "id": review.id,
+                "title": review_update.title,
+                "content": review_update.content,
+                "updated_at": now,
+                "completed_at": review_update.completed_at,
+            }
+            status_code, detail = status.HTTP_200_OK, None
+        results[index] = BulkItemResult(
+            index=index,
+            id=review_update.review_id,
+            status=status_code,
+            detail=detail,
+        )
+
+    if rows:
+        changed_bucketlist_ids = {reviews[i].bucketlist_id for i in updated_ids}
+        await db.execute(update(Review), list(rows.values()))
+        connection = await db.connection()
+        await connection.run_sync(
+            bucketlist_search.refresh_documents, changed_bucketlist_ids
+        )
+        await db.commit()
+        await cache.invalidate_detail("review", *updated_ids)
+        await cache.invalidate_detail("bucketlist", *changed_bucketlist_ids)
+        await cache.invalidate_list("bucketlist")
+    return [results[index] for index in range(len(items))]
+
+
+# 리뷰 일괄 삭제하기
+async def bulk_delete_reviews(
+    db: Session, review_ids: list[int], user: User
+) -> list[BulkItemResult]:
+    """
+    - 삭제는 ORM으로 처리해서 리뷰 수 / 이미지 파일 / 검색 문서 이벤트를 그대로 사용 (한 번만 commit)
+    """
+    reviews = await db.execute(
+        select(Review)
+        .filter(Review.id.in_(review_ids))
+        .options(selectinload(Review.images))
+    )
+    reviews = {review.id: review for review in reviews.scalars()}
+
+    results = []
+    deleted = {}
+    for index, review_id in enumerate(review_ids):
+        review = reviews.get(review_id)
+        if review is None or review_id in deleted:
+            status_code, detail = (
+                status.HTTP_400_BAD_REQUEST,
+                "해당 리뷰를 찾을 수 없습니다.",
+            )
+        elif review.user_id != user.id:
+            status_code, detail = status.HTTP_400_BAD_REQUEST, "삭제 권한이 없습니다."
+        else:
+            deleted[review_id] = review
+            status_code, detail = status.HTTP_204_NO_CONTENT, None
+        results.append(
+            BulkItemResult(index=index, id=review_id, status=status_code, detail=detail)
+        )
+
+    if deleted:
+        bucketlist_ids = {review.bucketlist_id for review in deleted.values()}
+        image_ids = [image.id for r in deleted.values() for image in r.images]
+        for review in deleted.values():
+            await db.delete(review)
+        await db.commit()
+        await cache.invalidate_detail("review", *deleted)
+        await cache.invalidate_detail("bucketlist", *bucketlist_ids)
+        await cache.invalidate_detail("image", *image_ids)
+        await cache.invalidate_list("bucketlist")
+    return results
+
+
+# 리뷰가 생성 / 삭제될 때 버킷리스트의 리뷰 수(review_count)를 같은 트랜잭션 안에서 갱신
+def increase_review_count(mapper, connection, target):
+    connection.execute(
+        update(BucketList)
+        .where(BucketList.id == target.bucketlist_id)
+        .values(review_count=BucketList.review_count + 1)
+    )
+
+
+def decrease_review_count(mapper, connection, target):
+    connection.execute(
+        update(BucketList)
+        .where(BucketList.id == target.bucketlist_id)
+        .values(review_count=BucketList.review_count - 1)
+    )
+
+
+event.listen(Review, "after_insert", increase_review_count)
+event.listen(Review, "after_delete", decrease_review_count)
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
+import cache
 from database import get_async_db
+from db_replica import get_async_read_db, use_response_cache
 from domain.bucketlist import bucketlist_crud
+from domain.bulk import bulk_schema
 from domain.review import review_schema, review_crud
 from domain.user.user_router import get_current_user
 from models import User
@@ -22,14 +25,28 @@ router = APIRouter(
     summary=("특정 리뷰 가져오기"),
     description=("review_id : 가져오고싶은 Review의 id (PK) 값을 입력"),
 )
-async def review_detail(review_id: int, db: Session = Depends(get_async_db)):
+async def review_detail(
+    request: Request, review_id: int, db: Session = Depends(get_async_read_db)
+):
+    cache_key = cache.detail_key("review", review_id)
+    if use_response_cache(request):
+        cached = await cache.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    generation = await cache.detail_generation(cache_key)
     review = await review_crud.get_review(db, review_id=review_id)
     if not review:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 리뷰를 찾을 수 없습니다.",
         )
-    return review
+    response = review_schema.Review.model_validate(
+        review, from_attributes=True
+    ).model_dump(mode="json")
+    if use_response_cache(request):
+        await cache.set_detail(cache_key, response, generation)
+    return response
 
 
 # 리뷰 생성
@@ -112,3 +129,66 @@ async def review_delete(
             status_code=status.HTTP_400_BAD_REQUEST, detail="삭제 권한이 없습니다."
         )
     await review_crud.delete_review(db=db, db_review=db_review)
+
+
+# 리뷰 일괄 생성
+@router.post(
+    "/bulk/create",
+    response_model=bulk_schema.BulkResult,
+    tags=(["Review"]),
+    summary=("리뷰 일괄 생성"),
+    description=(
+        f"리뷰 생성 항목(bucketlist_id, title, content, completed_at)의 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [201 : 생성, 404 : 버킷리스트 없음, 422 : 입력값 오류] \n\n 성공한 항목은 하나의 트랜잭션으로 저장"
+    ),
+)
+async def review_bulk_create(
+    items: list[dict] = Body(max_length=bulk_schema.BULK_MAX_SIZE),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await review_crud.bulk_create_reviews(
+        db=db, items=items, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
+
+
+# 리뷰 일괄 수정
+@router.put(
+    "/bulk/update",
+    response_model=bulk_schema.BulkResult,
+    tags=(["Review"]),
+    summary=("리뷰 일괄 수정"),
+    description=(
+        f"리뷰 수정 항목(review_id, title, content, completed_at)의 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [200 : 수정, 400 : 리뷰 없음 / 권한 없음 / 중복 입력, 422 : 입력값 오류]"
+    ),
+)
+async def review_bulk_update(
+    items: list[dict] = Body(max_length=bulk_schema.BULK_MAX_SIZE),
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await review_crud.bulk_update_reviews(
+        db=db, items=items, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
+
+
+# 리뷰 일괄 삭제
+@router.post(
+    "/bulk/delete",
+    response_model=bulk_schema.BulkResult,
+    tags=(["Review"]),
+    summary=("리뷰 일괄 삭제"),
+    description=(
+        f"ids : 삭제하고싶은 Review의 id (PK) 배열을 입력 (최대 {bulk_schema.BULK_MAX_SIZE}개) \n\n 항목별 결과(results)는 입력 순서대로 반환 [204 : 삭제, 400 : 리뷰 없음 / 권한 없음]"
+    ),
+)
+async def review_bulk_delete(
+    _bulk_delete: bulk_schema.BulkDelete,
+    db: Session = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = await review_crud.bulk_delete_reviews(
+        db=db, review_ids=_bulk_delete.ids, user=current_user
+    )
+    return bulk_schema.bulk_result(results)
@@ -40,3 +40,8 @@ class ReviewCreate(BaseModel):
 # 리뷰 수정
 class ReviewUpdate(ReviewCreate):
     review_id: int
+
+
+# 리뷰 일괄 생성 (항목마다 리뷰를 작성할 버킷리스트 지정)
+class ReviewBulkCreate(ReviewCreate):
+    bucketlist_id: int
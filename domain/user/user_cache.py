@@ -0,0 +1,131 @@
+"""
+로그인 유저 캐시 (get_current_user)
+
+- username -> 유저 컬럼 값(snapshot)을 TTL + LRU 캐시에 저장해서, 인증이 필요한 요청마다 하던 유저 SELECT를 줄인다.
+- 비밀번호 해시는 저장하지 않는다. (캐시에서 꺼낸 유저의 password는 불러오지 않은 상태)
+- 유저가 수정 / 삭제되면 commit 후에 해당 username(변경 전 username 포함)의 캐시를 삭제한다.
+  (mapper 이벤트는 동기 방식이므로 commit 후 이벤트 루프에서 삭제를 실행)
+
+- USER_CACHE_BACKEND
+  memory : 프로세스 내부 LRU + TTL 캐시 (기본값)
+  redis : Redis 호환 서버 (여러 워커가 캐시와 무효화를 공유, 응답 캐시와 같은 redis 패키지 / REDIS_URL 사용)
+  none : 캐시 사용 안 함
+"""
+
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+import cache
+from models import User
+from settings import (
+    get_user_cache_backend,
+    get_user_cache_max_size,
+    get_user_cache_ttl,
+)
+
+SNAPSHOT_COLUMNS = (
+    "id",
+    "username",
+    "email",
+    "created_at",
+    "updated_at",
+    "is_admin",
+    "is_active",
+)
+DATETIME_COLUMNS = ("created_at", "updated_at")
+
+user_cache = cache.create_cache(
+    get_user_cache_backend(),
+    max_size=get_user_cache_max_size(),
+    default_ttl=get_user_cache_ttl(),
+    prefix="hojin:user:",
+)
+
+_pending_invalidations = set()  # 실행 중인 무효화 task (GC 방지)
+
+
+def user_key(username: str) -> str:
+    return f"user:{username}"
+
+
+def to_snapshot(user: User) -> dict:
+    snapshot = {column: getattr(user, column) for column in SNAPSHOT_COLUMNS}
+    for column in DATETIME_COLUMNS:
+        if snapshot[column] is not None:
+            snapshot[column] = snapshot[column].isoformat()
+    return snapshot
+
+
+def from_snapshot(snapshot: dict) -> User:
+    values = dict(snapshot)
+    for column in DATETIME_COLUMNS:
+        if values[column] is not None:
+            values[column] = datetime.fromisoformat(values[column])
+    user = User(**values)
+    make_transient_to_detached(user)  # DB에서 불러온 것과 같은 detached 상태로 변경
+    return user
+
+
+# 캐시된 유저를 세션에 연결 (SELECT 없이 merge)
+async def get_cached_user(db: Session, username: str) -> User | None:
+    snapshot = await user_cache.get(user_key(username))
+    if snapshot is None:
+        return None
+    return await db.merge(from_snapshot(snapshot), load=False)
+
+
+async def set_cached_user(user: User) -> None:
+    await user_cache.set(user_key(user.username), to_snapshot(user))
+
+
+async def invalidate_user(*usernames: str) -> None:
+    await user_cache.delete(*(user_key(username) for username in usernames))
+
+
+# 유저 수정 / 삭제 시 commit 후 캐시 삭제
+def collect_changed_username(target: User) -> None:
+    session = inspect(target).session
+    if session is None:
+        return
+    history = inspect(target).attrs.username.history
+    usernames = session.info.setdefault("changed_usernames", set())
+    usernames.update(history.deleted or ())
+    usernames.add(target.username)
+
+
+def collect_updated_user(mapper, connection, target):
+    # 관계(backref 컬렉션)만 바뀐 경우에도 after_update가 호출되므로 컬럼 변경만 확인
+    session = inspect(target).session
+    if session is not None and session.is_modified(target, include_collections=False):
+        collect_changed_username(target)
+
+
+def collect_deleted_user(mapper, connection, target):
+    collect_changed_username(target)
+
+
+def invalidate_changed_users_after_commit(session: Session):
+    usernames = session.info.pop("changed_usernames", None)
+    if not usernames:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # 이벤트 루프 밖(동기 스크립트 등)에서 commit한 경우
+        asyncio.run(invalidate_user(*usernames))
+        return
+    task = loop.create_task(invalidate_user(*usernames))
+    _pending_invalidations.add(task)
+    task.add_done_callback(_pending_invalidations.discard)
+
+
+def discard_changed_users_after_rollback(session: Session):
+    session.info.pop("changed_usernames", None)
+
+
+event.listen(User, "after_update", collect_updated_user)
+event.listen(User, "after_delete", collect_deleted_user)
+event.listen(Session, "after_commit", invalidate_changed_users_after_commit)
+event.listen(Session, "after_rollback", discard_changed_users_after_rollback)
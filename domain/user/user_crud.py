@@ -1,19 +1,44 @@
-from passlib.context import CryptContext
+import sys
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from domain.user.user_schema import UserCreate
+from sqlalchemy import DDL, event, select
+from domain.user.user_password import password_hasher
+from domain.user.user_schema import UserCreate, UserListResponse, UserSortEnum
+import pagination
 from models import User
 
 from datetime import datetime
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+USER_LIST_COLUMNS = (
+    User.id,
+    User.username,
+    User.email,
+    User.created_at,
+    User.is_admin,
+    User.is_active,
+)
+STREAM_BATCH_SIZE = 1000
+# prefix 범위 검색에 사용할 정렬 규칙 (None : 컬럼 기본값)
+PREFIX_RANGE_COLLATIONS = {"sqlite": None, "postgresql": "C"}
+USERNAME_PREFIX_INDEX = "ix_user_username_c"
+
+# PostgreSQL : COLLATE "C" 범위 검색용 username 인덱스 (Base.metadata.create_all 시 함께 실행)
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL(
+        f"CREATE INDEX IF NOT EXISTS {USERNAME_PREFIX_INDEX} "
+        'ON "user" (username COLLATE "C")'
+    ).execute_if(dialect="postgresql"),
+)
 
 
 # 회원가입
 async def create_user(db: Session, user_create: UserCreate):
     db_user = User(
-        password=pwd_context.hash(user_create.password),
+        password=await password_hasher.hash(user_create.password),
         username=user_create.username,
         email=user_create.email,
         created_at=datetime.now(),
@@ -36,3 +61,106 @@ async def get_existing_user(db: Session, user_create: UserCreate):
 async def get_user(db: Session, username: str):
     result = await db.execute(select(User).filter(User.username == username))
     return result.scalar_one_or_none()
+
+
+# 커서 페이지네이션 : (정렬 기준, 마지막 값) -> 불투명(opaque) 문자열
+def encode_cursor(sort: UserSortEnum, value) -> str:
+    return pagination.encode_cursor(sort.value, value)
+
+
+def decode_cursor(cursor: str, sort: UserSortEnum):
+    def parse(sort_name, value):
+        if sort_name != sort.value:
+            raise ValueError
+        return int(value) if sort == UserSortEnum.id else str(value)
+
+    return pagination.decode_cursor(cursor, parse)
+
+
+# username 앞부분(prefix) 검색
+def filter_username_prefix(query, prefix: str, dialect_name: str):
+    """
+    - username >= prefix AND username < (prefix의 마지막 글자 + 1) 범위 조건으로 인덱스를 사용
+    - 범위 조건은 글자(코드 포인트) 순서로 비교해야 하므로
+      SQLite는 기본 정렬 규칙(BINARY), PostgreSQL은 COLLATE "C" (USERNAME_PREFIX_INDEX)로 비교
+      (en_US 등의 정렬 규칙으로 비교하면 'test_'로 시작하는 username이 범위에서 빠질 수 있음)
+    - 그 외의 DB는 범위 조건 없이 startswith(LIKE)로만 검색
+    """
+    if not prefix:
+        return query
+    query = query.filter(User.username.startswith(prefix, autoescape=True))
+    if dialect_name not in PREFIX_RANGE_COLLATIONS:
+        return query
+    username = User.username
+    if PREFIX_RANGE_COLLATIONS[dialect_name]:
+        username = username.collate(PREFIX_RANGE_COLLATIONS[dialect_name])
+    query = query.filter(username >= prefix)
+    upper_bound = prefix_upper_bound(prefix)
+    if upper_bound is not None:
+        query = query.filter(username < upper_bound)
+    return query
+
+
+# prefix로 시작하는 모든 문자열보다 큰 가장 작은 문자열
+def prefix_upper_bound(prefix: str) -> str | None:
+    """
+    - 마지막 글자를 다음 코드 포인트로 바꿈
+    - 마지막 글자가 U+10FFFF이면 올릴 수 없으므로 떼고 앞 글자를 올림 (모두 U+10FFFF이면 상한 없음 -> None)
+    - 서로게이트(U+D800 ~ U+DFFF)는 DB에 저장할 수 없는 글자이므로 건너뜀
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    code_point = ord(prefix[-1]) + 1
+    if 0xD800 <= code_point <= 0xDFFF:
+        code_point = 0xE000
+    return prefix[:-1] + chr(code_point)
+
+
+# 회원 목록 가져오기 (keyset 페이지네이션)
+async def get_user_list(
+    db: Session,
+    size: int = 100,
+    cursor: str | None = None,
+    prefix: str = "",
+    sort: UserSortEnum = UserSortEnum.id,
+):
+    """
+    - 정렬 기준(id / username) 컬럼의 인덱스를 그대로 사용 (OFFSET 없이 cursor 다음 값부터 조회)
+    - size + 1개를 가져와서 다음 페이지가 있을 때만 next_cursor 반환
+    """
+    sort_column = User.id if sort == UserSortEnum.id else User.username
+    query = filter_username_prefix(
+        select(*USER_LIST_COLUMNS), prefix, db.bind.dialect.name
+    )
+    if cursor:
+        query = query.filter(sort_column > decode_cursor(cursor, sort))
+    result = await db.execute(query.order_by(sort_column).limit(size + 1))
+    users = result.all()
+
+    next_cursor = None
+    if len(users) > size:
+        users = users[:size]
+        next_cursor = encode_cursor(sort, getattr(users[-1], sort.value))
+    return users, next_cursor
+
+
+# 회원 목록 전체 스트리밍 (NDJSON)
+async def stream_user_list(db: AsyncSession, prefix: str = "") -> AsyncIterator[str]:
+    """
+    - 서버 측 커서(yield_per)로 STREAM_BATCH_SIZE명씩 읽어서 바로 직렬화 (전체 목록을 메모리에 올리지 않음)
+    """
+    query = filter_username_prefix(
+        select(*USER_LIST_COLUMNS), prefix, db.bind.dialect.name
+    )
+    result = await db.stream(
+        query.order_by(User.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    async for users in result.partitions():
+        yield "".join(
+            UserListResponse._User.model_validate(
+                user, from_attributes=True
+            ).model_dump_json()
+            + "\n"
+            for user in users
+        )
@@ -0,0 +1,38 @@
+"""
+비밀번호 해싱 / 검증 (bcrypt)
+
+- bcrypt는 1번에 수백 ms 동안 CPU를 사용하므로, async 핸들러에서 바로 호출하면 그동안 이벤트 루프 전체가 멈춘다.
+- 전용 스레드 풀에서 실행하고 (bcrypt는 계산 중 GIL을 놓음), 동시에 처리 / 대기할 수 있는 요청 수를 제한한다.
+  (bounded_executor 참고, 대기열이 가득 차면 바로 503 -> 로그인이 몰려도 로그인 요청만 느려지거나 거절됨)
+
+- PASSWORD_HASH_WORKERS : 스레드 수
+- PASSWORD_HASH_QUEUE_SIZE : 스레드가 모두 사용 중일 때 기다릴 수 있는 요청 수
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from bounded_executor import BoundedExecutor
+from settings import get_password_hash_queue_size, get_password_hash_workers
+
+# 비밀번호 해싱
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasher(BoundedExecutor):
+    def create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self.run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(pwd_context.verify, password, hashed_password)
+
+
+password_hasher = PasswordHasher(
+    max_workers=get_password_hash_workers(), max_queue=get_password_hash_queue_size()
+)
@@ -1,16 +1,17 @@
 from datetime import timedelta, datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import Depends
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette import status
 
 from database import get_async_db
-from domain.user import user_crud, user_schema
-from domain.user.user_crud import pwd_context
-from models import User
+from db_replica import get_async_read_db
+from domain.user import user_cache, user_crud, user_schema
+from domain.user.user_password import password_hasher
 from settings import get_access_token_expire_minutes, get_secret_key, get_algorithm
 
 ACCESS_TOKEN_EXPIRE_MINUTES = get_access_token_expire_minutes()
@@ -29,12 +30,33 @@ router = APIRouter(
     "/",
     response_model=user_schema.UserListResponse,
     tags=(["User"]),
-    summary=("회원 정보 전체 가져오기"),
+    summary=("회원 정보 가져오기 (페이지네이션 적용)"),
+    description=(
+        "size : 한 페이지당 가져올 회원 수 (최대 1000) \n\n cursor : 이전 응답의 next_cursor 값을 입력 (빈 값이면 첫 페이지) \n\n prefix : username 앞부분 검색 \n\n sort : 정렬 기준 [id, username] \n\n stream : true 입력 시 조건에 맞는 전체 회원을 NDJSON (1명당 1줄) 으로 스트리밍 (size / cursor 무시)"
+    ),
 )
-async def get_users(db: Session = Depends(get_async_db)):
-    results = await db.execute(select(User))
-    users = results.scalars().all()
-    return {"data": users}
+async def get_users(
+    db: Session = Depends(get_async_read_db),
+    size: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    prefix: str = "",
+    sort: user_schema.UserSortEnum = user_schema.UserSortEnum.id,
+    stream: bool = False,
+):
+    if stream:
+
+        async def content():
+            # 응답을 보내는 동안 사용할 세션 (요청 세션은 응답 전에 닫힘)
+            async with AsyncSession(db.bind) as stream_db:
+                async for chunk in user_crud.stream_user_list(stream_db, prefix):
+                    yield chunk
+
+        return StreamingResponse(content(), media_type="application/x-ndjson")
+
+    users, next_cursor = await user_crud.get_user_list(
+        db, size=size, cursor=cursor, prefix=prefix, sort=sort
+    )
+    return {"data": users, "next_cursor": next_cursor}
 
 
 # 회원가입
@@ -80,7 +102,7 @@ async def login_for_access_token(
             detail="존재하지 않는 아이디입니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    elif not pwd_context.verify(form_data.password, user.password):
+    elif not await password_hasher.verify(form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="비밀번호가 일치하지 않습니다.",
@@ -118,7 +140,11 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     else:
+        user = await user_cache.get_cached_user(db, username=username)
+        if user is not None:
+            return user
         user = await user_crud.get_user(db, username=username)
         if user is None:
             raise credentials_exception
+        await user_cache.set_cached_user(user)
         return user
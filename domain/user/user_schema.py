@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Sequence
 from pydantic import BaseModel, field_validator, EmailStr
 from pydantic_core.core_schema import ValidationInfo
@@ -15,6 +16,13 @@ class UserListResponse(BaseModel):
         is_active: bool
 
     data: Sequence[_User]
+    next_cursor: str | None = None
+
+
+# 회원 목록 정렬 기준
+class UserSortEnum(str, Enum):
+    id = "id"
+    username = "username"
 
 
 # 회원가입
@@ -1,12 +1,14 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
+from db_replica import ReadAfterWriteMiddleware
 from domain.bucketlist import bucketlist_router
 from domain.user import user_router
 from domain.review import review_router
 from domain.image import image_router
+from domain.metrics import metrics_router
+from domain.image.image_files import ImageFiles
 import os
-from settings import get_be_url, get_fe_url, get_upload_dir
+from settings import get_be_url, get_fe_url, get_storage_backend, get_upload_dir
 
 BE_URL = get_be_url()
 FE_URL = get_fe_url()
@@ -30,22 +32,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 쓰기 후 조회는 기본 DB에서 (읽기 전용 복제본 사용 시)
+app.add_middleware(ReadAfterWriteMiddleware)
+
 app.include_router(bucketlist_router.router)
 app.include_router(user_router.router)
 app.include_router(review_router.router)
 # 이미지파일 저장
 app.include_router(image_router.router)
+app.include_router(metrics_router.router)
 
-# 서버 디렉토리에 대한 StaticFiles 미들웨어 등록
-if os.path.exists(UPLOAD_DIR):
+# 서버 디렉토리에 대한 이미지 파일 마운트 등록 (immutable 캐시 / ETag / Range, s3 저장소는 S3 / CDN에서 바로 제공)
+if get_storage_backend() == "local" and os.path.exists(UPLOAD_DIR):
     app.mount(
-        UPLOAD_DIR[1:], StaticFiles(directory=UPLOAD_DIR), name=f"{UPLOAD_DIR[2:]}s"
+        UPLOAD_DIR[1:], ImageFiles(directory=UPLOAD_DIR), name=f"{UPLOAD_DIR[2:]}s"
     )
 
-# 테스트코드 디렉토리에 대한 StaticFiles 미들웨어 등록
+# 테스트코드 디렉토리에 대한 이미지 파일 마운트 등록
 if os.path.exists("./image_file_test"):
     app.mount(
         "/image_file_test",
-        StaticFiles(directory="./image_file_test"),
+        ImageFiles(directory="./image_file_test"),
         name="image_files_test",
     )
@@ -5,6 +5,8 @@ from settings import get_sqlalchemy_database_url
 from alembic import context
 
 import models
+from domain.bucketlist.bucketlist_search import SEARCH_TABLE
+from domain.user.user_crud import USERNAME_PREFIX_INDEX
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -24,6 +26,22 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = models.Base.metadata
 
+
+# 검색 인덱스 테이블은 DDL 이벤트로 만들므로 (metadata에 없음) autogenerate / check 비교에서 제외
+# SQLite FTS5 : bucketlist_search + 내부 테이블(bucketlist_search_data 등), PostgreSQL : bucketlist_search + GIN 인덱스
+def include_object(object, name, type_, reflected, compare_to):
+    if (
+        type_ in ("table", "index")
+        and name
+        and name.startswith((SEARCH_TABLE, f"ix_{SEARCH_TABLE}"))
+    ):
+        return False
+    # PostgreSQL 전용 COLLATE "C" username 인덱스도 DDL 이벤트 / 마이그레이션에서만 만듦
+    if type_ == "index" and name == USERNAME_PREFIX_INDEX:
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -46,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -68,7 +87,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
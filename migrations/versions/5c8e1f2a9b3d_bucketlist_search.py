@@ -0,0 +1,62 @@
+"""bucketlist search index
+
+Revision ID: 5c8e1f2a9b3d
+Revises: 2233190d580b
+Create Date: 2026-10-18 10:12:41.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e1f2a9b3d'
+down_revision: Union[str, None] = '2233190d580b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        op.execute(
+            "CREATE TABLE bucketlist_search ("
+            "bucketlist_id INTEGER PRIMARY KEY REFERENCES bucketlist (id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL)"
+        )
+        op.execute(
+            "CREATE INDEX ix_bucketlist_search_document "
+            "ON bucketlist_search USING GIN (document)"
+        )
+        op.execute(
+            "INSERT INTO bucketlist_search (bucketlist_id, document) "
+            "SELECT b.id, "
+            "setweight(to_tsvector('simple', b.title), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(b.content, '')), 'B') || "
+            "setweight(to_tsvector('simple', u.username), 'C') || "
+            "setweight(to_tsvector('simple', coalesce(("
+            "SELECT string_agg(concat_ws(' ', r.title, r.content, ru.username), ' ' ORDER BY r.id) "
+            "FROM review r JOIN \"user\" ru ON ru.id = r.user_id "
+            "WHERE r.bucketlist_id = b.id), '')), 'D') "
+            "FROM bucketlist b JOIN \"user\" u ON u.id = b.user_id"
+        )
+    elif dialect_name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE bucketlist_search "
+            "USING fts5(title, content, username, reviews, tokenize='unicode61')"
+        )
+        op.execute(
+            "INSERT INTO bucketlist_search (rowid, title, content, username, reviews) "
+            "SELECT b.id, b.title, coalesce(b.content, ''), u.username, coalesce(("
+            "SELECT group_concat(r.title || ' ' || coalesce(r.content, '') || ' ' || ru.username, ' ') "
+            "FROM review r JOIN user ru ON ru.id = r.user_id "
+            "WHERE r.bucketlist_id = b.id), '') "
+            "FROM bucketlist b JOIN user u ON u.id = b.user_id"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name in ("postgresql", "sqlite"):
+        op.execute("DROP TABLE IF EXISTS bucketlist_search")
@@ -0,0 +1,48 @@
+"""bucketlist list filter / sort indexes
+
+Revision ID: 9a4d7b2e6c10
+Revises: 5c8e1f2a9b3d
+Create Date: 2026-10-18 11:02:17.540931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d7b2e6c10'
+down_revision: Union[str, None] = '5c8e1f2a9b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('bucketlist', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('review_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 리뷰 수 채우기
+    op.execute(
+        "UPDATE bucketlist SET review_count = "
+        "(SELECT count(*) FROM review WHERE review.bucketlist_id = bucketlist.id)"
+    )
+
+    with op.batch_alter_table('bucketlist', schema=None) as batch_op:
+        batch_op.create_index('ix_bucketlist_category_created_at', ['category', 'created_at'], unique=False)
+        batch_op.create_index('ix_bucketlist_is_done_created_at', ['is_done', 'created_at'], unique=False)
+        batch_op.create_index('ix_bucketlist_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_bucketlist_calender', ['calender'], unique=False)
+        batch_op.create_index('ix_bucketlist_updated_at', ['updated_at'], unique=False)
+        batch_op.create_index('ix_bucketlist_review_count', ['review_count'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bucketlist', schema=None) as batch_op:
+        batch_op.drop_index('ix_bucketlist_review_count')
+        batch_op.drop_index('ix_bucketlist_updated_at')
+        batch_op.drop_index('ix_bucketlist_calender')
+        batch_op.drop_index('ix_bucketlist_user_id_created_at')
+        batch_op.drop_index('ix_bucketlist_is_done_created_at')
+        batch_op.drop_index('ix_bucketlist_category_created_at')
+        batch_op.drop_column('review_count')
@@ -0,0 +1,35 @@
+"""foreign key / created_at indexes
+
+Revision ID: b3e61f0d8a47
+Revises: 9a4d7b2e6c10
+Create Date: 2026-10-18 13:40:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e61f0d8a47'
+down_revision: Union[str, None] = '9a4d7b2e6c10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # bucketlist.user_id 는 ix_bucketlist_user_id_created_at 의 첫 번째 컬럼이므로 따로 만들지 않음
+    op.create_index(op.f('ix_bucketlist_created_at'), 'bucketlist', ['created_at'], unique=False)
+    op.create_index(op.f('ix_review_user_id'), 'review', ['user_id'], unique=False)
+    op.create_index(op.f('ix_review_bucketlist_id'), 'review', ['bucketlist_id'], unique=False)
+    op.create_index(op.f('ix_image_bucketlist_id'), 'image', ['bucketlist_id'], unique=False)
+    op.create_index(op.f('ix_image_review_id'), 'image', ['review_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_image_review_id'), table_name='image')
+    op.drop_index(op.f('ix_image_bucketlist_id'), table_name='image')
+    op.drop_index(op.f('ix_review_bucketlist_id'), table_name='review')
+    op.drop_index(op.f('ix_review_user_id'), table_name='review')
+    op.drop_index(op.f('ix_bucketlist_created_at'), table_name='bucketlist')
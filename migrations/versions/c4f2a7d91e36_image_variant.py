@@ -0,0 +1,37 @@
+"""image variant
+
+Revision ID: c4f2a7d91e36
+Revises: b3e61f0d8a47
+Create Date: 2026-10-18 15:12:44.803215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f2a7d91e36'
+down_revision: Union[str, None] = 'b3e61f0d8a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('image_variant',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('data', sa.String(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('format', sa.String(), nullable=False),
+    sa.Column('width', sa.Integer(), nullable=False),
+    sa.Column('height', sa.Integer(), nullable=False),
+    sa.Column('image_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['image_id'], ['image.id'], name=op.f('fk_image_variant_image_id_image')),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_image_variant')),
+    sa.UniqueConstraint('image_id', 'size', 'format', name=op.f('uq_image_variant_image_id'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('image_variant')
@@ -0,0 +1,35 @@
+"""image file info (size / dimensions / MIME / content hash)
+
+Revision ID: d28e94f70e51
+Revises: e7b3c9d05a12
+Create Date: 2026-10-18 19:42:17.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd28e94f70e51'
+down_revision: Union[str, None] = 'e7b3c9d05a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('image', sa.Column('file_size', sa.Integer(), nullable=True))
+    op.add_column('image', sa.Column('width', sa.Integer(), nullable=True))
+    op.add_column('image', sa.Column('height', sa.Integer(), nullable=True))
+    op.add_column('image', sa.Column('mime_type', sa.String(), nullable=True))
+    op.add_column('image', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('image') as batch_op:
+        batch_op.drop_column('content_hash')
+        batch_op.drop_column('mime_type')
+        batch_op.drop_column('height')
+        batch_op.drop_column('width')
+        batch_op.drop_column('file_size')
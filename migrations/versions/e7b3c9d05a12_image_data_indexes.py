@@ -0,0 +1,28 @@
+"""image data indexes (content-addressed file reference count)
+
+Revision ID: e7b3c9d05a12
+Revises: c4f2a7d91e36
+Create Date: 2026-10-18 16:31:09.274518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c9d05a12'
+down_revision: Union[str, None] = 'c4f2a7d91e36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_image_data'), 'image', ['data'], unique=False)
+    op.create_index(op.f('ix_image_variant_data'), 'image_variant', ['data'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_image_variant_data'), table_name='image_variant')
+    op.drop_index(op.f('ix_image_data'), table_name='image')
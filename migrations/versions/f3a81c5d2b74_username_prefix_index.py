@@ -0,0 +1,30 @@
+"""username prefix index (PostgreSQL COLLATE "C")
+
+Revision ID: f3a81c5d2b74
+Revises: d28e94f70e51
+Create Date: 2026-10-18 21:05:33.104512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a81c5d2b74'
+down_revision: Union[str, None] = 'd28e94f70e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            'CREATE INDEX ix_user_username_c ON "user" (username COLLATE "C")'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_user_username_c")
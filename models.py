@@ -7,6 +7,8 @@ from sqlalchemy import (
     Date,
     Boolean,
     ForeignKey,
+    Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from database import Base
@@ -49,12 +51,12 @@ class BucketList(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String, unique=True, nullable=False)
     content = Column(Text, nullable=True)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)
     updated_at = Column(DateTime, nullable=True)
     category = Column(SQLEnum(BucketListCategoryEnum), nullable=True)
     is_done = Column(Boolean, default=False, nullable=False)
     calender = Column(Date, nullable=True)
-    # 외래키
+    # 외래키 (인덱스는 ix_bucketlist_user_id_created_at 사용)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     user = relationship("User", backref="bucketlist_users")
     # Cascade 설정
@@ -67,6 +69,19 @@ class BucketList(Base):
         "Image",
         backref="bucketlist",
         cascade="all, delete-orphan",
+        order_by="Image.id",
+    )
+    # 리뷰 수 (목록 정렬용, 리뷰 생성 / 삭제 시 review_crud의 이벤트로 갱신)
+    review_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # 목록 필터 / 정렬용 인덱스
+    __table_args__ = (
+        Index("ix_bucketlist_category_created_at", "category", "created_at"),
+        Index("ix_bucketlist_is_done_created_at", "is_done", "created_at"),
+        Index("ix_bucketlist_user_id_created_at", "user_id", "created_at"),
+        Index("ix_bucketlist_calender", "calender"),
+        Index("ix_bucketlist_updated_at", "updated_at"),
+        Index("ix_bucketlist_review_count", "review_count"),
     )
 
 
@@ -81,15 +96,18 @@ class Review(Base):
     updated_at = Column(DateTime, nullable=True)
     completed_at = Column(Date, nullable=True)
     # user 외래키
-    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
     user = relationship("User", backref="review_users")
     # bucketlist 외래키
-    bucketlist_id = Column(Integer, ForeignKey("bucketlist.id"), nullable=False)
+    bucketlist_id = Column(
+        Integer, ForeignKey("bucketlist.id"), nullable=False, index=True
+    )
     # Cascade 설정
     images = relationship(
         "Image",
         backref="review",
         cascade="all, delete-orphan",
+        order_by="Image.id",
     )
 
 
@@ -98,10 +116,44 @@ class Image(Base):
     __tablename__ = "image"
 
     id = Column(Integer, primary_key=True)
-    data = Column(String, nullable=False)
+    # 파일 URL (파일명은 내용 해시이므로 같은 파일을 여러 행이 참조할 수 있음, 참조 수 확인용 인덱스)
+    data = Column(String, nullable=False, index=True)
+    # 업로드 시 저장하는 파일 정보 (이전에 저장된 행은 None)
+    file_size = Column(Integer, nullable=True)  # byte
+    width = Column(Integer, nullable=True)  # px (EXIF 회전 반영)
+    height = Column(Integer, nullable=True)
+    mime_type = Column(String, nullable=True)  # magic bytes로 판별한 형식
+    content_hash = Column(String(64), nullable=True)  # sha256 (hex)
 
     # bucketlist 외래키
-    bucketlist_id = Column(Integer, ForeignKey("bucketlist.id"), nullable=True)
+    bucketlist_id = Column(
+        Integer, ForeignKey("bucketlist.id"), nullable=True, index=True
+    )
 
     # review 외래키
-    review_id = Column(Integer, ForeignKey("review.id"), nullable=True)
+    review_id = Column(Integer, ForeignKey("review.id"), nullable=True, index=True)
+    # 썸네일 / 반응형 변형 이미지 (domain/image/image_variant.py에서 생성)
+    variants = relationship(
+        "ImageVariant",
+        backref="image",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="(ImageVariant.size, ImageVariant.format)",
+    )
+
+
+# 이미지 변형 (크기 / 포맷별 리사이즈 이미지)
+class ImageVariant(Base):
+    __tablename__ = "image_variant"
+
+    id = Column(Integer, primary_key=True)
+    data = Column(String, nullable=False, index=True)
+    size = Column(Integer, nullable=False)  # 긴 변의 최대 길이 (px)
+    format = Column(String, nullable=False)  # webp / jpeg
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+
+    # image 외래키 (인덱스는 uq_image_variant_image_id 사용)
+    image_id = Column(Integer, ForeignKey("image.id"), nullable=False)
+
+    __table_args__ = (UniqueConstraint("image_id", "size", "format"),)
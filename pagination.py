@@ -0,0 +1,32 @@
+"""
+커서 페이지네이션의 cursor 문자열 (버킷리스트 / 회원 / 이미지 목록에서 공통 사용)
+
+- 마지막 행의 정렬 값들을 JSON 배열로 직렬화해서 URL-safe base64 (패딩 제거) 불투명(opaque) 문자열로 만든다.
+- 값의 검증 / 변환은 각 목록의 parse 함수에서 하고, ValueError / TypeError는 잘못된 cursor(400)로 처리한다.
+"""
+
+import base64
+import binascii
+import json
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException
+from starlette import status
+
+T = TypeVar("T")
+
+
+def encode_cursor(*values) -> str:
+    payload = json.dumps(list(values))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse: Callable[..., T]) -> T:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return parse(*json.loads(base64.urlsafe_b64decode(padded)))
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor 값입니다.",
+        )
@@ -17,6 +17,49 @@ def get_upload_dir():
     return os.getenv("UPLOAD_DIR")
 
 
+def get_storage_backend():
+    # 이미지 저장소 (local / s3)
+    return os.getenv("STORAGE_BACKEND", "local")
+
+
+def get_s3_bucket():
+    return os.getenv("S3_BUCKET")
+
+
+def get_s3_endpoint_url():
+    # S3 호환 스토리지 주소 (AWS S3는 비워두기, MinIO 등은 입력)
+    return os.getenv("S3_ENDPOINT_URL")
+
+
+def get_s3_region():
+    return os.getenv("S3_REGION")
+
+
+def get_s3_prefix():
+    # 이 앱이 사용하는 오브젝트 key 앞부분 (예 : hojin/images, 비워두면 버킷 전체)
+    return os.getenv("S3_PREFIX", "")
+
+
+def get_s3_public_url():
+    # 이미지 URL 앞부분 (CDN 주소 등, 비워두면 S3_ENDPOINT_URL/S3_BUCKET)
+    return os.getenv("S3_PUBLIC_URL")
+
+
+def get_upload_max_size():
+    # 업로드 파일 최대 크기 (byte, 기본값 30MB)
+    return int(os.getenv("UPLOAD_MAX_SIZE", 30 * 1024 * 1024))
+
+
+def get_upload_chunk_size():
+    # 업로드 파일을 나눠서 읽고 쓰는 크기 (byte, 기본값 1MB)
+    return int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+
+
+def get_image_upload_concurrency():
+    # 일괄 업로드에서 동시에 저장할 파일 수
+    return int(os.getenv("IMAGE_UPLOAD_CONCURRENCY", "4"))
+
+
 def get_access_token_expire_minutes():
     ACCESS_TOKEN_EXPIRE_MINUTES = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
     return int(float(ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -38,3 +81,111 @@ def get_sqlalchemy_database_url():
 def get_sqlalchemy_database_url_async():
 
     return os.getenv("SQLALCHEMY_DATABASE_URL_ASYNC")
+
+
+def get_sqlalchemy_database_url_async_read():
+    # 읽기 전용 복제본(read replica) 주소 (비워두면 모든 조회를 기본 DB에서)
+    return os.getenv("SQLALCHEMY_DATABASE_URL_ASYNC_READ")
+
+
+def get_read_after_write_seconds():
+    # 쓰기 후 조회를 기본 DB에서 하는 시간 (초, 복제 지연보다 길게)
+    return int(os.getenv("READ_AFTER_WRITE_SECONDS", "5"))
+
+
+def get_db_pool_size():
+    # 커넥션 풀에 유지할 연결 수
+    return int(os.getenv("DB_POOL_SIZE", "5"))
+
+
+def get_db_max_overflow():
+    # 풀이 모두 사용 중일 때 추가로 열 수 있는 연결 수
+    return int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+
+def get_db_pool_timeout():
+    # 연결을 기다리는 최대 시간 (초, 초과하면 오류)
+    return float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+
+def get_db_pool_recycle():
+    # 연결을 다시 만드는 주기 (초, -1 : 사용 안 함)
+    return int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+
+def get_db_pool_pre_ping():
+    # 연결을 꺼낼 때마다 살아있는지 확인 (true / false)
+    return os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
+
+def get_search_backend():
+    # fts : 전문 검색 인덱스 사용 (SQLite FTS5 / PostgreSQL tsvector) / like : ilike 검색
+    return os.getenv("SEARCH_BACKEND", "fts")
+
+
+def get_cache_backend():
+    # memory : 프로세스 내부 LRU 캐시 / redis : Redis 호환 서버 / none : 캐시 사용 안 함
+    return os.getenv("CACHE_BACKEND", "memory")
+
+
+def get_cache_ttl():
+    # 응답 캐시 유지 시간 (초)
+    return int(os.getenv("CACHE_TTL", "60"))
+
+
+def get_cache_max_size():
+    # memory 캐시에 저장할 최대 응답 수
+    return int(os.getenv("CACHE_MAX_SIZE", "10000"))
+
+
+def get_user_cache_backend():
+    # get_current_user의 로그인 유저 캐시 (memory / redis / none)
+    return os.getenv("USER_CACHE_BACKEND", "memory")
+
+
+def get_user_cache_ttl():
+    # 로그인 유저 캐시 유지 시간 (초)
+    return int(os.getenv("USER_CACHE_TTL", "300"))
+
+
+def get_user_cache_max_size():
+    return int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+
+def get_password_hash_workers():
+    # bcrypt 해싱 / 검증 스레드 수 (기본값 : CPU 코어 수)
+    return int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+
+
+def get_password_hash_queue_size():
+    # 스레드가 모두 사용 중일 때 기다릴 수 있는 요청 수 (초과하면 503)
+    return int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+
+
+def get_image_variant_workers():
+    # 썸네일 생성 프로세스 수 (기본값 : CPU 코어 수의 절반)
+    return int(os.getenv("IMAGE_VARIANT_WORKERS", max((os.cpu_count() or 1) // 2, 1)))
+
+
+def get_image_variant_queue_size():
+    # 프로세스가 모두 사용 중일 때 기다릴 수 있는 작업 수 (초과하면 업로드 직후 생성은 건너뜀)
+    return int(os.getenv("IMAGE_VARIANT_QUEUE_SIZE", "16"))
+
+
+def get_image_reaper_batch_size():
+    # 한 번에 삭제할 이미지 파일 수
+    return int(os.getenv("IMAGE_REAPER_BATCH_SIZE", "100"))
+
+
+def get_image_reaper_max_retries():
+    # 이미지 파일 삭제 실패 시 재시도 횟수
+    return int(os.getenv("IMAGE_REAPER_MAX_RETRIES", "3"))
+
+
+def get_image_reaper_grace_seconds():
+    # 최근에 저장 / 재사용된 이미지 파일은 이 시간(초)이 지난 뒤에 삭제 (업로드 중인 요청이 같은 파일을 참조할 수 있음)
+    return float(os.getenv("IMAGE_REAPER_GRACE_SECONDS", "60"))
+
+
+def get_redis_url():
+    return os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -7,6 +7,9 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from fastapi.testclient import TestClient
 from models import Image, User, BucketList, Review
 from database import Base, get_async_db
+from cache import response_cache
+from domain.user.user_cache import user_cache
+from domain.image.image_reaper import image_reaper
 from main import app
 import os
 import shutil
@@ -41,6 +44,8 @@ async def create_tables() -> AsyncGenerator[None, None]:
         await conn.run_sync(Base.metadata.drop_all)
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await response_cache.clear()
+    await user_cache.clear()
     yield
 
 
@@ -59,6 +64,12 @@ async def client(test_session):
     yield TestClient(app)
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def no_image_reaper_grace(monkeypatch):
+    """테스트에서 만든 파일은 모두 최근 파일이므로 유예 시간 없이 삭제"""
+    monkeypatch.setattr(image_reaper, "grace_seconds", 0)
+
+
 @pytest_asyncio.fixture
 async def override_upload_dir(monkeypatch):
     """UPLOAD_DIR를 ./image_file_test로 변경"""
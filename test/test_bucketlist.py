@@ -1,8 +1,15 @@
+from datetime import datetime, timedelta
 from typing import Sequence
+import csv
+import io
+import json
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import status
-from models import User, BucketList, Review
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.bucketlist import bucketlist_crud, bucketlist_export
+from models import User, BucketList, Review, Image
 from main import app
 
 client = TestClient(app)
@@ -46,7 +53,26 @@ async def test_read_bucketlist_with_one_bucketlist(
         == one_test_user.username
     )
     assert response.json()["bucketlist_list"][0]["user"]["email"] == one_test_user.email
-    assert response.json()["bucketlist_list"][0]["reviews"] == []
+    assert response.json()["bucketlist_list"][0]["review_count"] == 0
+    assert "reviews" not in response.json()["bucketlist_list"][0]
+
+
+# bucketlist GET 테스트 (요약 조회 / expand=reviews)
+@pytest.mark.asyncio
+async def test_read_bucketlist_list_expand_reviews(
+    one_test_review: Review, one_test_user: User
+) -> None:
+    response = client.get("/api/bucketlist/list")
+    assert response.json()["bucketlist_list"][0]["review_count"] == 1
+    assert "reviews" not in response.json()["bucketlist_list"][0]
+
+    response = client.get("/api/bucketlist/list?expand=reviews")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["bucketlist_list"][0]["review_count"] == 1
+    reviews = response.json()["bucketlist_list"][0]["reviews"]
+    assert len(reviews) == 1
+    assert reviews[0]["title"] == one_test_review.title
+    assert reviews[0]["user"]["username"] == one_test_user.username
 
 
 # bucketlist 15개 GET 테스트
@@ -93,6 +119,84 @@ async def test_read_bucketlist_with_fifteen_bucketlist_second_page(
     assert len(response.json()["bucketlist_list"]) == 5  # 2 페이지게시글 5개
 
 
+# bucketlist 15개 GET 테스트 (cursor 페이지네이션)
+@pytest.mark.asyncio
+async def test_read_bucketlist_with_fifteen_bucketlist_cursor(
+    fifteen_test_bucketlist: Sequence[BucketList],
+) -> None:
+    first_page = client.get("/api/bucketlist/list?size=10&cursor=").json()
+    assert first_page["total"] == 15
+    assert len(first_page["bucketlist_list"]) == 10
+    assert first_page["next_cursor"] is not None
+
+    second_page = client.get(
+        f"/api/bucketlist/list?size=10&cursor={first_page['next_cursor']}"
+    ).json()
+    assert len(second_page["bucketlist_list"]) == 5
+    assert second_page["next_cursor"] is None
+
+    # page/size 방식과 같은 순서로, 중복/누락 없이 전체 조회
+    cursor_ids = [
+        bucketlist["id"]
+        for page in (first_page, second_page)
+        for bucketlist in page["bucketlist_list"]
+    ]
+    offset_ids = [
+        bucketlist["id"]
+        for page in range(2)
+        for bucketlist in client.get(
+            f"/api/bucketlist/list?page={page}&size=10"
+        ).json()["bucketlist_list"]
+    ]
+    assert cursor_ids == offset_ids
+    assert sorted(cursor_ids) == sorted(b.id for b in fifteen_test_bucketlist)
+
+
+# bucketlist 15개 GET 테스트 (전체 건수 계산 방식)
+@pytest.mark.asyncio
+async def test_read_bucketlist_with_fifteen_bucketlist_count_mode(
+    fifteen_test_bucketlist: Sequence[BucketList],
+) -> None:
+    for count in ["exact", "cached", "estimated"]:
+        response = client.get(f"/api/bucketlist/list?count={count}")
+        assert response.json()["total"] == 15
+        assert len(response.json()["bucketlist_list"]) == 10
+
+    # 마지막 페이지를 넘어간 경우 / 건수 계산 안 함
+    response = client.get("/api/bucketlist/list?page=5&count=exact")
+    assert response.json()["total"] == 15
+    assert response.json()["bucketlist_list"] == []
+    response = client.get("/api/bucketlist/list?count=none")
+    assert response.json()["total"] is None
+    assert len(response.json()["bucketlist_list"]) == 10
+
+
+# bucketlist GET 테스트 (cached 건수는 버킷리스트 생성 시 갱신)
+@pytest.mark.asyncio
+async def test_read_bucketlist_cached_count_invalidated(
+    fifteen_test_bucketlist: Sequence[BucketList], test_login_and_get_token
+) -> None:
+    response = client.get("/api/bucketlist/list?count=cached")
+    assert response.json()["total"] == 15
+
+    client.post(
+        url="/api/bucketlist/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"title": "test_bucketlist_create_title"},
+    )
+    response = client.get("/api/bucketlist/list?count=cached")
+    assert response.json()["total"] == 16
+
+
+# bucketlist GET 실패 (잘못된 cursor)
+@pytest.mark.asyncio
+async def test_read_bucketlist_with_wrong_cursor() -> None:
+    response = client.get("/api/bucketlist/list?cursor=wrong_cursor")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "잘못된 cursor 값입니다."
+
+
 # bucketlist 15개 GET 테스트 (keyword 검색)
 @pytest.mark.asyncio
 async def test_read_bucketlist_with_fifteen_bucketlist_search(
@@ -108,6 +212,312 @@ async def test_read_bucketlist_with_fifteen_bucketlist_search(
     assert len(response.json()["bucketlist_list"]) == 1
 
 
+# bucketlist GET 테스트 (리뷰 내용 / 리뷰 작성자 keyword 검색)
+@pytest.mark.asyncio
+async def test_read_bucketlist_search_by_review(
+    one_test_review: Review, one_test_bucketlist: BucketList
+) -> None:
+    for keyword in ["one_test_review_content", "one_test_user"]:
+        response = client.get(f"/api/bucketlist/list?keyword={keyword}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 1
+        assert response.json()["bucketlist_list"][0]["id"] == one_test_bucketlist.id
+
+
+# bucketlist GET 테스트 (수정 / 삭제 후 검색 인덱스 반영)
+@pytest.mark.asyncio
+async def test_read_bucketlist_search_after_update_and_delete(
+    one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    client.put(
+        url="/api/bucketlist/update",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={
+            "bucketlist_id": one_test_bucketlist.id,
+            "title": "제주도 여행",
+            "content": "한라산 등반",
+        },
+    )
+    response = client.get("/api/bucketlist/list?keyword=한라")
+    assert response.json()["total"] == 1
+    response = client.get("/api/bucketlist/list?keyword=one_test_bucketlist_title")
+    assert response.json()["total"] == 0
+
+    client.delete(
+        url=f"/api/bucketlist/delete/{one_test_bucketlist.id}",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    response = client.get("/api/bucketlist/list?keyword=한라")
+    assert response.json()["total"] == 0
+
+
+# bucketlist GET 테스트 (작성자 username 변경 후 검색 인덱스 반영)
+@pytest.mark.asyncio
+async def test_read_bucketlist_search_after_username_change(
+    one_test_review: Review,
+    one_test_bucketlist: BucketList,
+    one_test_user: User,
+    test_session: AsyncSession,
+) -> None:
+    one_test_user.username = "renamed_user"
+    await test_session.commit()
+
+    response = client.get("/api/bucketlist/list?keyword=renamed_user")
+    assert response.json()["total"] == 1
+    assert response.json()["bucketlist_list"][0]["id"] == one_test_bucketlist.id
+    response = client.get("/api/bucketlist/list?keyword=one_test_user")
+    assert response.json()["total"] == 0
+
+
+# keyword 검색 (ilike) : EXISTS 쿼리와 기존 outerjoin + DISTINCT 쿼리의 결과 비교
+@pytest.mark.asyncio
+async def test_bucketlist_search_exists_matches_outerjoin_distinct(
+    fifty_test_users: Sequence[User], test_session: AsyncSession, monkeypatch
+) -> None:
+    monkeypatch.setenv("SEARCH_BACKEND", "like")
+    now = datetime.now()
+    bucketlists = [
+        BucketList(
+            title=f"bucketlist_{i}",
+            content="제주 여행" if i % 3 == 0 else f"content_{i}",
+            created_at=now - timedelta(minutes=i),
+            user=fifty_test_users[i % 5],
+        )
+        for i in range(30)
+    ]
+    reviews = [
+        Review(
+            title=f"review_{i}",
+            content="한라산 등반" if i % 4 == 0 else None,
+            created_at=now,
+            user=fifty_test_users[10 + i % 7],
+            bucketlist=bucketlists[i % 10],  # 리뷰가 여러 개인 버킷리스트
+        )
+        for i in range(60)
+    ]
+    test_session.add_all(bucketlists + reviews)
+    await test_session.commit()
+
+    # 기존 검색 쿼리 (리뷰 수만큼 행이 늘어난 뒤 DISTINCT)
+    async def outerjoin_distinct_ids(keyword: str) -> list[int]:
+        search = f"%%{keyword}%%"
+        review_user = (
+            select(Review.bucketlist_id, Review.title, Review.content, User.username)
+            .outerjoin(User, and_(Review.user_id == User.id))
+            .subquery()
+        )
+        result = await test_session.execute(
+            select(BucketList.id, BucketList.created_at)
+            .outerjoin(User)
+            .outerjoin(review_user, review_user.c.bucketlist_id == BucketList.id)
+            .filter(
+                BucketList.title.ilike(search)
+                | BucketList.content.ilike(search)
+                | User.username.ilike(search)
+                | review_user.c.title.ilike(search)
+                | review_user.c.content.ilike(search)
+                | review_user.c.username.ilike(search)
+            )
+            .distinct()
+            .order_by(BucketList.created_at.desc(), BucketList.id.desc())
+        )
+        return [row.id for row in result]
+
+    for keyword in ["제주", "한라산", "review_1", "test1", "test3", "_2", "없는검색어"]:
+        expected = await outerjoin_distinct_ids(keyword)
+        total, bucketlist_list, _ = await bucketlist_crud.get_bucketlist_list(
+            test_session, skip=0, limit=100, keyword=keyword
+        )
+        assert total == len(expected)
+        assert [bucketlist.id for bucketlist in bucketlist_list] == expected
+
+        # 페이지네이션도 버킷리스트 1개당 1행 기준으로 적용
+        _, second_page, _ = await bucketlist_crud.get_bucketlist_list(
+            test_session, skip=3, limit=3, keyword=keyword
+        )
+        assert [bucketlist.id for bucketlist in second_page] == expected[3:6]
+
+
+# bucketlist GET 테스트 (필터 / 정렬)
+@pytest.mark.asyncio
+async def test_read_bucketlist_with_filters_and_sort(
+    fifty_test_users: Sequence[User], test_session: AsyncSession
+) -> None:
+    now = datetime.now()
+    bucketlists = [
+        BucketList(
+            title=f"bucketlist_{i}",
+            created_at=now - timedelta(minutes=i),
+            category="여행" if i % 2 == 0 else "카페",
+            is_done=i % 3 == 0,
+            calender=(now + timedelta(days=i)).date(),
+            user=fifty_test_users[i % 2],
+        )
+        for i in range(10)
+    ]
+    reviews = [
+        Review(
+            title=f"review_{i}",
+            created_at=now,
+            user=fifty_test_users[0],
+            bucketlist=bucketlists[i % 4],  # 리뷰 수 : 3, 3, 2, 2, 0 ...
+        )
+        for i in range(10)
+    ]
+    test_session.add_all(bucketlists + reviews)
+    await test_session.commit()
+
+    def ids(url: str) -> list[int]:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return [bucketlist["id"] for bucketlist in response.json()["bucketlist_list"]]
+
+    response = client.get("/api/bucketlist/list?category=여행&is_done=true")
+    assert response.json()["total"] == 2  # 0, 6
+    assert ids(f"/api/bucketlist/list?user_id={fifty_test_users[1].id}") == [
+        bucketlists[i].id for i in range(1, 10, 2)
+    ]
+    calender_from = (now + timedelta(days=2)).date()
+    calender_to = (now + timedelta(days=4)).date()
+    assert ids(
+        f"/api/bucketlist/list?calender_from={calender_from}"
+        f"&calender_to={calender_to}&sort=calender&order=asc"
+    ) == [bucketlists[i].id for i in range(2, 5)]
+
+    response = client.get("/api/bucketlist/list?sort=review_count&size=4")
+    assert [b["review_count"] for b in response.json()["bucketlist_list"]] == [
+        3,
+        3,
+        2,
+        2,
+    ]
+
+
+# bucketlist GET 테스트 (review_count 정렬 cursor / cursor를 사용할 수 없는 정렬)
+@pytest.mark.asyncio
+async def test_read_bucketlist_cursor_with_sort(
+    fifteen_test_bucketlist: Sequence[BucketList], one_test_user: User, test_session
+) -> None:
+    test_session.add_all(
+        Review(
+            title=f"review_{i}",
+            created_at=datetime.now(),
+            user=one_test_user,
+            bucketlist=fifteen_test_bucketlist[i],
+        )
+        for i in range(5)
+    )
+    await test_session.commit()
+
+    first_page = client.get("/api/bucketlist/list?sort=review_count&size=10").json()
+    second_page = client.get(
+        f"/api/bucketlist/list?sort=review_count&size=10"
+        f"&cursor={first_page['next_cursor']}"
+    ).json()
+    cursor_list = first_page["bucketlist_list"] + second_page["bucketlist_list"]
+    assert [b["review_count"] for b in cursor_list] == [1] * 5 + [0] * 10
+    assert len({b["id"] for b in cursor_list}) == 15
+
+    # 다른 정렬로 만든 cursor
+    response = client.get(f"/api/bucketlist/list?cursor={first_page['next_cursor']}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = client.get(
+        f"/api/bucketlist/list?sort=updated_at&cursor={first_page['next_cursor']}"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == (
+        "cursor는 created_at / review_count 정렬에서만 사용할 수 있습니다."
+    )
+
+
+# bucketlist 내보내기 (NDJSON : 버킷리스트 1개당 1줄, 배치 단위 스트리밍)
+@pytest.mark.asyncio
+async def test_export_bucketlist_ndjson(
+    fifteen_test_bucketlist: Sequence[BucketList],
+    one_test_user: User,
+    test_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(bucketlist_export, "EXPORT_BATCH_SIZE", 4)
+    test_session.add(
+        Review(
+            title="export_review",
+            created_at=datetime.now(),
+            user=one_test_user,
+            bucketlist=fifteen_test_bucketlist[2],
+        )
+    )
+    await test_session.commit()
+
+    response = client.get("/api/bucketlist/export")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == sorted(
+        b.id for b in fifteen_test_bucketlist
+    )
+    assert lines[2]["reviews"][0]["title"] == "export_review"
+    assert lines[2]["user"]["username"] == one_test_user.username
+
+
+# bucketlist 내보내기 (CSV : 리뷰 1개당 1행 / since 이후 변경분만)
+@pytest.mark.asyncio
+async def test_export_bucketlist_csv_since(
+    one_test_user: User, test_session: AsyncSession
+) -> None:
+    now = datetime.now()
+    old_bucketlist = BucketList(
+        title="old_bucketlist", created_at=now - timedelta(days=2), user=one_test_user
+    )
+    reviewed_bucketlist = BucketList(
+        title="reviewed_bucketlist",
+        created_at=now - timedelta(days=2),
+        user=one_test_user,
+    )
+    new_bucketlist = BucketList(
+        title="new_bucketlist", created_at=now, user=one_test_user
+    )
+    test_session.add_all(
+        [
+            old_bucketlist,
+            reviewed_bucketlist,
+            new_bucketlist,
+            Review(
+                title="new_review",
+                created_at=now,
+                user=one_test_user,
+                bucketlist=reviewed_bucketlist,
+            ),
+            Review(
+                title="new_review_2",
+                created_at=now,
+                user=one_test_user,
+                bucketlist=reviewed_bucketlist,
+            ),
+        ]
+    )
+    await test_session.commit()
+
+    response = client.get("/api/bucketlist/export?format=csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert response.headers["content-type"].startswith("text/csv")
+    assert len(rows) == 4  # 리뷰 없는 버킷리스트 2개 + 리뷰 2개
+
+    since = (now - timedelta(days=1)).isoformat()
+    response = client.get(f"/api/bucketlist/export?format=csv&since={since}")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["title"], row["review_title"]) for row in rows] == [
+        ("reviewed_bucketlist", "new_review"),
+        ("reviewed_bucketlist", "new_review_2"),
+        ("new_bucketlist", ""),
+    ]
+
+    response = client.get(f"/api/bucketlist/export?format=csv&since={now.isoformat()}T")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 # 특정 bucketlist GET 성공
 @pytest.mark.asyncio
 async def test_read_bucketlist_detail_success(
@@ -127,6 +537,34 @@ async def test_read_bucketlist_detail_success(
     assert response.json()["user"]["username"] == one_test_user.username
 
 
+# 특정 bucketlist GET 성공 (expand=images : 이미지 목록 포함, 캐시된 응답에 영향 없음)
+@pytest.mark.asyncio
+async def test_read_bucketlist_detail_expand_images(
+    one_test_bucketlist: BucketList, test_session: AsyncSession
+) -> None:
+    url = f"/api/bucketlist/detail/{one_test_bucketlist.id}"
+    assert "images" not in client.get(url).json()  # 캐시 저장
+    test_session.add_all(
+        [
+            Image(
+                data=f"http://127.0.0.1:8000/image_file\\{i}.png",
+                bucketlist_id=one_test_bucketlist.id,
+                width=10 * i,
+            )
+            for i in range(1, 4)
+        ]
+    )
+    await test_session.commit()
+
+    response = client.get(url, params={"expand": "images"})
+    assert response.status_code == status.HTTP_200_OK
+    images = response.json()["images"]
+    assert [image["id"] for image in images] == [1, 2, 3]
+    assert [image["width"] for image in images] == [10, 20, 30]
+    assert "variants" not in images[0]
+    assert "images" not in client.get(url).json()
+
+
 # 특정 bucketlist GET 실패
 @pytest.mark.asyncio
 async def test_read_bucketlist_detail_failure(one_test_bucketlist: BucketList) -> None:
@@ -335,3 +773,109 @@ async def test_delete_bucketlist_unauthorized(
         headers={"Authorization": f"Bearer wrong{test_login_and_get_token}"},
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# bucketlist 일괄 생성 POST (항목별 결과 / 한 번에 저장)
+@pytest.mark.asyncio
+async def test_bulk_create_bucketlist(
+    one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    items = [{"title": f"bulk_title_{i}", "content": "제주 여행"} for i in range(200)]
+    items += [
+        {"title": one_test_bucketlist.title},  # 이미 있는 제목
+        {"title": "bulk_title_0"},  # 같은 배치 안의 중복
+        {"title": " "},  # 빈 제목
+        {"title": "bulk_title_category", "category": "없는카테고리"},
+    ]
+    response = client.post(
+        url="/api/bucketlist/bulk/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json=items,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["success_count"] == 200
+    assert response.json()["failure_count"] == 4
+    results = response.json()["results"]
+    assert [result["index"] for result in results] == list(range(204))
+    assert {result["status"] for result in results[:200]} == {201}
+    assert [result["status"] for result in results[200:]] == [406, 406, 422, 422]
+    assert results[200]["detail"] == "입력한 제목이 이미 존재합니다."
+
+    detail = client.get(f"/api/bucketlist/detail/{results[7]['id']}").json()
+    assert detail["title"] == "bulk_title_7"
+    response = client.get("/api/bucketlist/list?keyword=제주")
+    assert response.json()["total"] == 200
+
+
+# bucketlist 일괄 수정 PUT / 삭제 POST
+@pytest.mark.asyncio
+async def test_bulk_update_and_delete_bucketlist(
+    fifteen_test_bucketlist: Sequence[BucketList],
+    one_test_user: User,
+    fifty_test_users: Sequence[User],
+    test_session: AsyncSession,
+    test_login_and_get_token,
+) -> None:
+    other_bucketlist = BucketList(
+        title="other_user_bucketlist",
+        created_at=datetime.now(),
+        user=fifty_test_users[0],
+    )
+    test_session.add(
+        Review(
+            title="review",
+            created_at=datetime.now(),
+            user=one_test_user,
+            bucketlist=fifteen_test_bucketlist[1],
+        )
+    )
+    test_session.add(other_bucketlist)
+    await test_session.commit()
+    headers = {"Authorization": f"Bearer {test_login_and_get_token}"}
+
+    response = client.put(
+        url="/api/bucketlist/bulk/update",
+        headers=headers,
+        json=[
+            {"bucketlist_id": fifteen_test_bucketlist[0].id, "title": "한라산 등반"},
+            {"bucketlist_id": fifteen_test_bucketlist[1].id, "title": "새 제목"},
+            {"bucketlist_id": fifteen_test_bucketlist[2].id, "title": "새 제목"},
+            {"bucketlist_id": other_bucketlist.id, "title": "권한 없음"},
+            {"bucketlist_id": 9999, "title": "없는 게시글"},
+        ],
+    )
+    assert [result["status"] for result in response.json()["results"]] == [
+        200,
+        200,
+        406,
+        400,
+        400,
+    ]
+    response = client.get("/api/bucketlist/list?keyword=한라산")
+    assert response.json()["bucketlist_list"][0]["id"] == fifteen_test_bucketlist[0].id
+
+    response = client.post(
+        url="/api/bucketlist/bulk/delete",
+        headers=headers,
+        json={
+            "ids": [
+                fifteen_test_bucketlist[0].id,
+                fifteen_test_bucketlist[1].id,
+                other_bucketlist.id,
+                9999,
+            ]
+        },
+    )
+    assert [result["status"] for result in response.json()["results"]] == [
+        204,
+        204,
+        400,
+        400,
+    ]
+    response = client.get("/api/bucketlist/list?keyword=한라산")
+    assert response.json()["total"] == 0
+    response = client.get("/api/bucketlist/list")
+    assert response.json()["total"] == 14  # 15개 중 2개 삭제 + 다른 유저 1개
+    reviews = await test_session.execute(select(Review))
+    assert reviews.scalars().all() == []
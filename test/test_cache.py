@@ -0,0 +1,246 @@
+import asyncio
+import fnmatch
+import time
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+import cache
+from cache import MemoryCache, RedisCache, response_cache
+from domain.user.user_cache import user_cache, user_key
+from models import BucketList, Review, User
+from main import app
+
+client = TestClient(app)
+
+
+# 테스트용 Redis (redis.asyncio.Redis에서 캐시가 사용하는 명령만 구현)
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.ttl[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        self.ttl[key] = seconds
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+# memory 캐시 : LRU / TTL
+@pytest.mark.asyncio
+async def test_memory_cache_lru_and_ttl(monkeypatch) -> None:
+    memory_cache = MemoryCache(max_size=2, default_ttl=60)
+    await memory_cache.set("a", {"id": 1})
+    await memory_cache.set("b", {"id": 2})
+    assert await memory_cache.get("a") == {"id": 1}  # a를 최근 사용으로 변경
+    await memory_cache.set("c", {"id": 3})  # 가장 오래된 b 삭제
+
+    assert await memory_cache.get("b") is None
+    assert await memory_cache.get("c") == {"id": 3}
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert await memory_cache.get("a") is None
+    assert memory_cache.stats()["hits"] == 2
+    assert memory_cache.stats()["misses"] == 2
+
+
+# redis 캐시 : 저장 / 삭제 / 버전
+@pytest.mark.asyncio
+async def test_redis_cache_with_fake_redis() -> None:
+    redis_cache = RedisCache(FakeRedis(), default_ttl=30)
+    await redis_cache.set("bucketlist:detail:1", {"id": 1, "title": "제목"})
+
+    assert await redis_cache.get("bucketlist:detail:1") == {"id": 1, "title": "제목"}
+    assert redis_cache.client.ttl["hojin:bucketlist:detail:1"] == 30
+
+    await redis_cache.delete("bucketlist:detail:1")
+    assert await redis_cache.get("bucketlist:detail:1") is None
+
+    assert await redis_cache.get_version("bucketlist:list:version") == 0
+    await redis_cache.incr("bucketlist:list:version")
+    assert await redis_cache.get_version("bucketlist:list:version") == 1
+
+    await redis_cache.incr("bucketlist:detail:1:generation", ttl=3600)
+    assert redis_cache.client.ttl["hojin:bucketlist:detail:1:generation"] == 3600
+
+    await redis_cache.clear()
+    assert redis_cache.client.data == {}
+
+
+# 상세 조회 중에 무효화되면 조회 결과를 캐시에 남기지 않음 (세대 확인)
+@pytest.mark.asyncio
+async def test_set_detail_skips_value_invalidated_during_read(monkeypatch) -> None:
+    monkeypatch.setattr(
+        cache, "response_cache", MemoryCache(max_size=2, default_ttl=60)
+    )
+    key = cache.detail_key("bucketlist", 1)
+    generation = await cache.detail_generation(key)  # 조회 시작 (DB 읽기 전)
+    await cache.invalidate_detail("bucketlist", 1)  # 그 사이 수정 commit
+    await cache.set_detail(key, {"title": "이전 제목"}, generation)
+    assert await cache.response_cache.get(key) is None
+
+    generation = await cache.detail_generation(key)
+    await cache.set_detail(key, {"title": "새 제목"}, generation)
+    assert await cache.response_cache.get(key) == {"title": "새 제목"}
+
+    # 세대는 만료되면 0 (max_size번 올릴 때마다 만료된 세대 정리)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + cache.GENERATION_TTL + 1)
+    assert await cache.detail_generation(key) == 0
+    await cache.invalidate_detail("bucketlist", 2, 3)
+    assert len(cache.response_cache._versions) == 2
+
+
+# 상세 조회 캐시 적중 / 수정 시 무효화
+@pytest.mark.asyncio
+async def test_bucketlist_detail_cache_invalidated_on_update(
+    one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    response = client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    assert response.json()["title"] == one_test_bucketlist.title
+    assert response_cache.stats()["hits"] == 1
+
+    client.put(
+        url="/api/bucketlist/update",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={
+            "bucketlist_id": one_test_bucketlist.id,
+            "title": "updated_one_test_bucketlist_title",
+        },
+    )
+    response = client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    assert response.json()["title"] == "updated_one_test_bucketlist_title"
+
+
+# 리뷰 수정 시 리뷰 / 버킷리스트 상세 / 목록 캐시 무효화
+@pytest.mark.asyncio
+async def test_review_update_invalidates_related_cache(
+    one_test_review: Review,
+    one_test_bucketlist: BucketList,
+    test_login_and_get_token,
+) -> None:
+    client.get(f"/api/review/detail/{one_test_review.id}")
+    client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    client.get("/api/bucketlist/list?expand=reviews")
+
+    client.put(
+        url="/api/review/update",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"review_id": one_test_review.id, "title": "updated_review_title"},
+    )
+
+    review = client.get(f"/api/review/detail/{one_test_review.id}").json()
+    bucketlist = client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}").json()
+    bucketlist_list = client.get("/api/bucketlist/list?expand=reviews").json()
+    assert review["title"] == "updated_review_title"
+    assert bucketlist["reviews"][0]["title"] == "updated_review_title"
+    assert bucketlist_list["bucketlist_list"][0]["reviews"][0]["title"] == (
+        "updated_review_title"
+    )
+    assert response_cache.stats()["hits"] == 0
+
+
+# 캐시 적중률 GET
+@pytest.mark.asyncio
+async def test_cache_metrics(one_test_bucketlist: BucketList) -> None:
+    client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    response = client.get("/api/metrics/cache")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["response_cache"]["backend"] == "memory"
+    assert response.json()["response_cache"]["hits"] == 1
+    assert response.json()["response_cache"]["misses"] == 1
+    assert response.json()["response_cache"]["hit_rate"] == 0.5
+
+
+# 로그인 유저 캐시 : 두 번째 인증 요청부터 유저 SELECT 없이 처리
+@pytest.mark.asyncio
+async def test_user_cache_hit(test_login_and_get_token, one_test_user: User) -> None:
+    headers = {"Authorization": f"Bearer {test_login_and_get_token}"}
+    for i in range(3):
+        response = client.post(
+            url="/api/bucketlist/create",
+            headers=headers,
+            json={"title": f"user_cache_title_{i}"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    snapshot = await user_cache.get(user_key(one_test_user.username))
+    assert snapshot["id"] == one_test_user.id
+    assert "password" not in snapshot  # 비밀번호 해시는 캐시하지 않음
+    response = client.get("/api/bucketlist/list")
+    assert {b["user"]["id"] for b in response.json()["bucketlist_list"]} == {
+        one_test_user.id
+    }
+    metrics = client.get("/api/metrics/cache").json()["user_cache"]
+    assert metrics["misses"] == 1
+    assert metrics["hits"] == 3  # 요청 2번 + 위의 get 1번
+
+
+# 로그인 유저 캐시 : 유저 수정 commit 후 무효화 (변경 전 username 포함)
+@pytest.mark.asyncio
+async def test_user_cache_invalidated_on_update(
+    test_login_and_get_token, one_test_user: User, test_session: AsyncSession
+) -> None:
+    client.post(
+        url="/api/bucketlist/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"title": "user_cache_title"},
+    )
+    assert await user_cache.get(user_key("one_test_user")) is not None
+
+    user = await test_session.get(User, one_test_user.id)
+    user.username = "renamed_test_user"
+    user.is_active = False
+    await test_session.commit()
+    await asyncio.sleep(0)  # commit 후 예약된 캐시 삭제 실행
+
+    assert await user_cache.get(user_key("one_test_user")) is None
+
+    # 변경 전 username으로 발급된 토큰은 더 이상 인증되지 않음
+    response = client.post(
+        url="/api/bucketlist/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"title": "user_cache_title_2"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# 로그인 유저 캐시 : 유저 삭제 commit 후 무효화
+@pytest.mark.asyncio
+async def test_user_cache_invalidated_on_delete(
+    test_login_and_get_token, one_test_user: User, test_session: AsyncSession
+) -> None:
+    client.put(  # 인증 후 400 (작성한 글이 있으면 유저를 삭제할 수 없으므로)
+        url="/api/bucketlist/update",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"bucketlist_id": 9999, "title": "없는 게시글"},
+    )
+    assert await user_cache.get(user_key("one_test_user")) is not None
+
+    await test_session.delete(await test_session.get(User, one_test_user.id))
+    await test_session.commit()
+    await asyncio.sleep(0)
+
+    assert await user_cache.get(user_key("one_test_user")) is None
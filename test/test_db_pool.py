@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import status
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from db_pool import PoolMetrics, pool_options, pool_stats
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def small_pool_engine(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_POOL_SIZE", "1")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "1")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "0.2")
+    url = f"sqlite+aiosqlite:///{tmp_path}/pool.db"
+    metrics = PoolMetrics()
+    return create_async_engine(url, **pool_options(url, metrics)), metrics
+
+
+# 풀 설정 (메모리 DB는 풀 설정 없음)
+def test_pool_options(monkeypatch) -> None:
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+    options = pool_options("postgresql+asyncpg://user@db/hojin", PoolMetrics())
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is True
+    assert pool_options("sqlite+aiosqlite://", PoolMetrics()) == {}
+
+
+# 풀이 모두 사용 중이면 기다리고, DB_POOL_TIMEOUT을 넘으면 오류 (통계에 기록)
+@pytest.mark.asyncio
+async def test_pool_saturation_stats(small_pool_engine) -> None:
+    engine, metrics = small_pool_engine
+    first = await engine.connect()
+    second = await engine.connect()  # overflow 연결
+    stats = pool_stats(engine.pool, metrics)
+    assert (stats["checked_out"], stats["overflow"]) == (2, 1)
+
+    with pytest.raises(exc.TimeoutError):
+        await engine.connect()
+
+    async def release_later():
+        await asyncio.sleep(0.05)
+        await second.close()
+
+    release = asyncio.create_task(release_later())
+    async with engine.connect() as third:  # 반납될 때까지 대기
+        assert (await third.execute(text("SELECT 1"))).scalar() == 1
+    await release
+    await first.close()
+
+    stats = pool_stats(engine.pool, metrics)
+    assert stats["pool_class"] == "TimedQueuePool"
+    assert (stats["size"], stats["max_overflow"], stats["timeout"]) == (1, 1, 0.2)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 4
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 200
+    waited = sum(
+        b["count"] for b in stats["wait_histogram"] if (b["le_ms"] or 1e9) > 50
+    )
+    assert waited == 2  # 시간 초과 1번 + 반납 대기 1번
+    await engine.dispose()
+
+
+# 커넥션 풀 상태 GET
+@pytest.mark.asyncio
+async def test_db_pool_metrics() -> None:
+    response = client.get("/api/metrics/db_pool")
+
+    assert response.status_code == status.HTTP_200_OK
+    primary = response.json()["primary"]
+    assert primary["pool_class"] == "TimedQueuePool"
+    assert primary["size"] == 5
+    assert len(primary["wait_histogram"]) == 13
+    assert primary["wait_histogram"][-1]["le_ms"] is None
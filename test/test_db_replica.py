@@ -0,0 +1,110 @@
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import cache
+import database
+from database import Base
+from db_replica import READ_PRIMARY_COOKIE
+from models import BucketList
+from main import app
+
+client = TestClient(app)
+
+
+# 읽기 전용 복제본 (별도 SQLite 파일, 기본 DB에서 복제되지 않으므로 비어있음)
+@pytest_asyncio.fixture
+async def replica(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    monkeypatch.setattr(
+        database,
+        "AsyncReadSessionLocal",
+        async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    client.cookies.clear()
+    yield engine
+    client.cookies.clear()
+    await engine.dispose()
+
+
+# 조회는 복제본에서, 쓰기 후에는 read_primary 쿠키가 있는 동안 기본 DB에서 조회
+@pytest.mark.asyncio
+async def test_read_replica_routing(
+    replica, one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    url = f"/api/bucketlist/detail/{one_test_bucketlist.id}"
+    response = client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND  # 복제본에는 없음
+    assert response.json() == {"detail": "해당 게시글을 찾을 수 없습니다."}
+    assert client.get("/api/bucketlist/list").json()["total"] == 0
+    assert READ_PRIMARY_COOKIE not in client.cookies  # 조회만 한 요청
+
+    response = client.post(
+        url="/api/bucketlist/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"title": "read_your_writes"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Max-Age=5" in response.headers["set-cookie"]
+    assert client.cookies[READ_PRIMARY_COOKIE] == "1"
+
+    response = client.get(url)  # 쿠키가 있으면 기본 DB
+    assert response.status_code == status.HTTP_200_OK
+    assert client.get("/api/bucketlist/list").json()["total"] == 2
+
+    client.cookies.clear()  # 쿠키 만료 후에는 다시 복제본
+    response = client.get("/api/review/detail/1")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/api/user/").json()["data"] == []
+
+
+# 복제본에서 읽은 값도 응답 캐시에 저장하고, read_primary 쿠키가 있으면 캐시를 읽지도 저장하지도 않음
+@pytest.mark.asyncio
+async def test_read_replica_response_cache(
+    replica, one_test_bucketlist: BucketList
+) -> None:
+    list_url = "/api/bucketlist/list"
+    assert client.get(list_url).json()["total"] == 0  # 복제본 (캐시에 저장)
+    assert cache.response_cache.stats()["size"] == 1
+    hits = cache.response_cache.stats()["hits"]
+    assert client.get(list_url).json()["total"] == 0
+    assert cache.response_cache.stats()["hits"] == hits + 1
+
+    client.cookies.set(READ_PRIMARY_COOKIE, "1")
+    assert client.get(list_url).json()["total"] == 1  # 캐시를 건너뛰고 기본 DB
+    assert client.get(list_url, params={"count": "cached"}).json()["total"] == 1
+    url = f"/api/bucketlist/detail/{one_test_bucketlist.id}"
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert cache.response_cache.stats()["size"] == 1  # 쿠키가 있는 요청은 저장 안 함
+    assert cache.response_cache.stats()["hits"] == hits + 1
+
+    # 쿠키가 있으면 캐시된 값을 무시하고, 쿠키가 없으면 캐시된 값 사용
+    stale = {**response.json(), "title": "stale"}
+    await cache.response_cache.set(
+        cache.detail_key("bucketlist", one_test_bucketlist.id), stale
+    )
+    assert client.get(url).json()["title"] == one_test_bucketlist.title
+    client.cookies.clear()
+    assert client.get(url).json()["title"] == "stale"
+
+
+# 복제본이 없으면 쿠키 없이 기본 DB에서 조회
+@pytest.mark.asyncio
+async def test_read_without_replica(
+    one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    assert database.AsyncReadSessionLocal is None
+    response = client.post(
+        url="/api/bucketlist/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        json={"title": "no_replica"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "set-cookie" not in response.headers
+
+    response = client.get(f"/api/bucketlist/detail/{one_test_bucketlist.id}")
+    assert response.status_code == status.HTTP_200_OK
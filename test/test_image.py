@@ -1,6 +1,15 @@
+import hashlib
+import io
+import os
 import pytest
+from PIL import Image as PILImage
 from fastapi.testclient import TestClient
 from fastapi import status, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.image import image_reaper as image_reaper_module
+from domain.image import image_crud, image_schema, image_variant
+from domain.image.image_reaper import image_reaper
+from domain.image.image_storage import LocalStorage
 from models import User, BucketList, Review, Image
 from main import app
 
@@ -179,6 +188,627 @@ async def test_create_image_with_both_id(
     )
 
 
+# 이미지 생성 POST 성공 (청크 단위로 나눠서 저장한 파일 내용 확인)
+@pytest.mark.asyncio
+async def test_create_image_saved_in_chunks(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    monkeypatch.setenv("UPLOAD_CHUNK_SIZE", "7")
+    content = bytes(range(256)) * 10
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files={"file": ("test_image.jpg", content, "image/jpeg")},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    filename = response.json()["data"].split("\\")[-1]
+    with open(os.path.join(override_upload_dir, filename), "rb") as fp:
+        assert fp.read() == content
+    assert not [
+        name for name in os.listdir(override_upload_dir) if name.endswith(".part")
+    ]
+
+
+# 이미지 생성 POST 실패 (최대 크기 초과 -> 파일이 남지 않음)
+@pytest.mark.asyncio
+async def test_create_image_too_large(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    monkeypatch.setenv("UPLOAD_MAX_SIZE", "100")
+    monkeypatch.setenv("UPLOAD_CHUNK_SIZE", "30")
+    before = set(os.listdir(override_upload_dir))
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files={"file": ("test_image.jpg", b"x" * 101, "image/jpeg")},
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert set(os.listdir(override_upload_dir)) == before
+
+
+# 이미지 생성 POST 실패 (권한 확인 실패 시 파일을 쓰지 않음)
+@pytest.mark.asyncio
+async def test_create_image_unauthorized_writes_nothing(
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+    one_test_review: Review,
+    image_file: UploadFile,
+) -> None:
+    before = set(os.listdir(override_upload_dir))
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={
+            "bucketlist_id": one_test_bucketlist.id,
+            "review_id": one_test_review.id,
+        },
+        files={"file": ("test_image.jpg", b"image data", "image/jpeg")},
+    )
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
+    assert set(os.listdir(override_upload_dir)) == before
+
+
+# 이미지 생성 POST 실패 (DB 저장 실패 -> 새 파일 삭제, 그 사이 같은 파일을 참조하는 행이 commit 되면 남김)
+@pytest.mark.asyncio
+async def test_create_image_db_error_discards_unreferenced_file(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    content = b"db error image data"
+    path = os.path.join(
+        override_upload_dir, f"{hashlib.sha256(content).hexdigest()}.bin"
+    )
+
+    for reused in (False, True):
+
+        async def create_image_failing(db, bucketlist_id, review_id, **columns):
+            if reused:  # 다른 요청이 같은 파일을 재사용해서 먼저 commit
+                db.add(Image(data=columns["data"], bucketlist_id=bucketlist_id))
+                await db.commit()
+            raise RuntimeError("DB 저장 실패")
+
+        monkeypatch.setattr(image_crud, "create_image", create_image_failing)
+        with pytest.raises(RuntimeError):
+            client.post(
+                url="/api/image/create",
+                headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+                params={"bucketlist_id": one_test_bucketlist.id},
+                files={"file": ("test_image.jpg", content, "image/jpeg")},
+            )
+        image_reaper.join(timeout=5)
+        assert os.path.exists(path) is reused
+
+
+# 테스트용 PNG 이미지
+def png_bytes(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (width, height), (200, 80, 40)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# 이미지 생성 POST 성공 (업로드 후 썸네일 / 반응형 변형 이미지 생성)
+@pytest.mark.asyncio
+async def test_create_image_generates_variants(
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files={"file": ("test_image.png", png_bytes(2000, 1000), "image/png")},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = client.get(url="/api/image/detail/1")
+    variants = response.json()["variants"]
+    assert [(v["size"], v["format"], v["width"], v["height"]) for v in variants] == [
+        (128, "jpeg", 128, 64),
+        (128, "webp", 128, 64),
+        (512, "jpeg", 512, 256),
+        (512, "webp", 512, 256),
+        (1024, "jpeg", 1024, 512),
+        (1024, "webp", 1024, 512),
+    ]
+    for variant in variants:
+        filename = variant["data"].split("\\")[-1]
+        with PILImage.open(os.path.join(override_upload_dir, filename)) as image:
+            assert image.format == variant["format"].upper()
+            assert image.size == (variant["width"], variant["height"])
+
+    # 이미지 삭제 시 변형 이미지 파일도 삭제
+    response = client.delete(
+        url="/api/image/delete/1",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    image_reaper.join(timeout=5)
+    for variant in variants:
+        filename = variant["data"].split("\\")[-1]
+        assert not os.path.exists(os.path.join(override_upload_dir, filename))
+
+
+# 이미지 생성 POST 성공 (파일 내용으로 형식 / 크기 / 가로 세로 / 해시 저장)
+@pytest.mark.asyncio
+async def test_create_image_stores_file_info(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    monkeypatch.setenv(
+        "UPLOAD_CHUNK_SIZE", "5"
+    )  # magic bytes가 여러 청크로 나뉘어도 판별
+    content = png_bytes(800, 400)
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files={"file": ("photo.jpg", content, "image/jpeg")},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    content_hash = hashlib.sha256(content).hexdigest()
+    assert response.json()["data"].endswith(f"\\{content_hash}.png")
+
+    image = client.get(url="/api/image/detail/1").json()
+    assert image["file_size"] == len(content)
+    assert (image["width"], image["height"]) == (800, 400)
+    assert image["mime_type"] == "image/png"
+    assert image["content_hash"] == content_hash
+
+
+# 이미지 생성 POST 성공 (EXIF 회전 반영 / 판별할 수 없는 파일)
+@pytest.mark.asyncio
+async def test_create_image_file_info_rotated_and_unknown(
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    exif = PILImage.Exif()
+    exif[0x0112] = 6  # 90도 회전
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (300, 100)).save(buffer, format="JPEG", exif=exif)
+    for content in (buffer.getvalue(), b"image data"):
+        response = client.post(
+            url="/api/image/create",
+            headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+            params={"bucketlist_id": one_test_bucketlist.id},
+            files={"file": ("test_image.png", content, "image/png")},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    rotated = client.get(url="/api/image/detail/1").json()
+    assert rotated["data"].endswith(".jpg")
+    assert (rotated["width"], rotated["height"]) == (100, 300)
+    assert rotated["mime_type"] == "image/jpeg"
+    unknown = client.get(url="/api/image/detail/2").json()
+    assert unknown["data"].endswith(".bin")
+    assert (unknown["width"], unknown["height"]) == (None, None)
+    assert unknown["mime_type"] == "application/octet-stream"
+    assert unknown["file_size"] == len(b"image data")
+
+
+# 이미지 일괄 생성 POST (파일별 결과, 성공한 파일만 저장)
+@pytest.mark.asyncio
+async def test_bulk_create_images(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_review: Review,
+) -> None:
+    monkeypatch.setenv("UPLOAD_MAX_SIZE", "2000")
+    monkeypatch.setenv("IMAGE_UPLOAD_CONCURRENCY", "2")
+    before = set(os.listdir(override_upload_dir))
+    small = png_bytes(30, 20)
+    response = client.post(
+        url="/api/image/bulk/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"review_id": one_test_review.id},
+        files=[
+            ("files", ("a.png", small, "image/png")),
+            ("files", ("large.jpg", b"x" * 2001, "image/jpeg")),
+            ("files", ("b.png", png_bytes(20, 30), "image/png")),
+            ("files", ("a_copy.png", small, "image/png")),
+        ],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert (body["success_count"], body["failure_count"]) == (3, 1)
+    results = body["results"]
+    assert [r["status"] for r in results] == [201, 413, 201, 201]
+    assert [r["filename"] for r in results] == [
+        "a.png",
+        "large.jpg",
+        "b.png",
+        "a_copy.png",
+    ]
+    assert results[1]["id"] is None and results[1]["data"] is None
+    assert results[0]["data"] == results[3]["data"]  # 같은 내용은 파일 1개
+
+    image = client.get(url=f"/api/image/detail/{results[2]['id']}").json()
+    assert image["review_id"] == one_test_review.id
+    assert (image["width"], image["height"]) == (20, 30)
+    stored = {
+        name
+        for name in set(os.listdir(override_upload_dir)) - before
+        if "_" not in name  # 변형 이미지 제외
+    }
+    assert stored == {r["data"].split("\\")[-1] for r in results if r["data"]}
+
+
+# 이미지 일괄 생성 POST 실패 (파일 수 초과 / 권한 없음 -> 파일을 쓰지 않음)
+@pytest.mark.asyncio
+async def test_bulk_create_images_rejected(
+    monkeypatch,
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    monkeypatch.setattr(image_schema, "BULK_MAX_FILES", 2)
+    before = set(os.listdir(override_upload_dir))
+    files = [
+        ("files", (f"{i}.png", png_bytes(10, 10 + i), "image/png")) for i in range(3)
+    ]
+    response = client.post(
+        url="/api/image/bulk/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files=files,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "이미지는 한 번에 2개까지 업로드할 수 있습니다."
+
+    response = client.post(
+        url="/api/image/bulk/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id + 1},
+        files=files[:2],
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert set(os.listdir(override_upload_dir)) == before
+
+
+# 버킷리스트 / 리뷰 이미지 목록 GET (cursor 페이지네이션)
+@pytest.mark.asyncio
+async def test_get_image_list(
+    test_session: AsyncSession,
+    one_test_bucketlist: BucketList,
+    one_test_review: Review,
+) -> None:
+    test_session.add_all(
+        [
+            Image(
+                data=f"http://127.0.0.1:8000/image_file\\{i}.png",
+                bucketlist_id=one_test_bucketlist.id if i != 3 else None,
+                review_id=one_test_review.id if i == 3 else None,
+                mime_type="image/png",
+            )
+            for i in range(1, 7)
+        ]
+    )
+    await test_session.commit()
+
+    ids, cursor = [], None
+    while True:
+        response = client.get(
+            url=f"/api/image/bucketlist/{one_test_bucketlist.id}",
+            params={"size": 2, **({"cursor": cursor} if cursor else {})},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        ids += [image["id"] for image in response.json()["image_list"]]
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+    assert ids == [1, 2, 4, 5, 6]
+
+    response = client.get(url=f"/api/image/review/{one_test_review.id}")
+    (image,) = response.json()["image_list"]
+    assert image["id"] == 3
+    assert image["mime_type"] == "image/png"
+    assert "variants" not in image
+
+
+# 버킷리스트 / 리뷰 이미지 목록 GET 실패 (없는 버킷리스트 / 리뷰, 잘못된 cursor)
+@pytest.mark.asyncio
+async def test_get_image_list_failure(one_test_bucketlist: BucketList) -> None:
+    response = client.get(url=f"/api/image/bucketlist/{one_test_bucketlist.id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"image_list": [], "next_cursor": None}
+
+    response = client.get(url=f"/api/image/bucketlist/{one_test_bucketlist.id + 1}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "해당 버킷리스트를 찾을 수 없습니다."
+    response = client.get(url="/api/image/review/1")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "해당 리뷰를 찾을 수 없습니다."
+    response = client.get(
+        url=f"/api/image/bucketlist/{one_test_bucketlist.id}",
+        params={"cursor": "!!"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# 같은 이미지를 버킷리스트 / 리뷰에 업로드 (파일 1개를 공유하고, 마지막 참조가 삭제될 때 파일 삭제)
+@pytest.mark.asyncio
+async def test_create_image_deduplicated(
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+    one_test_review: Review,
+) -> None:
+    content = png_bytes(600, 400)
+    path = os.path.join(
+        override_upload_dir, f"{hashlib.sha256(content).hexdigest()}.png"
+    )
+    datas = []
+    for params in (
+        {"bucketlist_id": one_test_bucketlist.id},
+        {"review_id": one_test_review.id},
+    ):
+        if os.path.exists(path):
+            os.utime(path, (0, 0))
+        response = client.post(
+            url="/api/image/create",
+            headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+            params=params,
+            files={"file": ("test_image.png", content, "image/png")},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        datas.append(response.json()["data"])
+    assert datas[0] == datas[1]
+    assert datas[0].endswith(f"{hashlib.sha256(content).hexdigest()}.png")
+    assert os.path.getmtime(path) > 0  # 이미 있는 파일은 수정 시각만 갱신
+
+    variants = [
+        client.get(url=f"/api/image/detail/{image_id}").json()["variants"]
+        for image_id in (1, 2)
+    ]
+    assert [v["data"] for v in variants[0]] == [v["data"] for v in variants[1]]
+    paths = [
+        os.path.join(override_upload_dir, data.split("\\")[-1])
+        for data in [datas[0]] + [v["data"] for v in variants[0]]
+    ]
+
+    response = client.delete(
+        url="/api/image/delete/1",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    image_reaper.join(timeout=5)
+    assert all(os.path.exists(path) for path in paths)
+
+    response = client.delete(
+        url="/api/image/delete/2",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    image_reaper.join(timeout=5)
+    assert not any(os.path.exists(path) for path in paths)
+
+
+# 같은 파일을 참조하는 이미지가 cascade로 함께 삭제될 때도 파일 삭제
+@pytest.mark.asyncio
+async def test_delete_bucketlist_deletes_shared_image_file(
+    override_upload_dir: str,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+    one_test_review: Review,
+) -> None:
+    for params in (
+        {"bucketlist_id": one_test_bucketlist.id},
+        {"review_id": one_test_review.id},
+    ):
+        response = client.post(
+            url="/api/image/create",
+            headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+            params=params,
+            files={"file": ("test_image.jpg", b"shared image data", "image/jpeg")},
+        )
+    path = os.path.join(override_upload_dir, response.json()["data"].split("\\")[-1])
+    assert os.path.exists(path)
+
+    response = client.delete(
+        url=f"/api/bucketlist/delete/{one_test_bucketlist.id}",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    image_reaper.join(timeout=5)
+    assert not os.path.exists(path)
+
+
+# 이미지 삭제 후 rollback 되면 파일을 삭제하지 않음
+@pytest.mark.asyncio
+async def test_delete_image_rollback_keeps_file(
+    override_upload_dir: str,
+    one_test_image: Image,
+    test_session: AsyncSession,
+) -> None:
+    path = os.path.join(override_upload_dir, "one_test_image.jpg")
+    with open(path, "wb") as fp:
+        fp.write(b"image data")
+
+    test_session.expunge_all()
+    db_image = await test_session.get(Image, one_test_image.id)
+    await test_session.delete(db_image)
+    await test_session.flush()
+    assert test_session.sync_session.info["unreferenced_image_files"] == {
+        one_test_image.data
+    }
+    await test_session.rollback()
+    image_reaper.join(timeout=5)
+    assert os.path.exists(path)
+
+    await test_session.delete(await test_session.get(Image, one_test_image.id))
+    await test_session.commit()
+    image_reaper.join(timeout=5)
+    assert not os.path.exists(path)
+
+
+# 파일 삭제 실패 시 다시 시도 (묶어서 삭제)
+@pytest.mark.asyncio
+async def test_image_file_reaper_retries_failed_deletes(
+    monkeypatch, test_session: AsyncSession
+) -> None:
+    monkeypatch.setattr(image_reaper_module, "RETRY_DELAY", 0.01)
+
+    class FlakyStorage(LocalStorage):
+        def __init__(self):
+            self.calls = []
+
+        async def delete_many(self, keys):
+            self.calls.append(sorted(keys))
+            return keys if len(self.calls) == 1 else []
+
+    storage = FlakyStorage()
+    image_reaper.enqueue(storage, ["a.jpg", "b.jpg"], test_session.bind.url)
+    image_reaper.join(timeout=5)
+    assert storage.calls[0] == ["a.jpg", "b.jpg"]
+    assert sorted(sum(storage.calls[1:], [])) == ["a.jpg", "b.jpg"]
+
+
+# 삭제 직전에 다시 확인 (그 사이 다시 참조된 파일은 남기고, 최근에 수정된 파일은 유예 시간 뒤에 삭제)
+@pytest.mark.asyncio
+async def test_image_file_reaper_rechecks_before_delete(
+    monkeypatch,
+    override_upload_dir: str,
+    one_test_image: Image,
+    test_session: AsyncSession,
+) -> None:
+    monkeypatch.setattr(image_reaper, "grace_seconds", 0.2)
+    storage = LocalStorage()
+    for filename in ("one_test_image.jpg", "recent.jpg"):
+        with open(os.path.join(override_upload_dir, filename), "wb") as fp:
+            fp.write(b"image data")
+    before = image_reaper.stats()
+
+    image_reaper.enqueue(
+        storage,
+        [one_test_image.data, storage.url("recent.jpg")],
+        test_session.bind.url,
+    )
+    image_reaper.join(timeout=5)
+    stats = image_reaper.stats()
+    assert os.path.exists(os.path.join(override_upload_dir, "one_test_image.jpg"))
+    assert not os.path.exists(os.path.join(override_upload_dir, "recent.jpg"))
+    assert stats["skipped"] - before["skipped"] == 1
+    assert stats["postponed"] - before["postponed"] >= 1
+    assert stats["deleted"] - before["deleted"] == 1
+
+
+# 변형 이미지 GET 성공 (없으면 요청 시 생성, 원본보다 크게 늘리지 않음)
+@pytest.mark.asyncio
+async def test_get_image_variant_generated_lazily(
+    override_upload_dir: str, one_test_image: Image
+) -> None:
+    with open(os.path.join(override_upload_dir, "one_test_image.jpg"), "wb") as fp:
+        fp.write(png_bytes(300, 600))
+
+    url = f"/api/image/variant/{one_test_image.id}"
+    response = client.get(url=url, params={"size": 1024, "format": "jpeg"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/jpeg"
+    with PILImage.open(io.BytesIO(response.content)) as image:
+        assert image.size == (300, 600)
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = client.get(
+        url=url,
+        params={"size": 1024, "format": "jpeg"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.get(url=f"/api/image/detail/{one_test_image.id}")
+    assert [(v["size"], v["format"]) for v in response.json()["variants"]] == [
+        (1024, "jpeg")
+    ]
+
+
+# 풀이 가득 차서 업로드 직후 생성이 거절되면, 변형 이미지 GET은 503 (Retry-After) 후 다시 요청 시 생성
+@pytest.mark.asyncio
+async def test_get_image_variant_after_pool_rejection(
+    override_upload_dir: str,
+    one_test_image: Image,
+    test_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    with open(os.path.join(override_upload_dir, "one_test_image.jpg"), "wb") as fp:
+        fp.write(png_bytes(300, 600))
+    processor = image_variant.image_processor
+    rejected = processor.stats()["rejected"]
+    monkeypatch.setattr(
+        processor, "in_flight", processor.max_workers + processor.max_queue
+    )
+
+    await image_variant.generate_variants_in_background(
+        test_session.bind, one_test_image.id
+    )
+    url = f"/api/image/variant/{one_test_image.id}"
+    response = client.get(url=url, params={"size": 128})
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert processor.stats()["rejected"] - rejected == 2
+
+    monkeypatch.setattr(processor, "in_flight", 0)  # 풀이 비면 다시 요청 시 생성
+    response = client.get(url=url, params={"size": 128})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/webp"
+    with PILImage.open(io.BytesIO(response.content)) as image:
+        assert image.size == (64, 128)
+
+
+# 작성자의 변형 이미지 생성 요청 (빠진 변형 전체 생성)
+@pytest.mark.asyncio
+async def test_generate_image_variants(
+    override_upload_dir: str, one_test_image: Image, test_login_and_get_token
+) -> None:
+    with open(os.path.join(override_upload_dir, "one_test_image.jpg"), "wb") as fp:
+        fp.write(png_bytes(300, 600))
+
+    url = f"/api/image/variant/{one_test_image.id}/generate"
+    response = client.post(url=url)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post(
+        url=url, headers={"Authorization": f"Bearer {test_login_and_get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["variants"]) == 6
+
+
+# 변형 이미지 GET / 생성 실패 (지원하지 않는 크기 / 이미지가 아닌 파일)
+@pytest.mark.asyncio
+async def test_get_image_variant_wrong_size_or_file(
+    override_upload_dir: str, one_test_image: Image, test_login_and_get_token
+) -> None:
+    response = client.get(
+        url=f"/api/image/variant/{one_test_image.id}", params={"size": 300}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "지원하지 않는 이미지 크기입니다."
+
+    with open(os.path.join(override_upload_dir, "one_test_image.jpg"), "wb") as fp:
+        fp.write(b"image data")
+    response = client.post(
+        url=f"/api/image/variant/{one_test_image.id}/generate",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "이미지 파일을 읽을 수 없습니다."
+
+
 # 이미지 삭제 DELETE 성공
 @pytest.mark.asyncio
 async def test_delete_image(
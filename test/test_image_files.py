@@ -0,0 +1,89 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from domain.image.image_files import ImageFiles
+
+CONTENT = bytes(range(256)) * 4  # 1024 byte
+FILENAME = "0123abcd.jpg"
+
+
+@pytest.fixture
+def files_client(tmp_path) -> TestClient:
+    (tmp_path / FILENAME).write_bytes(CONTENT)
+    app = FastAPI()
+    app.mount("/image_file", ImageFiles(directory=tmp_path), name="image_files")
+    return TestClient(app)
+
+
+# 전체 전송 : immutable 캐시 / strong ETag / Range 지원 표시
+@pytest.mark.asyncio
+async def test_image_files_cache_headers(files_client: TestClient) -> None:
+    response = files_client.get(f"/image_file/{FILENAME}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == CONTENT
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["etag"] == '"0123abcd"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"] == "image/jpeg"
+
+
+# If-None-Match가 일치하면 304 (weak 비교 / 여러 값)
+@pytest.mark.asyncio
+async def test_image_files_not_modified(files_client: TestClient) -> None:
+    for if_none_match in ('"0123abcd"', 'W/"0123abcd"', '"other", "0123abcd"', "*"):
+        response = files_client.get(
+            f"/image_file/{FILENAME}", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == '"0123abcd"'
+
+    response = files_client.get(
+        f"/image_file/{FILENAME}", headers={"If-None-Match": '"other"'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+# Range 요청 : 206 / 416 / If-Range
+@pytest.mark.asyncio
+async def test_image_files_range(files_client: TestClient) -> None:
+    url = f"/image_file/{FILENAME}"
+    for range_header, start, end in (
+        ("bytes=0-99", 0, 99),
+        ("bytes=1000-", 1000, 1023),
+        ("bytes=-24", 1000, 1023),
+        ("bytes=1000-5000", 1000, 1023),
+    ):
+        response = files_client.get(url, headers={"Range": range_header})
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.content == CONTENT[start : end + 1]
+        assert response.headers["content-range"] == f"bytes {start}-{end}/1024"
+        assert response.headers["content-length"] == str(end - start + 1)
+        assert response.headers["content-type"] == "image/jpeg"
+
+    response = files_client.get(url, headers={"Range": "bytes=2000-"})
+    assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers["content-range"] == "bytes */1024"
+
+    # 여러 구간 / If-Range 불일치 -> 전체 전송
+    response = files_client.get(url, headers={"Range": "bytes=0-1,5-6"})
+    assert response.status_code == status.HTTP_200_OK
+    response = files_client.get(
+        url, headers={"Range": "bytes=0-99", "If-Range": '"other"'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == CONTENT
+    response = files_client.get(
+        url, headers={"Range": "bytes=0-99", "If-Range": '"0123abcd"'}
+    )
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+
+
+# 업로드 중인 임시 파일(.part)은 제공하지 않음
+@pytest.mark.asyncio
+async def test_image_files_hide_partial_uploads(
+    files_client: TestClient, tmp_path
+) -> None:
+    (tmp_path / ".0123abcd.part").write_bytes(CONTENT)
+    response = files_client.get("/image_file/.0123abcd.part")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
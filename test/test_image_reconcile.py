@@ -0,0 +1,173 @@
+import os
+import time
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.image import image_storage
+from domain.image.image_reaper import image_reaper
+from domain.image.image_reconcile import reconcile
+from models import BucketList, Image
+
+OLD = time.time() - 2 * 60 * 60
+
+
+def write_file(directory: str, name: str, modified_at: float = OLD) -> None:
+    path = os.path.join(directory, name)
+    with open(path, "wb") as fp:
+        fp.write(name.encode())
+    os.utime(path, (modified_at, modified_at))
+
+
+# 고아 파일 / 파일 없는 행 찾기 (삭제하지 않음)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_upload_dir")  # 빈 저장폴더에서 시작
+async def test_reconcile_report(
+    override_upload_dir: str,
+    test_session: AsyncSession,
+    one_test_bucketlist: BucketList,
+) -> None:
+    storage = image_storage.storage
+    for name in ("a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"):
+        write_file(override_upload_dir, name)
+    write_file(override_upload_dir, "uploading.jpg", modified_at=time.time())
+    for name in ("b.jpg", "d.jpg", "missing.jpg"):
+        test_session.add(
+            Image(data=storage.url(name), bucketlist_id=one_test_bucketlist.id)
+        )
+    await test_session.commit()
+
+    found = []
+    summary = await reconcile(
+        test_session,
+        storage,
+        batch_size=2,
+        report=lambda kind, value: found.append((kind, value)),
+    )
+    assert found == [
+        ("orphan_file", "a.jpg"),
+        ("orphan_file", "c.jpg"),
+        ("orphan_file", "e.jpg"),
+        ("missing_file", storage.url("missing.jpg")),
+    ]
+    assert summary["orphan_file"] == 3
+    assert summary["missing_file"] == 1
+    assert summary["deleted_files"] == summary["deleted_rows"] == 0
+    assert len(os.listdir(override_upload_dir)) == 6
+
+
+# --delete : 고아 파일 / 파일 없는 행 삭제 (최근 파일 / 참조 중인 파일은 유지)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_upload_dir")  # 빈 저장폴더에서 시작
+async def test_reconcile_delete(
+    override_upload_dir: str,
+    test_session: AsyncSession,
+    one_test_bucketlist: BucketList,
+) -> None:
+    storage = image_storage.storage
+    for name in ("a.jpg", "b.jpg", "c.jpg"):
+        write_file(override_upload_dir, name)
+    write_file(override_upload_dir, "uploading.jpg", modified_at=time.time())
+    for name in ("b.jpg", "missing.jpg"):
+        test_session.add(
+            Image(data=storage.url(name), bucketlist_id=one_test_bucketlist.id)
+        )
+    await test_session.commit()
+
+    summary = await reconcile(
+        test_session, storage, delete=True, batch_size=2, max_missing_ratio=0.5
+    )
+    image_reaper.join(timeout=5)
+    assert summary["referenced_url"] == 2
+    assert summary["aborted"] is False
+    assert summary["deleted_files"] == 2
+    assert summary["deleted_rows"] == 1
+    assert sorted(os.listdir(override_upload_dir)) == ["b.jpg", "uploading.jpg"]
+    datas = (await test_session.scalars(select(Image.data))).all()
+    assert datas == [storage.url("b.jpg")]
+
+
+# 저장소 URL 형식이 아닌 행이 있으면 고아 파일은 삭제하지 않음
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_upload_dir")  # 빈 저장폴더에서 시작
+async def test_reconcile_foreign_url_keeps_files(
+    override_upload_dir: str,
+    test_session: AsyncSession,
+    one_test_image: Image,
+) -> None:
+    write_file(override_upload_dir, "a.jpg")
+
+    summary = await reconcile(
+        test_session, image_storage.storage, delete=True, batch_size=2
+    )
+    assert summary["foreign_url"] == 1
+    assert summary["orphan_file"] == 1
+    assert summary["deleted_files"] == 0
+    assert os.listdir(override_upload_dir) == ["a.jpg"]
+
+
+# 저장폴더가 없으면 오류 (모든 행을 파일 없는 행으로 보지 않음)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_upload_dir")
+async def test_reconcile_missing_upload_dir(
+    monkeypatch,
+    test_session: AsyncSession,
+    one_test_bucketlist: BucketList,
+) -> None:
+    monkeypatch.setenv("UPLOAD_DIR", "./image_file_test")
+    storage = image_storage.storage
+    test_session.add(
+        Image(data=storage.url("a.jpg"), bucketlist_id=one_test_bucketlist.id)
+    )
+    await test_session.commit()
+
+    with pytest.raises(FileNotFoundError):
+        await reconcile(test_session, storage, delete=True, force=True)
+    await test_session.rollback()
+    assert len((await test_session.scalars(select(Image))).all()) == 1
+
+
+# 파일 없는 행이 너무 많으면 삭제하지 않음 (빈 저장폴더 / 마운트 안 됨), --force 이면 삭제
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_upload_dir")  # 빈 저장폴더에서 시작
+async def test_reconcile_aborts_when_too_many_missing(
+    override_upload_dir: str,
+    test_session: AsyncSession,
+    one_test_bucketlist: BucketList,
+) -> None:
+    storage = image_storage.storage
+    for name in ("a.jpg", "b.jpg"):
+        test_session.add(
+            Image(data=storage.url(name), bucketlist_id=one_test_bucketlist.id)
+        )
+    await test_session.commit()
+
+    summary = await reconcile(test_session, storage, delete=True)
+    assert summary["missing_file"] == summary["referenced_url"] == 2
+    assert summary["aborted"] is True
+    assert summary["deleted_rows"] == 0
+    assert len((await test_session.scalars(select(Image))).all()) == 2
+
+    summary = await reconcile(test_session, storage, delete=True, force=True)
+    image_reaper.join(timeout=5)
+    assert summary["aborted"] is False
+    assert summary["deleted_rows"] == 2
+    assert (await test_session.scalars(select(Image))).all() == []
+
+
+# S3_PREFIX 없이 버킷 전체를 읽는 경우에는 삭제 거부 (버킷의 다른 데이터를 고아 파일로 지우지 않음)
+@pytest.mark.asyncio
+async def test_reconcile_delete_requires_app_prefix(
+    test_session: AsyncSession,
+) -> None:
+    storage = image_storage.S3Storage(
+        None, bucket="shared", public_url="https://cdn.example.com"
+    )
+    assert storage.is_app_owned() is False
+    with pytest.raises(ValueError):
+        await reconcile(test_session, storage, delete=True)
+
+    storage = image_storage.S3Storage(
+        None, bucket="shared", public_url="https://cdn.example.com", prefix="hojin"
+    )
+    assert storage.is_app_owned() is True
+    assert image_storage.LocalStorage().is_app_owned() is True
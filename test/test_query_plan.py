@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from typing import Sequence
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.bucketlist import bucketlist_crud
+from domain.bucketlist.bucketlist_schema import CountModeEnum
+from domain.image import image_crud
+from domain.user import user_crud
+from domain.user.user_schema import UserSortEnum
+from models import BucketList, Review, Image, User
+
+
+# 실행된 SELECT 문 수집
+@contextmanager
+def capture_selects(db: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+# 수집한 SELECT 문의 실행계획 (SQLite EXPLAIN QUERY PLAN)
+async def query_plans(db: AsyncSession, statements) -> list[tuple[str, str]]:
+    connection = await db.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+        )
+        plans.append((statement, " / ".join(row[-1] for row in result)))
+    return plans
+
+
+# 목록 조회 (created_at 정렬 + 리뷰 selectinload) 실행계획
+# (count=exact 는 count(*) OVER () 때문에 어차피 전체를 읽으므로 count=none 으로 확인)
+@pytest.mark.asyncio
+async def test_bucketlist_list_query_plan_uses_indexes(
+    fifteen_test_bucketlist: Sequence[BucketList],
+    one_test_review: Review,
+    test_session: AsyncSession,
+) -> None:
+    with capture_selects(test_session) as statements:
+        await bucketlist_crud.get_bucketlist_list(
+            test_session,
+            skip=0,
+            limit=10,
+            count=CountModeEnum.none,
+            expand_reviews=True,
+        )
+    plans = await query_plans(test_session, statements)
+
+    list_plan = next(plan for sql, plan in plans if "FROM bucketlist" in sql)
+    assert "USING INDEX ix_bucketlist_created_at" in list_plan
+    review_plan = next(plan for sql, plan in plans if "FROM review" in sql)
+    assert "USING INDEX ix_review_bucketlist_id" in review_plan
+
+
+# 버킷리스트 삭제 (리뷰 / 이미지 cascade) 실행계획
+@pytest.mark.asyncio
+async def test_bucketlist_delete_cascade_query_plan_uses_indexes(
+    one_test_review: Review,
+    one_test_bucketlist: BucketList,
+    test_session: AsyncSession,
+) -> None:
+    test_session.add_all(
+        [
+            Image(
+                data="http://127.0.0.1:8000/image_file\\bucketlist.jpg",
+                bucketlist_id=one_test_bucketlist.id,
+            ),
+            Image(
+                data="http://127.0.0.1:8000/image_file\\review.jpg",
+                review_id=one_test_review.id,
+            ),
+        ]
+    )
+    await test_session.commit()
+    test_session.expunge_all()
+
+    with capture_selects(test_session) as statements:
+        db_bucketlist = await bucketlist_crud.get_bucketlist(
+            test_session, one_test_bucketlist.id
+        )
+        await bucketlist_crud.delete_bucketlist(test_session, db_bucketlist)
+    plans = await query_plans(test_session, statements)
+
+    fk_plans = [
+        plan
+        for sql, plan in plans
+        if "FROM review" in sql or "FROM image" in sql
+        if "WHERE" in sql
+    ]
+    assert fk_plans
+    for plan in fk_plans:
+        assert "SCAN" not in plan, plan
+    joined = " ".join(fk_plans)
+    assert "ix_review_bucketlist_id" in joined
+    assert "ix_image_bucketlist_id" in joined
+    assert "ix_image_review_id" in joined
+
+
+# 회원 목록 (username prefix 검색 + username 정렬) 실행계획
+@pytest.mark.asyncio
+async def test_user_list_prefix_query_plan_uses_index(
+    fifty_test_users: Sequence[User], test_session: AsyncSession
+) -> None:
+    with capture_selects(test_session) as statements:
+        await user_crud.get_user_list(
+            test_session, size=5, prefix="test1", sort=UserSortEnum.username
+        )
+    (plan,) = [plan for _, plan in await query_plans(test_session, statements)]
+
+    assert "SEARCH user USING INDEX" in plan
+    assert "username>? AND username<?" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+# 버킷리스트 이미지 목록 (keyset 페이지네이션) 실행계획
+@pytest.mark.asyncio
+async def test_image_list_query_plan_uses_index(
+    one_test_bucketlist: BucketList, test_session: AsyncSession
+) -> None:
+    with capture_selects(test_session) as statements:
+        await image_crud.get_image_list(
+            test_session,
+            Image.bucketlist_id,
+            one_test_bucketlist.id,
+            size=10,
+            cursor=image_crud.encode_cursor(3),
+        )
+    (plan,) = [plan for _, plan in await query_plans(test_session, statements)]
+
+    assert "USING INDEX ix_image_bucketlist_id" in plan
+    assert "TEMP B-TREE" not in plan
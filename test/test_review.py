@@ -218,3 +218,60 @@ async def test_delete_review_unauthorized(
         headers={"Authorization": f"Bearer wrong{test_login_and_get_token}"},
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# review 일괄 생성 POST / 수정 PUT / 삭제 POST (리뷰 수 / 검색 반영)
+@pytest.mark.asyncio
+async def test_bulk_create_update_delete_review(
+    one_test_bucketlist: BucketList, test_login_and_get_token
+) -> None:
+    headers = {"Authorization": f"Bearer {test_login_and_get_token}"}
+    response = client.post(
+        url="/api/review/bulk/create",
+        headers=headers,
+        json=[
+            {"bucketlist_id": one_test_bucketlist.id, "title": f"bulk_review_{i}"}
+            for i in range(3)
+        ]
+        + [
+            {"bucketlist_id": 9999, "title": "없는 버킷리스트"},
+            {"bucketlist_id": one_test_bucketlist.id, "title": ""},
+        ],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 201, 201, 404, 422]
+    for i, result in enumerate(results[:3]):  # 입력 순서대로 id 반환
+        review = client.get(f"/api/review/detail/{result['id']}").json()
+        assert review["title"] == f"bulk_review_{i}"
+    response = client.get("/api/bucketlist/list")
+    assert response.json()["bucketlist_list"][0]["review_count"] == 3
+
+    response = client.put(
+        url="/api/review/bulk/update",
+        headers=headers,
+        json=[
+            {"review_id": results[0]["id"], "title": "updated", "content": "한라산"},
+            {"review_id": 9999, "title": "없는 리뷰"},
+        ],
+    )
+    assert [result["status"] for result in response.json()["results"]] == [200, 400]
+    response = client.get(f"/api/review/detail/{results[0]['id']}")
+    assert response.json()["content"] == "한라산"
+    response = client.get("/api/bucketlist/list?keyword=한라산")
+    assert response.json()["total"] == 1
+
+    response = client.post(
+        url="/api/review/bulk/delete",
+        headers=headers,
+        json={"ids": [results[0]["id"], results[1]["id"], results[0]["id"]]},
+    )
+    assert [result["status"] for result in response.json()["results"]] == [
+        204,
+        204,
+        400,
+    ]
+    response = client.get("/api/bucketlist/list")
+    assert response.json()["bucketlist_list"][0]["review_count"] == 1
+    response = client.get("/api/bucketlist/list?keyword=한라산")
+    assert response.json()["total"] == 0
@@ -0,0 +1,216 @@
+import io
+import pytest
+from datetime import datetime, timezone
+from fastapi.testclient import TestClient
+from fastapi import status
+from PIL import Image as PILImage
+from domain.image import image_storage
+from domain.image.image_reaper import image_reaper
+from domain.image.image_storage import S3Storage
+from models import BucketList
+from main import app
+
+client = TestClient(app)
+
+
+# 테스트용 S3 (boto3 S3 client에서 저장소가 사용하는 메서드만 구현)
+class FakeClientError(Exception):
+    def __init__(self, code):
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}  # (bucket, key) -> {"Body": bytes, ...}
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise FakeClientError("404")
+        item = self.objects[(Bucket, Key)]
+        return {
+            "ContentLength": len(item["Body"]),
+            "LastModified": item["LastModified"],
+        }
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise FakeClientError("NoSuchKey")
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)]["Body"])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = {
+            "Body": Body,
+            "LastModified": datetime.now(timezone.utc),
+            **kwargs,
+        }
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        with open(Filename, "rb") as fp:
+            self.put_object(Bucket, Key, fp.read(), **(ExtraArgs or {}))
+
+    def copy_object(self, Bucket, Key, CopySource, **kwargs):
+        source = (CopySource["Bucket"], CopySource["Key"])
+        if source not in self.objects:
+            raise FakeClientError("NoSuchKey")
+        self.put_object(Bucket, Key, self.objects[source]["Body"], **kwargs)
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+    def delete_objects(self, Bucket, Delete):
+        for item in Delete["Objects"]:
+            self.delete_object(Bucket, item["Key"])
+        return {}
+
+    def list_objects_v2(self, Bucket, MaxKeys, Prefix="", ContinuationToken=""):
+        keys = sorted(
+            k
+            for b, k in self.objects
+            if b == Bucket and k.startswith(Prefix) and k > ContinuationToken
+        )
+        page = keys[:MaxKeys]
+        response = {
+            "Contents": [
+                {"Key": k, "LastModified": self.objects[(Bucket, k)]["LastModified"]}
+                for k in page
+            ],
+            "IsTruncated": len(keys) > MaxKeys,
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+
+@pytest.fixture
+def s3_storage(monkeypatch) -> S3Storage:
+    storage = S3Storage(
+        FakeS3(), bucket="hojin", public_url="https://cdn.example.com/images/"
+    )
+    monkeypatch.setattr(image_storage, "storage", storage)
+    return storage
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (width, height), (40, 80, 200)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# s3 저장소 : 저장 / 읽기 / 삭제
+@pytest.mark.asyncio
+async def test_s3_storage_with_fake_s3(s3_storage: S3Storage) -> None:
+    assert await s3_storage.exists("a.webp") is False
+    await s3_storage.write("a.webp", b"data")
+
+    assert await s3_storage.exists("a.webp") is True
+    assert await s3_storage.read("a.webp") == b"data"
+    stored = s3_storage.client.objects[("hojin", "a.webp")]
+    assert stored["ContentType"] == "image/webp"
+    assert stored["CacheControl"] == "public, max-age=31536000, immutable"
+    assert s3_storage.url("a.webp") == "https://cdn.example.com/images/a.webp"
+    assert s3_storage.key_from_url(s3_storage.url("a.webp")) == "a.webp"
+
+    await s3_storage.delete("a.webp")
+    with pytest.raises(FileNotFoundError):
+        await s3_storage.read("a.webp")
+
+
+# s3 저장소 : 같은 파일이 이미 있으면 업로드하지 않고 수정 시각만 갱신
+@pytest.mark.asyncio
+async def test_s3_storage_store_file_touches_existing(
+    s3_storage: S3Storage, tmp_path
+) -> None:
+    temp_path = tmp_path / "upload.part"
+    temp_path.write_bytes(b"data")
+    assert await s3_storage.store_file(str(temp_path), "a.jpg") is True
+    old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    s3_storage.client.objects[("hojin", "a.jpg")]["LastModified"] = old
+
+    assert await s3_storage.store_file(str(temp_path), "a.jpg") is False
+    assert await s3_storage.modified_at("a.jpg") > old.timestamp()
+    assert await s3_storage.read("a.jpg") == b"data"
+    assert await s3_storage.modified_at("b.jpg") is None
+
+
+# s3 저장소 : 파일 목록 (페이지를 나눠서 key 순서로)
+@pytest.mark.asyncio
+async def test_s3_storage_list_files(s3_storage: S3Storage) -> None:
+    for key in ("c.jpg", "a.jpg", "e.jpg", "b.jpg", "d.jpg"):
+        await s3_storage.write(key, b"data")
+
+    keys = [stored.key async for stored in s3_storage.list_files(batch_size=2)]
+    assert keys == ["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"]
+
+
+# s3 저장소 : S3_PREFIX 아래의 오브젝트만 사용 (버킷의 다른 데이터는 목록 / 삭제 대상에서 제외)
+@pytest.mark.asyncio
+async def test_s3_storage_prefix() -> None:
+    storage = S3Storage(
+        FakeS3(),
+        bucket="hojin",
+        public_url="https://cdn.example.com/",
+        prefix="/app/images/",
+    )
+    for key in ("backup.tar", "app/other.jpg", "app/imagesX.jpg", "z.jpg"):
+        storage.client.put_object(Bucket="hojin", Key=key, Body=b"other")
+    for key in ("b.jpg", "a.jpg"):
+        await storage.write(key, b"data")
+
+    assert ("hojin", "app/images/a.jpg") in storage.client.objects
+    assert storage.url("a.jpg") == "https://cdn.example.com/app/images/a.jpg"
+    assert storage.key_from_url(storage.url("a.jpg")) == "a.jpg"
+    assert await storage.exists("a.jpg") is True
+    assert await storage.exists("z.jpg") is False
+
+    keys = [stored.key async for stored in storage.list_files(batch_size=1)]
+    assert keys == ["a.jpg", "b.jpg"]
+
+    assert await storage.delete_many(["a.jpg", "b.jpg"]) == []
+    assert sorted(key for _, key in storage.client.objects) == [
+        "app/imagesX.jpg",
+        "app/other.jpg",
+        "backup.tar",
+        "z.jpg",
+    ]
+
+
+# s3 저장소 : 이미지 업로드 -> 변형 이미지 생성 -> 변형 이미지 redirect -> 삭제
+@pytest.mark.asyncio
+async def test_create_image_with_s3_storage(
+    s3_storage: S3Storage,
+    test_login_and_get_token,
+    one_test_bucketlist: BucketList,
+) -> None:
+    response = client.post(
+        url="/api/image/create",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+        params={"bucketlist_id": one_test_bucketlist.id},
+        files={"file": ("test_image.png", png_bytes(800, 400), "image/png")},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()["data"]
+    assert data.startswith("https://cdn.example.com/images/")
+    keys = {key for _, key in s3_storage.client.objects}
+    assert s3_storage.key_from_url(data) in keys
+
+    response = client.get(url="/api/image/detail/1")
+    variants = response.json()["variants"]
+    assert len(variants) == 6
+    assert {s3_storage.key_from_url(v["data"]) for v in variants} <= keys
+
+    response = client.get(
+        url="/api/image/variant/1",
+        params={"size": 128, "format": "webp"},
+        follow_redirects=False,
+    )
+    assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+    assert response.headers["location"].startswith("https://cdn.example.com/images/")
+    assert response.headers["location"].endswith("_128.webp")
+
+    response = client.delete(
+        url="/api/image/delete/1",
+        headers={"Authorization": f"Bearer {test_login_and_get_token}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    image_reaper.join(timeout=5)
+    assert s3_storage.client.objects == {}
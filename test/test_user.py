@@ -1,4 +1,6 @@
 from typing import Sequence
+import json
+import threading
 from sqlalchemy import select
 import pytest
 from fastapi.testclient import TestClient
@@ -7,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import User
 from main import app
+from domain.user import user_crud, user_router
+from domain.user.user_password import PasswordHasher
 from datetime import timedelta, datetime
 from jose import jwt
 from settings import get_access_token_expire_minutes, get_secret_key, get_algorithm
@@ -55,6 +59,84 @@ async def test_read_user_list_with_fifty_users(
     assert response.json()["data"][49]["email"] == fifty_test_users[49].email
 
 
+# 유저 50명 GET 테스트 (cursor 페이지네이션)
+@pytest.mark.asyncio
+async def test_read_user_list_with_cursor(
+    fifty_test_users: Sequence[User],
+) -> None:
+    emails = []
+    cursor = ""
+    for expected_size in [20, 20, 10]:
+        response = client.get(f"/api/user?size=20&cursor={cursor}")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]) == expected_size
+        emails += [user["email"] for user in response.json()["data"]]
+        cursor = response.json()["next_cursor"]
+
+    assert cursor is None  # 마지막 페이지
+    assert emails == [user.email for user in fifty_test_users]
+
+
+# 유저 GET 테스트 (username prefix 검색 / username 정렬)
+@pytest.mark.asyncio
+async def test_read_user_list_with_prefix(
+    fifty_test_users: Sequence[User],
+) -> None:
+    response = client.get("/api/user?prefix=test1&sort=username&size=5")
+    assert [user["username"] for user in response.json()["data"]] == [
+        "test1",
+        "test10",
+        "test11",
+        "test12",
+        "test13",
+    ]
+
+    cursor = response.json()["next_cursor"]
+    response = client.get(f"/api/user?prefix=test1&sort=username&cursor={cursor}")
+    assert len(response.json()["data"]) == 6  # test14 ~ test19
+    assert response.json()["next_cursor"] is None
+
+    response = client.get(
+        "/api/user?prefix=test_"
+    )  # _ 는 LIKE 와일드카드로 처리하지 않음
+    assert response.json()["data"] == []
+
+    # 다른 정렬 기준의 cursor
+    response = client.get(f"/api/user?cursor={cursor}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "잘못된 cursor 값입니다."
+
+
+# username prefix 범위의 상한 (마지막 글자 + 1, U+10FFFF / 서로게이트 처리)
+@pytest.mark.asyncio
+async def test_username_prefix_upper_bound(fifty_test_users: Sequence[User]) -> None:
+    assert user_crud.prefix_upper_bound("test_") == "test`"
+    assert user_crud.prefix_upper_bound("a\U0010ffff") == "b"
+    assert user_crud.prefix_upper_bound("\U0010ffff") is None
+    assert user_crud.prefix_upper_bound("\ud7ff") == "\ue000"
+
+    response = client.get("/api/user", params={"prefix": "test\U0010ffff"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == []
+
+
+# 유저 GET 테스트 (NDJSON 스트리밍)
+@pytest.mark.asyncio
+async def test_read_user_list_stream(
+    fifty_test_users: Sequence[User], monkeypatch
+) -> None:
+    monkeypatch.setattr(user_crud, "STREAM_BATCH_SIZE", 7)
+    response = client.get("/api/user?stream=true")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    users = [json.loads(line) for line in response.text.splitlines()]
+    assert [user["email"] for user in users] == [
+        user.email for user in fifty_test_users
+    ]
+    assert "password" not in users[0]
+
+
 # 회원가입 POST 유저정보 테스트
 @pytest.mark.asyncio
 async def test_user_register_success_adds_to_db(test_session: AsyncSession) -> None:
@@ -131,7 +213,7 @@ async def test_register_user_with_empty_fields(invalid_data: dict[str, str]) ->
     ],
 )
 async def test_register_user_with_passwords_mismatch(
-    invalid_data: dict[str, str]
+    invalid_data: dict[str, str],
 ) -> None:
     response = client.post(
         url="/api/user/create",
@@ -251,3 +333,37 @@ async def test_user_login_failure_password_dismatch(
     )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# 비밀번호 해싱 / 검증은 전용 스레드 풀에서 실행
+@pytest.mark.asyncio
+async def test_password_hasher_runs_in_thread_pool() -> None:
+    password_hasher = PasswordHasher(max_workers=1, max_queue=0)
+    thread_name = await password_hasher.run(lambda: threading.current_thread().name)
+    hashed_password = await password_hasher.hash("password")
+
+    assert thread_name.startswith("password-hash")
+    assert await password_hasher.verify("password", hashed_password)
+    assert not await password_hasher.verify("wrong_password", hashed_password)
+
+
+# 로그인 POST 시, 해싱 대기열이 가득 차면 503
+@pytest.mark.asyncio
+async def test_user_login_password_hasher_busy(
+    one_test_user: User, monkeypatch
+) -> None:
+    password_hasher = PasswordHasher(max_workers=1, max_queue=0)
+    password_hasher.in_flight = 1  # 스레드 1개가 사용 중
+    monkeypatch.setattr(user_router, "password_hasher", password_hasher)
+
+    response = client.post(
+        url="/api/user/login",
+        data={
+            "username": one_test_user.username,
+            "password": "one_test_user",
+        },
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert password_hasher.stats()["rejected"] == 1